@@ -91,6 +91,65 @@ def test_load_txt_fixed():
     np.testing.assert_equal(fa, a)
     assert fa.dtype == a.dtype
 
+    # blank fields are skipped and reading stops after the last value
+    a = np.array([[1.5, -2.0, 3.0], [4.0, 5.0e-3, 6.0]], np.float32)
+    fp = StringIO(
+        dedent(
+            """\
+             1.5      -2.0
+                        3.0
+             4.0    5.0E-3       6.0     99.0
+        INTERNAL 1.0 (FREE) -1
+    """
+        )
+    )
+    fa = Util2d.load_txt(a.shape, fp, a.dtype, "(4F10.0)")
+    np.testing.assert_equal(fa, a)
+    assert fa.dtype == a.dtype
+    assert fp.readline().startswith("INTERNAL")
+
+    fp = StringIO("         1         2\n")
+    try:
+        Util2d.load_txt((3,), fp, np.int32, "(10I10)")
+    except ValueError as e:
+        assert "no data found" in str(e)
+    else:
+        raise AssertionError("load_txt did not detect missing values")
+
+    fp = StringIO("         1       2.5\n")
+    try:
+        Util2d.load_txt((2,), fp, np.int32, "(10I10)")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("load_txt did not detect a bad integer")
+
+
+def test_array2string():
+    a = np.arange(7, dtype=np.int32).reshape((1, 7))
+    s = Util2d.array2string(a.shape, a, "(3I3)")
+    assert s == "  0  1  2\n  3  4  5\n  6\n"
+
+    # the first row ends a line, later lines wrap across rows
+    a = np.arange(6, dtype=np.float32).reshape((2, 3)) / 4.0
+    s = Util2d.array2string(a.shape, a, "(2E10.2)")
+    assert s == (
+        "  0.00E+00  2.50E-01\n  5.00E-01\n"
+        "  7.50E-01\n  1.00E+00  1.25E+00\n"
+    )
+
+    # formats without a printf equivalent are written value by value
+    s = Util2d.array2string(a.shape, a, python_format=[3, "{0:<6.2f}"])
+    assert s == "0.00  0.25  0.50  \n0.75  1.00  1.25  \n"
+
+    a = np.random.default_rng(0).random((7, 23), dtype=np.float32) * 100.0
+    a[3, 4] = -0.0
+    a[5, 6] = 1.0e-30
+    s = Util2d.array2string(a.shape, a, "(10G15.6)")
+    assert len(s.splitlines()) == 18
+    fa = Util2d.load_txt(a.shape, StringIO(s), a.dtype, "(10G15.6)")
+    np.testing.assert_allclose(fa, a, rtol=1e-6)
+
 
 def test_load_block():
     a = np.ones((2, 5), dtype=np.int32) * 4
@@ -921,6 +980,8 @@ def test_mflist_fromfile():
 
 
 if __name__ == "__main__":
+    # test_load_txt_fixed()
+    # test_array2string()
     # test_util3d_reset()
     # test_mflist()
     test_mflist_fromfile()
@@ -336,6 +336,63 @@ def test_sfr_renumbering():
     assert isequal(sfr.reach_data.slope[-1], default_slope)
 
 
+def test_sfr_routing():
+    # long chain of segments numbered in the upstream direction
+    nss = 2000
+    r = create_empty_recarray(nss, np.dtype([("iseg", int), ("ireach", int)]))
+    r["iseg"] = np.arange(1, nss + 1)
+    r["ireach"] = 1
+    d = create_empty_recarray(nss, np.dtype([("nseg", int), ("outseg", int)]))
+    d["nseg"] = np.arange(1, nss + 1)
+    d["outseg"] = np.arange(0, nss)
+    m = flopy.modflow.Modflow()
+    sfr = flopy.modflow.ModflowSfr2(m, reach_data=r, segment_data={0: d})
+
+    # paths are found without recursion
+    assert sfr.paths[nss] == list(range(nss, -1, -1))
+    assert flopy.modflow.mfsfr2.find_path(sfr.graph, nss) == sfr.paths[nss]
+    sfr.get_outlets()
+    assert set(sfr.outlets[0].values()) == {1}
+    upsegs = sfr.get_upsegs()[0]
+    assert sorted(upsegs[1]) == list(range(2, nss + 1))
+    assert sorted(upsegs[nss - 1]) == [nss]
+
+    chk = sfr.check()
+    assert "circular routing" in chk.passed
+    assert "segment numbering order" in chk.warnings
+    renumbered = sfr.renumber_segments()
+    assert renumbered[1] == nss
+    assert renumbered[nss] == 1
+    assert np.array_equal(
+        sfr.segment_data[0].outseg[:-1], np.arange(2, nss + 1)
+    )
+    assert sfr.paths[1] == list(range(1, nss + 1)) + [0]
+
+    # paths are updated when the routing is changed
+    sfr.segment_data[0]["outseg"][-1] = 1
+    assert sfr.paths[1] is None
+    chk = sfr.check()
+    assert "circular routing" in chk.errors
+
+    # branched network
+    r = create_empty_recarray(6, np.dtype([("iseg", int), ("ireach", int)]))
+    r["iseg"] = np.arange(1, 7)
+    r["ireach"] = 1
+    d = create_empty_recarray(6, np.dtype([("nseg", int), ("outseg", int)]))
+    d["nseg"] = np.arange(1, 7)
+    d["outseg"] = [0, 1, 1, 2, 0, 5]
+    sfr = flopy.modflow.ModflowSfr2(m, reach_data=r, segment_data={0: d})
+    sfr.get_outlets()
+    paths = [flopy.modflow.mfsfr2.find_path(sfr.graph, s) for s in d["nseg"]]
+    outsegs = np.zeros((6, 4), dtype=int)
+    for i, path in enumerate(paths):
+        assert sfr.paths[i + 1] == path
+        outsegs[i, : len(path)] = path
+    outsegs.sort(axis=0)
+    assert np.array_equal(sfr.outsegs[0], outsegs)
+    assert sfr.outlets[0] == {1: 1, 2: 1, 3: 1, 4: 1, 5: 5, 6: 5}
+
+
 def test_const():
 
     fm = flopy.modflow
@@ -802,6 +859,7 @@ if __name__ == "__main__":
     # test_ds_6d_6e_disordered()
     # test_disordered_reachdata_fields()
     # test_sfr_renumbering()
+    # test_sfr_routing()
     # test_example()
     test_sfr_plot()
     test_export()
@@ -3,6 +3,8 @@ Some basic tests for SFR checker (not super rigorous)
 need to add a test case that has elevation input by reach
 """
 
+import contextlib
+import io
 import os
 import flopy
 from flopy.modflow.mfsfr2 import check
@@ -116,6 +118,54 @@ def test_sfrcheck():
     assert True
 
 
+def test_sfrcheck_timings():
+    m = flopy.modflow.Modflow.load("test1tr.nam", model_ws=path, verbose=False)
+    m.model_ws = cpth
+    chk = m.sfr.check(level=0, verbose=False)
+    assert list(chk.timings.keys()) == [
+        "for_nans",
+        "numbering",
+        "routing",
+        "overlapping_conductance",
+        "elevations",
+        "slope",
+    ]
+    assert min(chk.timings.values()) >= 0.0
+    report = chk.timing_report()
+    for name in chk.timings.keys():
+        assert name in report
+    assert "total" in report
+
+    # timings are only reported when asked for
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        m.sfr.check(level=0, verbose=True)
+    assert "timings" not in out.getvalue()
+
+    # two of three reaches share a cell
+    m = flopy.modflow.Modflow()
+    flopy.modflow.ModflowDis(m, nrow=2, ncol=2)
+    rd = flopy.modflow.ModflowSfr2.get_empty_reach_data(3)
+    rd["i"] = [0, 1, 0]
+    rd["j"] = [0, 1, 0]
+    rd["iseg"] = 1
+    rd["ireach"] = [1, 2, 3]
+    rd["rchlen"] = 1.0
+    rd["strthick"] = 1.0
+    rd["strhc1"] = [1.0, 1.0, 1.0]
+    sd = flopy.modflow.ModflowSfr2.get_empty_segment_data(1)
+    sd["nseg"] = 1
+    sd["width1"] = sd["width2"] = 1.0
+    sfr = flopy.modflow.ModflowSfr2(m, reach_data=rd, segment_data={0: sd})
+    chk = check(sfr, verbose=False)
+    chk.overlapping_conductance()
+    assert "overlapping conductance" in chk.warnings
+    sfr.reach_data["strhc1"][2] = 0.0
+    chk = check(sfr, verbose=False)
+    chk.overlapping_conductance()
+    assert "overlapping conductance" in chk.passed
+
+
 def test_sfrloadcheck():
     for i, case in sfr_items.items():
         yield load_check_sfr, i, case["mfnam"], path, cpth
@@ -150,6 +200,7 @@ def test_isfropt_icalc():
 
 if __name__ == "__main__":
     test_sfrcheck()
+    test_sfrcheck_timings()
     for i, case in sfr_items.items():
         load_check_sfr(i, case["mfnam"], path, cpth)
 
@@ -109,6 +109,200 @@ def test_binaryfile_read_context():
     assert str(e.exception) == "seek of closed file", str(e.exception)
 
 
+def test_binaryfile_read_memmap():
+    hds_path = os.path.join("..", "examples", "data", "mp6", "EXAMPLE.HED")
+    h = flopy.utils.HeadFile(hds_path)
+    hm = flopy.utils.HeadFile(hds_path, memmap=True)
+
+    for kstpkper in h.get_kstpkper():
+        h0 = h.get_data(kstpkper=kstpkper)
+        h1 = hm.get_data(kstpkper=kstpkper)
+        assert np.array_equal(h0, h1), (
+            "memory-mapped head read != head read for kstpkper " f"{kstpkper}"
+        )
+        # data are returned as a read-only view into the memory map
+        assert not h1.flags.owndata and not h1.flags.writeable
+
+    assert np.array_equal(
+        h.get_alldata(), hm.get_alldata(), equal_nan=True
+    ), "memory-mapped get_alldata() != get_alldata()"
+    assert np.array_equal(
+        h.get_alldata(mflay=2), hm.get_alldata(mflay=2), equal_nan=True
+    ), "memory-mapped get_alldata(mflay=2) != get_alldata(mflay=2)"
+    data = hm.get_alldata(nodata=None)
+    assert data.shape == (12, 5, 25, 25), data.shape
+    assert not data.flags.owndata
+    h.close()
+    hm.close()
+
+    # mt3d concentration file
+    ucn_path = os.path.join(
+        "..", "examples", "data", "mt3d_test", "mf2kmt3d", "tob", "MT3D001.UCN"
+    )
+    with flopy.utils.UcnFile(ucn_path) as u:
+        c0 = u.get_alldata()
+    with flopy.utils.UcnFile(ucn_path, memmap=True) as u:
+        c1 = u.get_alldata()
+    assert np.array_equal(c0, c1, equal_nan=True)
+
+
+def test_binaryfile_get_ts_multicell():
+    hds_path = os.path.join("..", "examples", "data", "mp6", "EXAMPLE.HED")
+    idx = [(0, 0, 0), (4, 24, 24), (2, 10, 3), (0, 12, 7), (2, 10, 3)]
+    for memmap in (False, True):
+        with flopy.utils.HeadFile(hds_path, memmap=memmap) as h:
+            data = h.get_alldata(nodata=None)
+            ts = h.get_ts(idx)
+            assert ts.shape == (len(h.get_times()), len(idx) + 1)
+            assert np.allclose(ts[:, 0], h.get_times())
+            for istat, (k, i, j) in enumerate(idx, start=1):
+                assert np.array_equal(ts[:, istat], data[:, k, i, j]), (
+                    f"time series for cell {(k, i, j)} does not match "
+                    f"get_alldata() (memmap={memmap})"
+                )
+            ts = h.get_ts(idx[1])
+            assert np.array_equal(ts[:, 1], data[:, 4, 24, 24])
+
+
+def test_binaryfile_get_ts_sparse():
+    # cells that are far apart in a layer are read separately
+    nrow, ncol = 80, 80
+    rng = np.random.default_rng(17)
+    data = rng.random((3, nrow, ncol)).astype(np.float32)
+    pth = os.path.join(cpth, "sparse.hds")
+    with open(pth, "wb") as f:
+        for i, a in enumerate(data):
+            header = flopy.utils.BinaryHeader.create(
+                bintype="head",
+                precision="single",
+                text="head",
+                nrow=nrow,
+                ncol=ncol,
+                ilay=1,
+                pertim=i + 1.0,
+                totim=i + 1.0,
+                kstp=1,
+                kper=i + 1,
+            )
+            header.tofile(f)
+            a.tofile(f)
+
+    idx = [(0, 79, 79), (0, 0, 0), (0, 40, 2), (0, 0, 1), (0, 79, 79)]
+    for memmap in (False, True):
+        with flopy.utils.HeadFile(pth, memmap=memmap) as h:
+            ts = h.get_ts(idx)
+            assert np.allclose(ts[:, 0], [1.0, 2.0, 3.0])
+            for istat, (k, i, j) in enumerate(idx, start=1):
+                assert np.array_equal(ts[:, istat], data[:, i, j]), (
+                    f"time series for cell {(k, i, j)} does not match "
+                    f"data written (memmap={memmap})"
+                )
+
+
+def test_binaryfile_iter_records():
+    hds_path = os.path.join("..", "examples", "data", "mp6", "EXAMPLE.HED")
+    with flopy.utils.HeadFile(hds_path) as h:
+        data = h.get_alldata()
+        blocks = list(h.iter_records(chunk=5))
+        assert [b[2].shape[0] for b in blocks] == [5, 5, 2]
+        kstpkper = [kk for b in blocks for kk in b[0]]
+        assert kstpkper == h.get_kstpkper()
+        totim = np.concatenate([b[1] for b in blocks])
+        assert np.allclose(totim, h.get_times())
+        assert np.array_equal(
+            np.concatenate([b[2] for b in blocks]), data, equal_nan=True
+        )
+        blocks = list(h.iter_records(chunk=100, mflay=2))
+        assert len(blocks) == 1
+        assert np.array_equal(blocks[0][2], data[:, 2], equal_nan=True)
+
+
+def test_binaryfile_index_cache():
+    fpths = [
+        (
+            os.path.join("..", "examples", "data", "mp6", "EXAMPLE.HED"),
+            flopy.utils.HeadFile,
+        ),
+        (
+            os.path.join(
+                "..", "examples", "data", "mf6-freyberg", "freyberg.cbc"
+            ),
+            flopy.utils.CellBudgetFile,
+        ),
+    ]
+    for src, cls in fpths:
+        fpth = os.path.join(cpth, os.path.basename(src))
+        shutil.copyfile(src, fpth)
+        idxpth = f"{fpth}.flopyidx"
+        if os.path.isfile(idxpth):
+            os.remove(idxpth)
+
+        with cls(fpth) as f:
+            recordarray, iposarray = f.recordarray, f.iposarray
+            times, kstpkper = f.get_times(), f.get_kstpkper()
+
+        # the first open writes the index cache, the second one reads it
+        for _ in range(2):
+            with cls(fpth, index_cache=True) as f:
+                assert os.path.isfile(idxpth), f"{idxpth} was not written"
+                assert np.array_equal(f.recordarray, recordarray)
+                assert np.array_equal(f.iposarray, iposarray)
+                assert f.get_times() == times
+                assert f.get_kstpkper() == kstpkper
+                assert f._read_index(), "index cache was not reused"
+
+        # the index cache is not used if the file changes
+        os.utime(fpth, ns=(0, 0))
+        with cls(fpth) as f:
+            assert not f._read_index(), "stale index cache was reused"
+
+
+def test_binaryfile_refresh():
+    fpths = [
+        (
+            os.path.join("..", "examples", "data", "mp6", "EXAMPLE.HED"),
+            flopy.utils.HeadFile,
+            {},
+        ),
+        (
+            os.path.join(
+                "..", "examples", "data", "mf6-freyberg", "freyberg.cbc"
+            ),
+            flopy.utils.CellBudgetFile,
+            {"precision": "double"},
+        ),
+    ]
+    for src, cls, kwargs in fpths:
+        with cls(src, **kwargs) as f:
+            recordarray, iposarray = f.recordarray, f.iposarray
+            times = f.get_times()
+        with open(src, "rb") as f:
+            data = f.read()
+
+        # write the file in pieces that end in the middle of a record,
+        # as a running simulation does
+        fpth = os.path.join(cpth, f"refresh_{os.path.basename(src)}")
+        nbytes = int(iposarray[2]) + 10
+        with open(fpth, "wb") as fout:
+            fout.write(data[:nbytes])
+            fout.flush()
+            f = cls(fpth, **kwargs)
+            assert len(f.recordarray) == 2, len(f.recordarray)
+            assert f.totalbytes <= nbytes
+            assert f.refresh() == 0
+            fout.write(data[nbytes:-5])
+            fout.flush()
+            nrecords = f.refresh()
+            assert nrecords == len(recordarray) - 3, nrecords
+            fout.write(data[-5:])
+            fout.flush()
+            assert f.refresh() == 1
+        assert np.array_equal(f.recordarray, recordarray)
+        assert np.array_equal(f.iposarray, iposarray)
+        assert f.get_times() == times
+        f.close()
+
+
 def test_cellbudgetfile_read_context():
     cbc_path = os.path.join(
         "..", "examples", "data", "mf2005_test", "mnw1.gitcbc"
@@ -326,6 +520,251 @@ def test_cellbudgetfile_readrecord_waux():
     return
 
 
+def test_cellbudgetfile_build_index():
+
+    cbc_fname = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    assert v.get_nrecords() == v.nrecords == 270, v.get_nrecords()
+    assert len(v.iposheader) == len(v.iposarray) == v.nrecords
+    assert np.all(v.iposarray > v.iposheader)
+    assert (v.nlay, v.nrow, v.ncol, v.nper) == (1, 15, 10, 2)
+
+    # unique values are stored in the order they occur in the file
+    assert len(v.get_times()) == 30 and np.all(np.diff(v.get_times()) > 0)
+    assert v.get_kstpkper()[:3] == [(0, 0), (4, 0), (9, 0)]
+    assert [t.decode().strip() for t in v.textlist] == [
+        "STORAGE",
+        "CONSTANT HEAD",
+        "FLOW RIGHT FACE",
+        "FLOW FRONT FACE",
+        "WELLS",
+        "ET",
+        "HEAD DEP BOUNDS",
+        "RECHARGE",
+        "STREAM LEAKAGE",
+    ]
+    assert v.imethlist == [1, 2, 1, 1, 5, 4, 5, 4, 5], v.imethlist
+
+    # header to position mapping
+    for header, ipos in zip(v.recordarray, v.iposarray):
+        assert v.recorddict[tuple(header)] == ipos
+    v.close()
+    return
+
+
+def test_cellbudgetfile_get_ts():
+
+    cbc_fname = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+
+    # cells with and without well and stream leakage entries
+    idx = [(0, i, j) for i in range(0, 15, 2) for j in range(10)]
+    texts = ["STORAGE", "WELLS", "STREAM LEAKAGE", "RECHARGE"]
+    ts = v.get_ts(idx, text=texts)
+    assert isinstance(ts, dict), "get_ts() with a list of text must be a dict"
+    for text in texts:
+        ts1 = v.get_ts(idx, text=text)
+        assert np.array_equal(ts[text], ts1, equal_nan=True)
+        assert ts1.shape == (len(v.get_kstpkper()), len(idx) + 1)
+        for itim, kstpkper in enumerate(v.get_kstpkper()):
+            data = v.get_data(kstpkper=kstpkper, text=text, full3D=True)[0]
+            if data.ndim == 2:
+                data = data.reshape((1,) + data.shape)
+            data = np.ma.filled(data.astype(np.float64), np.nan)
+            expected = np.array([data[k, i, j] for k, i, j in idx])
+            assert np.allclose(
+                ts1[itim, 1:], expected, equal_nan=True
+            ), f"{text} time series does not match get_data()"
+    v.close()
+    return
+
+
+def test_cellbudgetfile_iter_records():
+    cbc_fname = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    with flopy.utils.CellBudgetFile(cbc_fname) as v:
+        text = "FLOW RIGHT FACE"
+        blocks = list(v.iter_records(text=text, chunk=4))
+        assert all(isinstance(b[2], np.ndarray) for b in blocks)
+        assert [kk for b in blocks for kk in b[0]] == v.get_kstpkper()
+        data = np.concatenate([b[2] for b in blocks])
+        assert np.array_equal(data, np.array(v.get_data(text=text)))
+
+        # list-style records are returned as lists unless full3D is set
+        for kstpkper, totim, q in v.iter_records(text="WELLS", chunk=3):
+            assert isinstance(q, list) and len(q) == len(kstpkper)
+        for kstpkper, totim, q in v.iter_records(
+            text="WELLS", chunk=3, full3D=True
+        ):
+            assert isinstance(q, np.ma.MaskedArray)
+            assert q.shape == (len(kstpkper), 1, 15, 10)
+            for kk, qk in zip(kstpkper, q):
+                expected = v.get_data(kstpkper=kk, text="WELLS", full3D=True)
+                assert np.ma.allequal(qk, expected[0])
+
+
+def test_ensemblefile():
+    fpths = [
+        (
+            os.path.join("..", "examples", "data", "mp6", "EXAMPLE.HED"),
+            os.path.join(
+                "..", "examples", "data", "freyberg", "freyberg.githds"
+            ),
+            flopy.utils.HeadFile,
+        ),
+        (
+            os.path.join(
+                "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+            ),
+            os.path.join(
+                "..", "examples", "data", "mf2005_test", "mnw1.gitcbc"
+            ),
+            flopy.utils.CellBudgetFile,
+        ),
+    ]
+    for src, other, cls in fpths:
+        fnames = []
+        for ireal in range(3):
+            fpth = os.path.join(cpth, f"real{ireal}_{os.path.basename(src)}")
+            shutil.copyfile(src, fpth)
+            fnames.append(fpth)
+
+        # the index of the first file is reused for the other files
+        with cls(fnames[0]) as ref, cls(fnames[1], index_from=ref) as f:
+            assert f.recordarray is ref.recordarray
+            assert f.get_times() == ref.get_times()
+        # but not for a file with a different record layout
+        with cls(fnames[0]) as ref, cls(other, index_from=ref) as f:
+            with cls(other) as expected:
+                assert np.array_equal(f.recordarray, expected.recordarray)
+
+        kwargs = {}
+        if cls is flopy.utils.CellBudgetFile:
+            kwargs["text"] = "STORAGE"
+        idx = [(0, 1, 1), (0, 10, 8)]
+        with cls(src) as f:
+            ts = f.get_ts(idx, **kwargs)
+        for max_workers, multiprocess in ((1, False), (2, False), (2, True)):
+            ens = flopy.utils.EnsembleFile(
+                fnames,
+                filetype=cls,
+                max_workers=max_workers,
+                multiprocess=multiprocess,
+            )
+            assert ens.nreal == 3
+            ensts = ens.get_ts(idx, **kwargs)
+            assert ensts.shape == (3,) + ts.shape
+            for ireal in range(3):
+                assert np.array_equal(ensts[ireal], ts)
+
+    ens = flopy.utils.EnsembleFile(fnames, filetype=cls, share_index=False)
+    data = ens.get_data(text="FLOW RIGHT FACE")
+    assert data.shape == (3, len(ens.get_kstpkper()), 1, 15, 10)
+
+
+def test_index_from_mismatch():
+    # head files that differ only in the time of the middle record
+    fnames = []
+    for name, times in (("a", [1.0, 2.0, 3.0]), ("b", [1.0, 2.5, 3.0])):
+        fpth = os.path.join(cpth, f"index_from_{name}.hds")
+        with open(fpth, "wb") as f:
+            for kstp, totim in enumerate(times):
+                header = flopy.utils.BinaryHeader.create(
+                    bintype="head",
+                    precision="single",
+                    text="head",
+                    nrow=2,
+                    ncol=3,
+                    ilay=1,
+                    pertim=totim,
+                    totim=totim,
+                    kstp=kstp + 1,
+                    kper=1,
+                )
+                header.tofile(f)
+                np.full((2, 3), totim, dtype=np.float32).tofile(f)
+        fnames.append(fpth)
+    with flopy.utils.HeadFile(fnames[0]) as a:
+        with flopy.utils.HeadFile(fnames[1], index_from=a) as b:
+            assert b.recordarray is not a.recordarray
+            assert b.get_times() == [1.0, 2.5, 3.0]
+            assert np.all(b.get_data(totim=2.5) == 2.5)
+
+    # budget files with a longer list record in the middle
+    h1 = np.dtype(
+        [
+            ("kstp", "i4"),
+            ("kper", "i4"),
+            ("text", "S16"),
+            ("ncol", "i4"),
+            ("nrow", "i4"),
+            ("nlay", "i4"),
+            ("imeth", "i4"),
+            ("delt", "f4"),
+            ("pertim", "f4"),
+            ("totim", "f4"),
+        ]
+    )
+    rec = np.dtype([("node", "i4"), ("q", "f4")])
+    fnames = []
+    for name, nlists in (("a", [2, 2, 2]), ("b", [2, 3, 2])):
+        fpth = os.path.join(cpth, f"index_from_{name}.cbc")
+        with open(fpth, "wb") as f:
+            for kstp, nlist in enumerate(nlists):
+                totim = float(kstp + 1)
+                header = (kstp + 1, 1, "WELLS", 3, 2, -1, 2, 1.0)
+                np.array([header + (totim, totim)], dtype=h1).tofile(f)
+                np.array([nlist], dtype=np.int32).tofile(f)
+                data = np.zeros(nlist, dtype=rec)
+                data["node"] = np.arange(nlist) + 1
+                data["q"] = totim
+                data.tofile(f)
+        fnames.append(fpth)
+    with flopy.utils.CellBudgetFile(fnames[0]) as a:
+        with flopy.utils.CellBudgetFile(fnames[1], index_from=a) as b:
+            with flopy.utils.CellBudgetFile(fnames[1]) as expected:
+                assert np.array_equal(b.iposarray, expected.iposarray)
+                for q, qe in zip(
+                    b.get_data(text="WELLS"), expected.get_data(text="WELLS")
+                ):
+                    assert np.array_equal(q, qe)
+            assert len(b.get_data(text="WELLS", totim=3.0)[0]) == 2
+
+    # budget files with a different package name in one imeth 6 record
+    cbc_path = os.path.join(
+        "..",
+        "examples",
+        "data",
+        "mf6",
+        "create_tests",
+        "test028_sfr",
+        "expected_output",
+        "test1tr.cbc",
+    )
+    fpth = os.path.join(cpth, "index_from_names.cbc")
+    shutil.copy(cbc_path, fpth)
+    with flopy.utils.CellBudgetFile(cbc_path, precision="double") as a:
+        with flopy.utils.CellBudgetFile(
+            fpth, precision="double", index_from=a
+        ) as b:
+            assert b.recordarray is a.recordarray
+        irec = np.flatnonzero(a.recordarray["imeth"] == 6)[-1]
+        ipos = a.iposheader[irec] + a.header_dtype.fields["paknam2"][1]
+        with open(fpth, "r+b") as f:
+            f.seek(ipos)
+            f.write(b"CHANGED".ljust(16))
+        with flopy.utils.CellBudgetFile(
+            fpth, precision="double", index_from=a
+        ) as b:
+            assert b.recordarray is not a.recordarray
+            assert b.recordarray["paknam2"][irec] == b"CHANGED".ljust(16)
+
+
 def test_binaryfile_writeread():
 
     pth = os.path.join("..", "examples", "data", "nwt_test")
@@ -405,6 +844,17 @@ if __name__ == "__main__":
     test_binaryfile_writeread()
     test_formattedfile_read()
     test_binaryfile_read()
+    test_binaryfile_read_memmap()
+    test_binaryfile_get_ts_multicell()
+    test_binaryfile_get_ts_sparse()
+    test_binaryfile_iter_records()
+    test_binaryfile_index_cache()
+    test_binaryfile_refresh()
     test_cellbudgetfile_read()
     test_cellbudgetfile_readrecord()
     test_cellbudgetfile_readrecord_waux()
+    test_cellbudgetfile_build_index()
+    test_cellbudgetfile_get_ts()
+    test_cellbudgetfile_iter_records()
+    test_ensemblefile()
+    test_index_from_mismatch()
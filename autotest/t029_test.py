@@ -315,6 +315,65 @@ def test_flowja_residuals():
     return
 
 
+def test_faceflows_vectorized():
+    grb_file = os.path.join(flowpth, "freyberg.dis.grb")
+    cbc = flopy.utils.CellBudgetFile(
+        os.path.join(flowpth, "freyberg.cbc"), precision="double"
+    )
+    flowja = cbc.get_data(text="FLOW-JA-FACE")[0]
+    frf, fff, flf = flopy.mf6.utils.get_structured_faceflows(
+        flowja, grb_file=grb_file
+    )
+
+    # brute force face flows from each upper connection
+    grb = flopy.mf6.utils.MfGrdFile(grb_file)
+    flowja = flowja.ravel()
+    shape = grb.shape
+    ref = [np.zeros(shape), np.zeros(shape), np.zeros(shape)]
+    for n in range(grb.nodes):
+        k, i, j = np.unravel_index(n, shape)
+        for pos in range(grb.ia[n] + 1, grb.ia[n + 1]):
+            m = grb.ja[pos]
+            km, im, jm = np.unravel_index(m, shape)
+            if (km, im, jm) == (k, i, j + 1):
+                ref[0][k, i, j] = -flowja[pos]
+            elif (km, im, jm) == (k, i + 1, j):
+                ref[1][k, i, j] = -flowja[pos]
+            elif km > k and (im, jm) == (i, j):
+                ref[2][k, i, j] = -flowja[pos]
+    for v, v0 in zip((frf, fff, flf), ref):
+        assert np.allclose(v, v0), "vectorized face flows are not correct"
+
+    # a single record of any shape and the ia and ja arrays
+    for v in (
+        flopy.mf6.utils.get_structured_faceflows(
+            flowja.reshape(1, -1), grb_file=grb
+        ),
+        flopy.mf6.utils.get_structured_faceflows(
+            flowja, ia=grb.ia, ja=grb.ja, shape=shape
+        ),
+    ):
+        for v1, v0 in zip(v, ref):
+            assert v1.shape == shape
+            assert np.allclose(v1, v0)
+
+    # stacked flowja arrays and the streaming generator
+    records = cbc.get_data(text="FLOW-JA-FACE")
+    stacked = flopy.mf6.utils.get_structured_faceflows(
+        np.stack(records + records), grb_file=grb
+    )
+    assert stacked[0].shape == (2 * len(records),) + shape
+    blocks = list(
+        flopy.mf6.utils.iter_structured_faceflows(cbc, grb_file, chunk=2)
+    )
+    assert len(blocks) == len(cbc.get_kstpkper())
+    for idx, v in enumerate(blocks[0][2:]):
+        assert np.allclose(v[0], stacked[idx][0])
+        assert np.allclose(v[0], ref[idx])
+
+    return
+
+
 @raises(ValueError)
 def test_faceflows_empty():
     flowja = np.zeros(10, dtype=np.float64)
@@ -343,6 +402,14 @@ def test_faceflows_flowja_size():
     _v = flopy.mf6.utils.get_structured_faceflows(flowja, ia=ia, ja=ja)
 
 
+@raises(ValueError)
+def test_faceflows_shape():
+    flowja = np.zeros(5, dtype=np.float64)
+    ia = np.array([0, 3, 5], dtype=np.int32)
+    ja = np.array([0, 1, 1, 1, 0], dtype=np.int32)
+    _v = flopy.mf6.utils.get_structured_faceflows(flowja, ia=ia, ja=ja)
+
+
 @raises(ValueError)
 def test_residuals_jaempty():
     flowja = np.zeros(10, dtype=np.float64)
@@ -366,3 +433,4 @@ if __name__ == "__main__":
     # test_mfgrddisu_modelgrid()
     test_faceflows()
     test_flowja_residuals()
+    test_faceflows_vectorized()
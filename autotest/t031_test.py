@@ -307,7 +307,83 @@ def test_loadtxt():
     # epd = EndpointFile(epfilewithnans)
 
 
+def test_particle_index():
+    # records are sorted once at load and sliced for each particle id
+    pthobj = PathlineFile(os.path.join(path, "EXAMPLE-3.pathline"))
+    ra = pthobj._data
+    assert np.all(np.diff(ra["particleid"]) >= 0)
+    assert np.array_equal(pthobj.nid, np.unique(ra["particleid"]))
+
+    names = ["x", "y", "z", "time", "k", "particleid"]
+    totim = pthobj.get_maxtime() / 2.0
+    plist = pthobj.get_alldata()
+    plist_ge = pthobj.get_alldata(totim=totim)
+    assert len(plist) == pthobj.nid.size
+    for partid in pthobj.nid:
+        expected = ra[ra["particleid"] == partid][names]
+        assert np.array_equal(pthobj.get_data(partid), expected)
+        assert np.array_equal(plist[partid], expected)
+        expected = expected[expected["time"] >= totim]
+        assert np.array_equal(pthobj.get_data(partid, totim=totim), expected)
+        assert np.array_equal(plist_ge[partid], expected)
+        expected = ra[ra["particleid"] == partid][names]
+        expected = expected[expected["time"] <= totim]
+        assert np.array_equal(
+            pthobj.get_data(partid, totim=totim, ge=False), expected
+        )
+
+    # particle ids that are not in the file return no records
+    assert pthobj.get_data(pthobj.nid.max() + 1).size == 0
+    return
+
+
+def test_pathline_cache():
+    # data read through a columnar cache match data loaded into memory
+    cache_dir = os.path.join(path, "cache")
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
+    pthfile = os.path.join(path, "EXAMPLE-3.pathline")
+    pthobj = PathlineFile(pthfile)
+    for _ in range(2):
+        cacheobj = PathlineFile(pthfile, cache_dir=cache_dir)
+        assert cacheobj._records is None
+        assert np.array_equal(cacheobj.nid, pthobj.nid)
+        assert cacheobj.get_maxid() == pthobj.get_maxid()
+        assert cacheobj.get_maxtime() == pthobj.get_maxtime()
+        for partid in (0, 5, pthobj.nid.max()):
+            assert np.array_equal(
+                cacheobj.get_data(partid), pthobj.get_data(partid)
+            )
+        dest_cells = [(0, 10, 10), (2, 5, 5)]
+        assert np.array_equal(
+            cacheobj.get_destination_pathline_data(dest_cells, True),
+            pthobj.get_destination_pathline_data(dest_cells, True),
+        )
+        assert np.array_equal(cacheobj._data, pthobj._data)
+    assert os.path.isfile(os.path.join(cache_dir, "EXAMPLE-3.pathline.x.npy"))
+
+    # filters match a selection of all of the data
+    ra = pthobj._data
+    tmin, tmax = 100.0, 5000.0
+    idx = (ra["time"] >= tmin) & (ra["time"] <= tmax)
+    ra = ra[idx]
+    cacheobj = PathlineFile(pthfile, cache_dir=cache_dir)
+    assert np.array_equal(cacheobj.select_data(tmin=tmin, tmax=tmax), ra)
+    dest = pthobj.get_destination_pathline_data(dest_cells, True)
+    ra = dest[(dest["time"] >= tmin) & (dest["particlegroup"] == 0)]
+    assert np.array_equal(
+        cacheobj.select_data(
+            particlegroup=0, tmin=tmin, dest_cells=dest_cells
+        ),
+        ra,
+    )
+    assert cacheobj._records is None
+    return
+
+
 if __name__ == "__main__":
     # test_mpsim()
     test_get_destination_data()
     # test_loadtxt()
+    test_particle_index()
+    test_pathline_cache()
@@ -355,6 +355,133 @@ def test_zonebudget_6():
         raise AssertionError("Alias testing failed")
 
 
+def test_zonbud_face_flows():
+    # compare the zone budget with the flows summed face by face
+    cbc = flopy.utils.CellBudgetFile(
+        os.path.join("..", "examples", "data", "mp6", "EXAMPLE.BUD")
+    )
+    kstpkper = cbc.get_kstpkper()[-1]
+    zon = np.random.RandomState(39).randint(0, 4, size=(5, 25, 25))
+    zb = ZoneBudget(cbc, zon, kstpkper=kstpkper)
+
+    ich = cbc.get_data(text="CONSTANT HEAD", kstpkper=kstpkper, full3D=True)
+    ich = np.ma.filled(ich[0], 0.0) != 0.0
+    expected = {}
+    for text, offset in (
+        ("FLOW RIGHT FACE", (0, 0, 1)),
+        ("FLOW FRONT FACE", (0, 1, 0)),
+        ("FLOW LOWER FACE", (1, 0, 0)),
+    ):
+        data = cbc.get_data(text=text, kstpkper=kstpkper)[0]
+        for a in np.ndindex(zon.shape):
+            b = tuple(np.add(a, offset))
+            if b[0] >= 5 or b[1] >= 25 or b[2] >= 25:
+                continue
+            q = data[a]
+            if q < 0:
+                a, b, q = b, a, -q
+            if ich[a] and ich[b]:
+                continue
+            elif ich[a]:
+                key = ("FROM_CONSTANT_HEAD", zon[a])
+            elif ich[b]:
+                key = ("TO_CONSTANT_HEAD", zon[b])
+            else:
+                key = None
+            if key is not None:
+                expected[key] = expected.get(key, 0.0) + q
+            if zon[a] != zon[b]:
+                if zon[b] != 0:
+                    key = (f"FROM_ZONE_{zon[a]}", zon[b])
+                    expected[key] = expected.get(key, 0.0) + q
+                if zon[a] != 0:
+                    key = (f"TO_ZONE_{zon[b]}", zon[a])
+                    expected[key] = expected.get(key, 0.0) + q
+
+    budget = zb.get_budget()
+    for name, z in expected:
+        value = budget[budget["name"] == name][f"ZONE_{z}"][0]
+        assert np.isclose(value, expected[(name, z)], rtol=1e-5), (name, z)
+
+    # the budget of a time step does not depend on the other time steps
+    zb2 = ZoneBudget(cbc, zon, kstpkper=cbc.get_kstpkper())
+    budget2 = zb2.get_budget()
+    budget2 = budget2[budget2["stress_period"] == kstpkper[1]]
+    budget2 = budget2[budget2["time_step"] == kstpkper[0]]
+    for z in range(4):
+        assert np.allclose(
+            budget[f"ZONE_{z}"], budget2[f"ZONE_{z}"], equal_nan=True
+        )
+
+    return
+
+
+def test_zonbud_parallel():
+    # budgets computed in a process pool match the serial budgets
+    cbc = flopy.utils.CellBudgetFile(
+        os.path.join("..", "examples", "data", "mp6", "EXAMPLE.BUD")
+    )
+    zon = np.random.RandomState(39).randint(1, 4, size=(5, 25, 25))
+    aliases = {1: "Trey", 2: "Mike"}
+    zb = ZoneBudget(cbc, zon, aliases=aliases)
+    zbp = ZoneBudget(cbc, zon, aliases=aliases, max_workers=2)
+    budget = zb.get_budget()
+    budgetp = zbp.get_budget()
+    assert budget.dtype == budgetp.dtype
+    assert np.array_equal(budget["name"], budgetp["name"])
+    for name in budget.dtype.names[4:]:
+        assert np.allclose(budget[name], budgetp[name], equal_nan=True)
+
+    return
+
+
+def test_zonebudget6_compute_budget():
+    # compute the zone budget without the zbud6 executable
+    from flopy.mf6.utils import MfGrdFile
+
+    ws = os.path.join("..", "examples", "data", "mf6-freyberg")
+    izone = np.ones((1, 40, 20), dtype=int)
+    izone[:, 20:, :] = 2
+    izone[:, :, :2] = 0
+
+    zb = ZoneBudget6(model_ws=outpth)
+    ZoneFile6(zb, izone, aliases={2: "south"})
+    zb.bud = flopy.utils.CellBudgetFile(
+        os.path.join(ws, "freyberg.cbc"), precision="double"
+    )
+    zb.grb = MfGrdFile(os.path.join(ws, "freyberg.dis.grb"))
+    budget = zb.compute_budget()
+
+    names = list(budget["name"])
+    assert "RIV_IN" in names and "TO_ZONE_0" in names
+    assert budget.dtype.names[-2:] == ("ZONE_1", "south")
+
+    # flow between zones is the same from both sides and each zone is
+    # in balance
+    z1 = budget["ZONE_1"]
+    z2 = budget["south"]
+    assert np.isclose(
+        z1[names.index("TO_ZONE_2")], z2[names.index("FROM_ZONE_1")]
+    )
+    assert np.isclose(
+        z1[names.index("FROM_ZONE_2")], z2[names.index("TO_ZONE_1")]
+    )
+    for z in (z1, z2):
+        qin = sum(
+            q
+            for q, name in zip(z, names)
+            if name.endswith("_IN") or name.startswith("FROM_")
+        )
+        qout = sum(
+            q
+            for q, name in zip(z, names)
+            if name.endswith("_OUT") or name.startswith("TO_")
+        )
+        assert np.isclose(qin, qout, rtol=1e-4)
+
+    return
+
+
 if __name__ == "__main__":
     # test_compare2mflist_mlt()
     test_compare2zonebudget()
@@ -369,3 +496,6 @@ if __name__ == "__main__":
     test_get_model_shape()
     test_zonbud_active_areas_zone_zero()
     test_zonebudget_6()
+    test_zonbud_face_flows()
+    test_zonbud_parallel()
+    test_zonebudget6_compute_budget()
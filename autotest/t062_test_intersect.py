@@ -162,5 +162,65 @@ def test_intersection():
             assert all(np.isnan([row, col, cell2d_disv]))
 
 
+def test_intersection_arrays():
+    ml_dis = dis_model()
+    ml_disv = disv_model()
+    dis = ml_dis.modelgrid
+    disv = ml_disv.modelgrid
+
+    # an unstructured grid with the same cells as the vertex grid
+    cell2d = ml_disv.disv.cell2d.array
+    usg = flopy.discretization.UnstructuredGrid(
+        vertices=ml_disv.disv.vertices.array.tolist(),
+        iverts=[list(c)[4:] for c in cell2d],
+        xcenters=cell2d["xc"],
+        ycenters=cell2d["yc"],
+        ncpl=disv.ncpl,
+    )
+    usg.set_coord_info(xoff=xorigin, yoff=yorigin, angrot=angrot)
+
+    # random points in local coordinates, and points on cell vertices
+    rng = np.random.default_rng(0)
+    xl = rng.uniform(-100.0, delr * ncol + 100.0, 500)
+    yl = rng.uniform(-100.0, delc * nrow + 100.0, 500)
+    xl[:50] = (np.arange(50) % (ncol + 1)) * delr
+    yl[:50] = (np.arange(50) // (ncol + 1)) * delc
+    x, y = dis.get_coords(xl, yl)
+
+    row, col = dis.intersect(x, y, forgive=True)
+    cell2d = disv.intersect(x, y, forgive=True)
+    nodes = usg.intersect(xl, yl, local=True, forgive=True)
+    assert np.array_equal(cell2d, nodes, equal_nan=True)
+    for i in range(len(x)):
+        # arrays give the same answer as single points
+        assert np.array_equal(
+            dis.intersect(x[i], y[i], forgive=True),
+            (row[i], col[i]),
+            equal_nan=True,
+        )
+        cell = disv.intersect(x[i], y[i], forgive=True)
+        assert np.array_equal(cell, cell2d[i], equal_nan=True)
+        # points inside the structured grid are in the same vertex cell,
+        # except for points on vertices that may be moved to another cell
+        # by round off in the coordinate transformation
+        if i >= 50 and not np.isnan(row[i]):
+            assert cell == row[i] * ncol + col[i]
+
+    # points outside of the grid raise an exception unless forgiven
+    try:
+        disv.intersect(x, y)
+    except Exception as e:
+        assert "outside of the model area" in e.args[0]
+    else:
+        raise AssertionError("points outside of the grid were not detected")
+
+    # the spatial index is updated with the grid coordinate information
+    disv.set_coord_info(xoff=0.0, yoff=0.0, angrot=0.0)
+    assert np.array_equal(
+        disv.intersect(xl, yl, forgive=True), cell2d, equal_nan=True
+    )
+
+
 if __name__ == "__main__":
     test_intersection()
+    test_intersection_arrays()
@@ -122,3 +122,62 @@ class TestModflowPerformance:
     def teardown_class(cls):
         # cleanup
         shutil.rmtree(cls.model_ws)
+
+
+def test_util2d_fixed_format_performance():
+    """compare fixed format array reading and writing with formatting and
+    parsing the values one at a time"""
+    from io import StringIO
+    from flopy.utils.util_array import Util2d
+
+    shape = (500, 500)
+    a = np.random.default_rng(0).random(shape, dtype=np.float32) * 100.0
+    fmtin = "(10G15.6)"
+
+    # previous implementation, which writes and reads each value separately
+    t0 = time.perf_counter()
+    ncol = shape[1]
+    text = "".join(
+        [
+            "{0:15.6E}".format(d) + "\n"
+            if (((i + 1) % 10 == 0) and (i != 0 or ncol == 1))
+            or ((i + 1 == ncol) and (ncol != 1))
+            or (i + 1 == a.size)
+            else "{0:15.6E}".format(d)
+            for i, d in enumerate(a.flatten())
+        ]
+    )
+    t_write_ref = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    f = StringIO(text)
+    items = []
+    while len(items) < a.size:
+        line = f.readline()
+        pos = 0
+        for i in range(10):
+            item = line[pos : pos + 15].strip()
+            pos += 15
+            if item:
+                items.append(item)
+    ref = np.fromiter(items, dtype=np.float32, count=a.size).reshape(shape)
+    t_read_ref = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    s = Util2d.array2string(shape, a, fmtin)
+    t_write = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    b = Util2d.load_txt(shape, StringIO(s), np.float32, fmtin)
+    t_read = time.perf_counter() - t0
+
+    assert s == text
+    assert np.array_equal(b, ref)
+    print(
+        f"array2string took {t_write:.2f}s, "
+        f"formatting each value took {t_write_ref:.2f}s"
+    )
+    print(
+        f"load_txt took {t_read:.2f}s, "
+        f"parsing each value took {t_read_ref:.2f}s"
+    )
+    assert t_write < t_write_ref
+    assert t_read < t_read_ref
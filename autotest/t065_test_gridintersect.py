@@ -1361,5 +1361,58 @@ def test_rasters():
     del rio
 
 
+def test_raster_sampling_methods():
+    from flopy.utils import Raster
+    import flopy as fp
+
+    try:
+        import affine
+        import rasterio
+    except ImportError:
+        return
+
+    # each model cell covers a block of n x n raster cells
+    nrow, ncol, n = 8, 12, 5
+    nodata = -999.0
+    rng = np.random.default_rng(7)
+    arr = rng.uniform(0, 100, (1, nrow * n, ncol * n)).astype(np.float32)
+    arr[0, :3, :4] = nodata
+    arr[0, 10:15, 20:25] = nodata
+    transform = affine.Affine(1.0, 0.0, 0.0, 0.0, -1.0, nrow * n)
+    rio = Raster(arr, (1,), 26916, transform, nodata)
+    modelgrid = fp.discretization.StructuredGrid(
+        delc=np.full(nrow, float(n)), delr=np.full(ncol, float(n))
+    )
+
+    blocks = arr[0].astype(float)
+    blocks[blocks == nodata] = np.nan
+    blocks = blocks.reshape(nrow, n, ncol, n).transpose(0, 2, 1, 3)
+    blocks = blocks.reshape(nrow, ncol, n * n)
+    methods = {
+        "mean": np.nanmean,
+        "median": np.nanmedian,
+        "min": np.nanmin,
+        "max": np.nanmax,
+    }
+    for tile_rows, multithread in ((None, False), (7, False), (7, True)):
+        for method, func in methods.items():
+            with np.errstate(all="ignore"):
+                expected = func(blocks, axis=2)
+            expected[np.isnan(expected)] = nodata
+            data = rio.resample_to_grid(
+                modelgrid,
+                band=1,
+                method=method,
+                multithread=multithread,
+                thread_pool=3,
+                tile_rows=tile_rows,
+            )
+            if data.shape != (nrow, ncol):
+                raise AssertionError
+            if not np.allclose(data, expected):
+                raise AssertionError(f"{method} resampling is not correct")
+
+
 if __name__ == "__main__":
     test_rasters()
+    test_raster_sampling_methods()
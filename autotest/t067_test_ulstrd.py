@@ -141,5 +141,57 @@ def test_ulstrd():
     return
 
 
+def test_ulstrd_block():
+    # lists are parsed as a block, with a fallback to parsing each line
+    # for blank fields, short lines and blank lines
+    from flopy.utils.flopy_io import ulstrd
+
+    class Model:
+        model_ws = tpth
+        free_format_input = True
+
+    model = Model()
+    dtype = flopy.modflow.ModflowGhb.get_default_dtype()
+    expected = np.recarray(3, dtype=dtype)
+    expected[0] = (1, 2, 3, 10.5, 2.0)
+    expected[1] = (4, 5, 6, 0.0, 0.0)
+    expected[2] = (7, 8, 9, 1.5e3, 0.0)
+
+    free = [
+        "1 2 3 10.5 1.0 extra values\n",
+        "4 5 6 0 0\n",
+        "7 8 9 1.5E+03 0.0\n",
+        "1 2 3 10.5 1.0\n",
+        "4 5 6\n",
+        "7 8 9 1.5e3 0.\n",
+    ]
+    fixed = [
+        "         1         2         3      10.5       1.0\n",
+        "         4         5         6\n",
+        "         7         8         9    1500.0          \n",
+        "         1         2         3      10.5       1.0      ex\n",
+        "         4         5         6       0.0       0.0\n",
+        "         7         8         9    1.5e+3          \n",
+    ]
+    for free_format_input, lines in ((True, free), (False, fixed)):
+        model.free_format_input = free_format_input
+        fname = os.path.join(tpth, "block.dat")
+        with open(fname, "w") as f:
+            f.write("sfac 2.0\n")
+            f.writelines(lines)
+        with open(fname) as f:
+            for kper in range(2):
+                ra = np.recarray(3, dtype=dtype)
+                ra = ulstrd(f, 3, ra, model, ["cond"], None)
+                assert np.array_equal(ra, expected), ra
+                if kper == 0:
+                    # sfac only applies to the first list
+                    expected["cond"] /= 2.0
+        expected["cond"] *= 2.0
+
+    return
+
+
 if __name__ == "__main__":
     test_ulstrd()
+    test_ulstrd_block()
@@ -0,0 +1,230 @@
+"""
+Test running models concurrently with flopy.run_models and
+flopy.run_model_async
+"""
+import asyncio
+import os
+import shutil
+import sys
+import time
+
+import flopy
+
+cpth = os.path.join("temp", "t081")
+# make the directory if it does not exist
+if not os.path.isdir(cpth):
+    os.makedirs(cpth, exist_ok=True)
+
+# python scripts are used in place of model executables
+scripts = {
+    "normal.py": "print('running')\nprint('Normal termination of model')\n",
+    "failed.py": "print('running')\nprint('model failed')\n",
+    "slow.py": "import time\ntime.sleep(30)\nprint('normal termination')\n",
+}
+
+
+def _write_jobs(name):
+    jobs = []
+    for idx, script in enumerate(("normal.py", "failed.py", "normal.py")):
+        model_ws = os.path.join(cpth, f"{name}{idx}")
+        if os.path.isdir(model_ws):
+            shutil.rmtree(model_ws)
+        os.makedirs(model_ws)
+        with open(os.path.join(model_ws, script), "w") as f:
+            f.write(scripts[script])
+        jobs.append((sys.executable, script, model_ws))
+    return jobs
+
+
+def test_run_models():
+    jobs = _write_jobs("batch")
+    results = list(flopy.run_models(jobs, max_workers=2, report=True))
+    assert len(results) == len(jobs)
+
+    results = sorted(results)
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.success for r in results] == [True, False, True]
+    for job, result in zip(jobs, results):
+        assert result.model_ws == job[2]
+        assert result.returncode == 0
+        assert not result.timed_out
+        assert result.elapsed > 0.0
+        assert result.buff[0] == "running"
+
+    # dictionary jobs without report
+    jobs = [
+        {"exe_name": exe_name, "namefile": namefile, "model_ws": model_ws}
+        for exe_name, namefile, model_ws in jobs
+    ]
+    for result in flopy.run_models(jobs, normal_msg=["failed"]):
+        assert result.buff == []
+        assert result.success == (result.index == 1)
+    return
+
+
+def test_run_models_timeout():
+    model_ws = os.path.join(cpth, "timeout")
+    if os.path.isdir(model_ws):
+        shutil.rmtree(model_ws)
+    os.makedirs(model_ws)
+    with open(os.path.join(model_ws, "slow.py"), "w") as f:
+        f.write(scripts["slow.py"])
+
+    jobs = [(sys.executable, "slow.py", model_ws)]
+    results = list(flopy.run_models(jobs, timeout=0.5))
+    assert len(results) == 1
+    assert results[0].timed_out
+    assert not results[0].success
+    assert results[0].elapsed < 30.0
+    return
+
+
+def test_run_models_missing_namefile():
+    # jobs are checked before any model is run
+    jobs = _write_jobs("missing") + [(sys.executable, "missing.nam", cpth)]
+    try:
+        flopy.run_models(jobs)
+    except Exception as e:
+        assert "namefile" in str(e)
+    else:
+        raise AssertionError("missing namefile was not detected")
+    return
+
+
+def test_run_models_stop():
+    jobs = _write_jobs("stop")
+    for idx in (1, 2):
+        model_ws = os.path.join(cpth, f"stop{idx}")
+        with open(os.path.join(model_ws, "slow.py"), "w") as f:
+            f.write(scripts["slow.py"])
+        jobs[idx] = (sys.executable, "slow.py", model_ws)
+
+    # running models are killed when the caller stops iterating
+    t0 = time.perf_counter()
+    results = flopy.run_models(jobs, max_workers=2)
+    result = next(results)
+    assert result.index == 0
+    results.close()
+    assert time.perf_counter() - t0 < 30.0
+    return
+
+
+def test_run_models_callback():
+    jobs = _write_jobs("callback")
+    lines = []
+    results = list(
+        flopy.run_models(
+            jobs,
+            max_workers=2,
+            callback=lambda idx, line: lines.append((idx, line)),
+        )
+    )
+    assert len(results) == 3
+    assert sorted(lines) == [
+        (0, "Normal termination of model"),
+        (0, "running"),
+        (1, "model failed"),
+        (1, "running"),
+        (2, "Normal termination of model"),
+        (2, "running"),
+    ]
+    return
+
+
+def test_run_model_use_async():
+    for name, script, expected in (
+        ("use_async0", "normal.py", True),
+        ("use_async1", "failed.py", False),
+    ):
+        model_ws = os.path.join(cpth, name)
+        if os.path.isdir(model_ws):
+            shutil.rmtree(model_ws)
+        os.makedirs(model_ws)
+        with open(os.path.join(model_ws, script), "w") as f:
+            f.write(scripts[script])
+        success, buff = flopy.run_model(
+            sys.executable, script, model_ws, silent=True, use_async=True
+        )
+        assert success == expected
+        assert len(buff) == 2
+        assert buff[0].endswith("-->running")
+    return
+
+
+def test_run_model_async():
+    jobs = _write_jobs("async")
+    lines = []
+
+    async def run_all():
+        return await asyncio.gather(
+            *[
+                flopy.run_model_async(
+                    exe_name,
+                    namefile,
+                    model_ws,
+                    silent=True,
+                    report=True,
+                    callback=lines.append,
+                )
+                for exe_name, namefile, model_ws in jobs
+            ]
+        )
+
+    results = asyncio.run(run_all())
+    assert [success for success, buff in results] == [True, False, True]
+    for success, buff in results:
+        assert buff[0] == "running"
+    assert len(lines) == 6
+    return
+
+
+def test_run_model_async_timeout():
+    model_ws = os.path.join(cpth, "async_timeout")
+    if os.path.isdir(model_ws):
+        shutil.rmtree(model_ws)
+    os.makedirs(model_ws)
+    with open(os.path.join(model_ws, "slow.py"), "w") as f:
+        f.write(scripts["slow.py"])
+
+    # timeouts raise asyncio.TimeoutError
+    t0 = time.perf_counter()
+    try:
+        asyncio.run(
+            flopy.run_model_async(
+                sys.executable, "slow.py", model_ws, silent=True, timeout=0.5
+            )
+        )
+    except asyncio.TimeoutError:
+        pass
+    else:
+        raise AssertionError("run_model_async did not time out")
+
+    # cancelled runs are stopped
+    async def cancel_run():
+        task = asyncio.ensure_future(
+            flopy.run_model_async(
+                sys.executable, "slow.py", model_ws, silent=True
+            )
+        )
+        await asyncio.sleep(0.5)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    assert asyncio.run(cancel_run())
+    assert time.perf_counter() - t0 < 30.0
+    return
+
+
+if __name__ == "__main__":
+    test_run_models()
+    test_run_models_timeout()
+    test_run_models_missing_namefile()
+    test_run_models_stop()
+    test_run_models_callback()
+    test_run_model_use_async()
+    test_run_model_async()
+    test_run_model_async_timeout()
@@ -1267,6 +1267,78 @@ def test_mf6_output_add_observation():
         raise TypeError("remove and add observation test (Mf6Output) failed")
 
 
+def test_lazy_load():
+    pth = os.path.join("..", "examples", "data", "mf6", "test005_advgw_tidal")
+    sim = MFSimulation.load(sim_ws=pth, verbosity_level=0)
+    lazy_sim = MFSimulation.load(sim_ws=pth, verbosity_level=0, lazy_load=True)
+    model = sim.get_model()
+    lazy_model = lazy_sim.get_model()
+
+    # only the discretization package is loaded
+    ndeferred = len(lazy_model._deferred_packages)
+    assert ndeferred == len(model.name_file.packages.get_data()) - 1
+    assert lazy_model.modelgrid.shape == model.modelgrid.shape
+    assert len(lazy_model._deferred_packages) == ndeferred
+
+    # requested packages are loaded on access
+    riv = lazy_model.riv
+    assert len(lazy_model._deferred_packages) == ndeferred - 1
+    assert np.array_equal(
+        riv.stress_period_data.get_data(0),
+        model.riv.stress_period_data.get_data(0),
+    )
+
+    # package lists load the remaining packages
+    assert sorted(lazy_model.package_names) == sorted(model.package_names)
+    assert not lazy_model._deferred_packages
+    return
+
+
+def test_load_large_list():
+    # list blocks are converted in bulk, with comments, quoted text and
+    # lines without optional items processed one line at a time
+    ws = os.path.join(cpth, "test_load_large_list")
+    sim = MFSimulation(sim_ws=ws)
+    flopy.mf6.ModflowTdis(sim)
+    flopy.mf6.ModflowIms(sim)
+    gwf = flopy.mf6.ModflowGwf(sim, modelname="large_list")
+    flopy.mf6.ModflowGwfdis(gwf, nlay=2, nrow=20, ncol=30)
+    flopy.mf6.ModflowGwfic(gwf)
+    flopy.mf6.ModflowGwfnpf(gwf)
+    cells = [(k, i, j) for k in range(2) for i in range(20) for j in range(30)]
+    spd = [
+        (cellid, -0.5 * idx, float(idx % 7), f"well{idx}")
+        for idx, cellid in enumerate(cells)
+    ]
+    flopy.mf6.ModflowGwfwel(
+        gwf,
+        auxiliary=["conc"],
+        boundnames=True,
+        stress_period_data={0: spd},
+    )
+    sim.write_simulation()
+
+    # add lines that can not be converted in bulk
+    fpth = os.path.join(ws, "large_list.wel")
+    with open(fpth) as f:
+        lines = f.readlines()
+    idx = lines.index("BEGIN period  1\n")
+    lines.insert(idx + 2, "# a comment\n")
+    lines[idx + 4] = "  1  1  3  -1.0E+00  1.0E+00  'well 2'\n"
+    lines[idx + 6] = "  1  1  5  -2.0E+00  4.0E+00\n"
+    with open(fpth, "w") as f:
+        f.writelines(lines)
+    spd[2] = ((0, 0, 2), -1.0, 1.0, "well 2")
+    spd[4] = ((0, 0, 4), -2.0, 4.0, None)
+
+    sim = MFSimulation.load(sim_ws=ws, verbosity_level=0)
+    data = sim.get_model().wel.stress_period_data.get_data(0)
+    assert len(data) == len(spd)
+    for row, expected in zip(data, spd):
+        assert tuple(row) == expected
+    return
+
+
 if __name__ == "__main__":
     test001a_tharmonic()
     test001e_uzf_3lay()
@@ -1282,3 +1354,5 @@ if __name__ == "__main__":
     test_replace_ims_package()
     test_mf6_output()
     test_mf6_output_add_observation()
+    test_lazy_load()
+    test_load_large_list()
@@ -0,0 +1,25 @@
+# BAS6 package for MODFLOW-NWT generated by Flopy 3.3.5
+FREE
+INTERNAL               1     (FREE) -1 #ibound_layer_0                
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1
+    -999.0
+INTERNAL               1     (FREE) -1 #strt_layer_0                  
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
+   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03   1.000000E+03
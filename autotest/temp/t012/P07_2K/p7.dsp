@@ -0,0 +1,131 @@
+         3         1          (21E15.6)        -1 #al_layer_0
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1          (21E15.6)        -1 #al_layer_1
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1          (21E15.6)        -1 #al_layer_2
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1          (21E15.6)        -1 #al_layer_3
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1          (21E15.6)        -1 #al_layer_4
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1          (21E15.6)        -1 #al_layer_5
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1          (21E15.6)        -1 #al_layer_6
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         3         1          (21E15.6)        -1 #al_layer_7
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         0       0.3                           -1 #trpt
+         0       0.3                           -1 #trpv
+         0         0                           -1 #dmcoef1
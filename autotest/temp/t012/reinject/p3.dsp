@@ -0,0 +1,35 @@
+         3         1          (46E15.6)        -1 #al_layer_0
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01   1.000000E+01
+         0       0.3                           -1 #trpt
+         0       0.3                           -1 #trpv
+         0         0                           -1 #dmcoef1
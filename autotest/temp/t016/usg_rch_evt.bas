@@ -0,0 +1,15 @@
+# BAS6 package for MODFLOW-USG generated by Flopy 3.3.5
+FREE
+INTERNAL               1     (FREE) -1 #ibound_layer_0                
+         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_1                
+         1         1         1         1         1         1         1         1         1
+INTERNAL               1     (FREE) -1 #ibound_layer_2                
+         1         1         1         1         1         1         1         1         1
+     999.0
+INTERNAL               1     (FREE) -1 #strt_layer_0                  
+   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00
+INTERNAL               1     (FREE) -1 #strt_layer_1                  
+   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00
+INTERNAL               1     (FREE) -1 #strt_layer_2                  
+   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00   3.000000E+00
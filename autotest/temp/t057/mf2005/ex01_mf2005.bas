@@ -0,0 +1,9 @@
+# BAS6 package for MODFLOW-2005 generated by Flopy 3.3.5
+FREE
+CONSTANT          1                                #ibound layer 1                
+CONSTANT          1                                #ibound layer 2                
+CONSTANT          1                                #ibound layer 3                
+   -999.99
+CONSTANT    4.000000E+02                           #strt layer 1                  
+CONSTANT    4.000000E+02                           #strt layer 2                  
+CONSTANT    4.000000E+02                           #strt layer 3                  
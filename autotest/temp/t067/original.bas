@@ -0,0 +1,5 @@
+# BAS6 package for MODFLOW-2005 generated by Flopy 3.3.5
+FREE
+CONSTANT          1                                #ibound layer 1                
+   -999.99
+CONSTANT    1.000000E+00                           #strt layer 1                  
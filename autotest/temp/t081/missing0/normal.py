@@ -0,0 +1,2 @@
+print('running')
+print('Normal termination of model')
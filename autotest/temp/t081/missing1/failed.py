@@ -0,0 +1,2 @@
+print('running')
+print('model failed')
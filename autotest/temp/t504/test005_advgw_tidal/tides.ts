@@ -0,0 +1,10 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 22:17:31.
+BEGIN ATTRIBUTES
+  NAMES  tides
+  METHOD  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+    OPEN/CLOSE  'tides.ts_timeseries.txt'
+END TIMESERIES
+
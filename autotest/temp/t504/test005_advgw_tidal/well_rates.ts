@@ -0,0 +1,10 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 22:17:31.
+BEGIN ATTRIBUTES
+  NAMES  well_1_rate  well_2_rate  well_6_rate
+  METHOD  stepwise
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+    OPEN/CLOSE  'well_rates.ts_timeseries.txt'
+END TIMESERIES
+
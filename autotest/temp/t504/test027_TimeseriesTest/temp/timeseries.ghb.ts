@@ -0,0 +1,13 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 22:17:35.
+BEGIN ATTRIBUTES
+  NAMES  ghbh_1  ghbh_2  ghbc_1  ghbc_2
+  METHODS  linear  linear  linear  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+       0.00000000      15.00000000      -5.00000000     500.00000000     100.00000000
+      10.00000000      10.00000000       0.00000000     400.00000000     200.00000000
+      20.00000000       5.00000000       5.00000000     300.00000000     300.00000000
+      30.00000000       0.00000000      10.00000000     200.00000000     400.00000000
+END TIMESERIES
+
@@ -0,0 +1,11 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 22:17:35.
+BEGIN ATTRIBUTES
+  NAMES  wrate_1  wrate_2
+  METHODS  stepwise  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+       0.00000000   -1000.00000000   -2000.00000000
+      50.00000000   -1000.00000000   -2050.00000000
+END TIMESERIES
+
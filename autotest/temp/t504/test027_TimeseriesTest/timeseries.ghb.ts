@@ -0,0 +1,10 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 22:17:34.
+BEGIN ATTRIBUTES
+  NAMES  ghbh_1  ghbh_2  ghbc_1  ghbc_2
+  METHODS  linear  linear  linear  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+    OPEN/CLOSE  'timeseries.ghb.ts_timeseries.txt'
+END TIMESERIES
+
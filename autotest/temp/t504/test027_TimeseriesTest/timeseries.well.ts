@@ -0,0 +1,10 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 22:17:34.
+BEGIN ATTRIBUTES
+  NAMES  wrate_1  wrate_2
+  METHODS  stepwise  linear
+END ATTRIBUTES
+
+BEGIN TIMESERIES
+    OPEN/CLOSE  'timeseries.well.ts_timeseries.txt'
+END TIMESERIES
+
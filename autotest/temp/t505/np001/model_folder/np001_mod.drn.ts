@@ -0,0 +1,9 @@
+BEGIN attributes
+  NAMES  drn_1
+  METHODS  linearend
+END attributes
+
+BEGIN timeseries
+    OPEN/CLOSE  'model_folder/data/np001_mod.drn.ts_timeseries.txt'
+END timeseries
+
@@ -0,0 +1,10 @@
+BEGIN attributes
+  NAMES  drn_1
+  METHODS  linearend
+END attributes
+
+BEGIN timeseries
+       0.00000000      60.00000000
+  100000.00000000      60.00000000
+END timeseries
+
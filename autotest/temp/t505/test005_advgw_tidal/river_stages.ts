@@ -0,0 +1,10 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 20:41:12.
+BEGIN attributes
+  NAMES  river_stage_1  river_stage_2
+  METHODS  linear  stepwise
+END attributes
+
+BEGIN timeseries
+    OPEN/CLOSE  'river_stages.ts_timeseries.txt'
+END timeseries
+
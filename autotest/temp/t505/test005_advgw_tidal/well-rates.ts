@@ -0,0 +1,10 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 20:41:12.
+BEGIN attributes
+  NAMES  well_1_rate  well_2_rate  well_3_rate
+  METHODS  stepwise  stepwise  stepwise
+END attributes
+
+BEGIN timeseries
+    OPEN/CLOSE  'well-rates.ts_timeseries.txt'
+END timeseries
+
@@ -0,0 +1,10 @@
+# File generated by Flopy version 3.3.5 on 10/18/2026 at 20:41:12.
+BEGIN attributes
+  NAMES  flow
+  METHODS  linear
+END attributes
+
+BEGIN timeseries
+    OPEN/CLOSE  'fhb_flow.ts_timeseries.txt'
+END timeseries
+
@@ -36,7 +36,7 @@ from . import pest
 from . import mf6
 from . import discretization
 
-from .mbase import run_model, which
+from .mbase import run_model, run_model_async, run_models, which
 
 __all__ = [
     "modflow",
@@ -52,5 +52,7 @@ __all__ = [
     "mf6",
     "discretization",
     "run_model",
+    "run_model_async",
+    "run_models",
     "which",
 ]
@@ -22,6 +22,47 @@ class CachedData:
         self.out_of_date = False
 
 
+def _points_in_polygons(x, y, xv, yv, tol):
+    """
+    Test if each point is in the closed polygon on the same row of xv and
+    yv, including points that are within tol of an edge.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        x-coordinate of each point
+    y : np.ndarray
+        y-coordinate of each point
+    xv : np.ndarray
+        polygon x-coordinates with shape (npoints, nvertices)
+    yv : np.ndarray
+        polygon y-coordinates with shape (npoints, nvertices)
+    tol : float
+        distance from an edge that is considered to be on the edge
+
+    Returns
+    -------
+    inside : np.ndarray of bool
+    """
+    inside = np.zeros(x.shape, dtype=bool)
+    onedge = np.zeros(x.shape, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k in range(xv.shape[1] - 1):
+            x1, y1, x2, y2 = xv[:, k], yv[:, k], xv[:, k + 1], yv[:, k + 1]
+            # ray casting
+            crosses = (y1 > y) != (y2 > y)
+            xcross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            inside ^= crosses & (x < xcross)
+            # distance to the edge
+            ex, ey = x2 - x1, y2 - y1
+            length2 = ex * ex + ey * ey
+            t = ((x - x1) * ex + (y - y1) * ey) / length2
+            t = np.where(length2 > 0.0, np.clip(t, 0.0, 1.0), 0.0)
+            dist2 = (x1 + t * ex - x) ** 2 + (y1 + t * ey - y) ** 2
+            onedge |= dist2 <= tol * tol
+    return inside | onedge
+
+
 class Grid:
     """
     Base class for a structured or unstructured model grid
@@ -667,6 +708,172 @@ class Grid:
         else:
             return x, y
 
+    @property
+    def _spatial_index(self):
+        """
+        Spatial index of the cell polygons, built on first use and rebuilt
+        when the grid geometry or coordinate information changes.
+        """
+        cache_index = "spatialindex"
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            self._cache_dict[cache_index] = CachedData(
+                self._build_spatial_index()
+            )
+        return self._cache_dict[cache_index].data_nocopy
+
+    def _build_spatial_index(self):
+        """
+        Build a uniform grid of buckets over the model extent that lists the
+        cells whose bounding box overlaps each bucket, along with padded
+        arrays of the closed cell polygons.
+
+        Returns
+        -------
+        index : dict
+        """
+        self._copy_cache = False
+        xverts, yverts = self.xvertices, self.yvertices
+        self._copy_cache = True
+
+        # pad the vertices of each cell with its first vertex, which closes
+        # the polygon and adds zero length edges to cells with fewer vertices
+        nverts = np.array([len(v) for v in xverts])
+        ncells = len(nverts)
+        offset = np.cumsum(nverts) - nverts
+        icol = np.arange(nverts.max() + 1)
+        ivert = np.where(icol < nverts[:, None], icol, 0) + offset[:, None]
+        xv = np.concatenate([np.asarray(v, dtype=float) for v in xverts])
+        yv = np.concatenate([np.asarray(v, dtype=float) for v in yverts])
+        xv, yv = xv[ivert], yv[ivert]
+
+        xmin, xmax = xv.min(axis=1), xv.max(axis=1)
+        ymin, ymax = yv.min(axis=1), yv.max(axis=1)
+        extent = max(xmax.max() - xmin.min(), ymax.max() - ymin.min())
+        tol = 1e-9 * extent if extent > 0.0 else 1e-9
+
+        # about one cell per bucket for cells of similar size
+        nb = max(int(np.sqrt(ncells)), 1)
+        x0, y0 = xmin.min() - tol, ymin.min() - tol
+        dx = (xmax.max() + tol - x0) / nb
+        dy = (ymax.max() + tol - y0) / nb
+
+        ix0 = np.clip(np.floor((xmin - tol - x0) / dx), 0, nb - 1).astype(int)
+        ix1 = np.clip(np.floor((xmax + tol - x0) / dx), 0, nb - 1).astype(int)
+        iy0 = np.clip(np.floor((ymin - tol - y0) / dy), 0, nb - 1).astype(int)
+        iy1 = np.clip(np.floor((ymax + tol - y0) / dy), 0, nb - 1).astype(int)
+        nx = ix1 - ix0 + 1
+        count = nx * (iy1 - iy0 + 1)
+        icell = np.repeat(np.arange(ncells), count)
+        k = np.arange(icell.shape[0]) - np.repeat(
+            np.cumsum(count) - count, count
+        )
+        bucket = (
+            (iy0[icell] + k // nx[icell]) * nb + ix0[icell] + k % nx[icell]
+        )
+
+        # cells are in ascending order within each bucket
+        order = np.argsort(bucket, kind="stable")
+        ptr = np.zeros(nb * nb + 1, dtype=int)
+        ptr[1:] = np.cumsum(np.bincount(bucket, minlength=nb * nb))
+
+        return {
+            "xv": xv,
+            "yv": yv,
+            "x0": x0,
+            "y0": y0,
+            "dx": dx,
+            "dy": dy,
+            "nb": nb,
+            "ptr": ptr,
+            "cells": icell[order],
+            "tol": tol,
+        }
+
+    def _intersect_points(self, x, y, chunksize=100000):
+        """
+        Find the cell that contains each point using the spatial index.
+        Points on the edge of a cell are in the cell.  When a point is in
+        more than one cell, the lowest cell number is returned.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            x-coordinates of the points in real-world coordinates
+        y : np.ndarray
+            y-coordinates of the points in real-world coordinates
+        chunksize : int
+            maximum number of points tested at a time
+
+        Returns
+        -------
+        cells : np.ndarray
+            cell number for each point, or -1 for points outside the grid
+        """
+        index = self._spatial_index
+        nb, ptr, cells, tol = (
+            index["nb"],
+            index["ptr"],
+            index["cells"],
+            index["tol"],
+        )
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        result = np.full(x.shape[0], -1, dtype=int)
+        for i0 in range(0, x.shape[0], chunksize):
+            px, py = x[i0 : i0 + chunksize], y[i0 : i0 + chunksize]
+            with np.errstate(invalid="ignore"):
+                fx = np.floor((px - index["x0"]) / index["dx"])
+                fy = np.floor((py - index["y0"]) / index["dy"])
+                ipts = np.flatnonzero(
+                    (fx >= 0) & (fx < nb) & (fy >= 0) & (fy < nb)
+                )
+            bucket = fy[ipts].astype(int) * nb + fx[ipts].astype(int)
+
+            # candidate (point, cell) pairs from the bucket of each point
+            start = ptr[bucket]
+            count = ptr[bucket + 1] - start
+            ipair = np.repeat(ipts, count)
+            k = np.arange(ipair.shape[0]) - np.repeat(
+                np.cumsum(count) - count, count
+            )
+            icell = cells[np.repeat(start, count) + k]
+            inside = _points_in_polygons(
+                px[ipair],
+                py[ipair],
+                index["xv"][icell],
+                index["yv"][icell],
+                tol,
+            )
+
+            # pairs are sorted by point and then by cell
+            ipair, icell = ipair[inside], icell[inside]
+            ipts, ifirst = np.unique(ipair, return_index=True)
+            result[i0 + ipts] = icell[ifirst]
+        return result
+
+    def _intersect_result(self, cells, scalar, forgive):
+        """
+        Convert cell numbers from _intersect_points to the value returned
+        by intersect, with NaN for points outside of the grid if forgive is
+        True.
+        """
+        outside = cells < 0
+        if np.any(outside):
+            if not forgive:
+                raise Exception(
+                    "x, y point given is outside of the model area"
+                )
+            cells = cells.astype(float)
+            cells[outside] = np.nan
+        if scalar:
+            cells = cells[0]
+            if not np.isnan(cells):
+                cells = int(cells)
+        return cells
+
     def set_coord_info(
         self,
         xoff=None,
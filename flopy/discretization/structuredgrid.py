@@ -750,10 +750,12 @@ class StructuredGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point, or an array of
+            x-coordinates for several points
+        y : float or array_like
+            The y-coordinate of the requested point, or an array of
+            y-coordinates for several points
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -762,41 +764,39 @@ class StructuredGrid(Grid):
 
         Returns
         -------
-        row : int
-            The row number
-        col : int
-            The column number
+        row : int or np.ndarray
+            The row number, or an array of row numbers if x and y are arrays
+        col : int or np.ndarray
+            The column number, or an array of column numbers if x and y are
+            arrays
 
         """
+        scalar = np.isscalar(x)
         # transform x and y to local coordinates
         x, y = super().intersect(x, y, local, forgive)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
 
         # get the cell edges in local coordinates
         xe, ye = self.xyedges
 
-        xcomp = x > xe
-        if np.all(xcomp) or not np.any(xcomp):
-            if forgive:
-                col = np.nan
-            else:
-                raise Exception(
-                    "x, y point given is outside of the model area"
-                )
-        else:
-            col = np.where(xcomp)[0][-1]
-
-        ycomp = y < ye
-        if np.all(ycomp) or not np.any(ycomp):
-            if forgive:
-                row = np.nan
-            else:
+        # number of edges to the left of x and above y
+        col = np.searchsorted(xe, x, side="left") - 1
+        row = ye.shape[0] - np.searchsorted(ye[::-1], y, side="right") - 1
+        outside = (
+            (col < 0) | (col >= self.ncol) | (row < 0) | (row >= self.nrow)
+        )
+        if np.any(outside):
+            if not forgive:
                 raise Exception(
                     "x, y point given is outside of the model area"
                 )
-        else:
-            row = np.where(ycomp)[0][-1]
-        if np.any(np.isnan([row, col])):
-            row = col = np.nan
+            row = row.astype(float)
+            col = col.astype(float)
+            row[outside] = np.nan
+            col[outside] = np.nan
+        if scalar:
+            return row[0], col[0]
         return row, col
 
     def _cell_vert_list(self, i, j):
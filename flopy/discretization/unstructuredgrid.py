@@ -504,8 +504,40 @@ class UnstructuredGrid(Grid):
         return copy.copy(self._polygons)
 
     def intersect(self, x, y, local=False, forgive=False):
-        x, y = super().intersect(x, y, local, forgive)
-        raise Exception("Not implemented yet")
+        """
+        Get the node number of a point with coordinates x and y
+
+        When the point is on the edge of two cells, or the grid varies by
+        layer and the point is in cells of several layers, the lowest node
+        number is returned.
+
+        Parameters
+        ----------
+        x : float or array_like
+            The x-coordinate of the requested point, or an array of
+            x-coordinates for several points
+        y : float or array_like
+            The y-coordinate of the requested point, or an array of
+            y-coordinates for several points
+        local: bool (optional)
+            If True, x and y are in local coordinates (defaults to False)
+        forgive: bool (optional)
+            Forgive x,y arguments that fall outside the model grid and
+            return NaNs instead (defaults to False - will throw exception)
+
+        Returns
+        -------
+        node : int or np.ndarray
+            The node number, or an array of node numbers if x and y are
+            arrays
+
+        """
+        scalar = np.isscalar(x)
+        if local:
+            # transform x and y to real-world coordinates
+            x, y = super().get_coords(x, y)
+        nodes = self._intersect_points(x, y)
+        return self._intersect_result(nodes, scalar, forgive)
 
     @property
     def top_botm(self):
@@ -5,7 +5,6 @@ import numpy as np
 from matplotlib.path import Path
 
 from .grid import Grid, CachedData
-from ..utils.geometry import is_clockwise
 
 
 class VertexGrid(Grid):
@@ -246,10 +245,12 @@ class VertexGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point, or an array of
+            x-coordinates for several points
+        y : float or array_like
+            The y-coordinate of the requested point, or an array of
+            y-coordinates for several points
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -258,37 +259,17 @@ class VertexGrid(Grid):
 
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or np.ndarray
+            The CELL2D number, or an array of CELL2D numbers if x and y
+            are arrays
 
         """
-
+        scalar = np.isscalar(x)
         if local:
             # transform x and y to real-world coordinates
             x, y = super().get_coords(x, y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if (
-                np.any(x <= xa)
-                and np.any(x >= xa)
-                and np.any(y <= ya)
-                and np.any(y >= ya)
-            ):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    return icell2d
-        if forgive:
-            icell2d = np.nan
-            return icell2d
-        raise Exception("x, y point given is outside of the model area")
+        cells = self._intersect_points(x, y)
+        return self._intersect_result(cells, scalar, forgive)
 
     def get_cell_vertices(self, cellid):
         """
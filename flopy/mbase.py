@@ -5,14 +5,18 @@ mbase module
 
 """
 import abc
+import asyncio
 import os
 import shutil
 import threading
+import time
 import warnings
 import queue as Queue
 
 from datetime import datetime
 from shutil import which
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from subprocess import Popen, PIPE, STDOUT
 import copy
 import numpy as np
@@ -1677,55 +1681,26 @@ def run_model(
     buff = []
 
     # convert normal_msg to a list of lower case str for comparison
-    if isinstance(normal_msg, str):
-        normal_msg = [normal_msg]
-    for idx, s in enumerate(normal_msg):
-        normal_msg[idx] = s.lower()
+    normal_msg = _normal_msg_list(normal_msg)
 
     # Check to make sure that program and namefile exist
-    exe = which(exe_name)
-    if exe is None:
-        import platform
-
-        if platform.system() in "Windows":
-            if not exe_name.lower().endswith(".exe"):
-                exe = which(exe_name + ".exe")
-        elif exe_name.lower().endswith(".exe"):
-            exe = which(exe_name[:-4])
-    if exe is None:
-        raise Exception(
-            f"The program {exe_name} does not exist or is not executable."
+    exe = _resolve_exe(exe_name, namefile, model_ws)
+    if not silent:
+        print(
+            f"FloPy is using the following executable to run the model: {exe}"
         )
-    else:
-        if not silent:
-            print(
-                f"FloPy is using the following executable to run the model: {exe}"
-            )
-
-    if namefile is not None:
-        if not os.path.isfile(os.path.join(model_ws, namefile)):
-            raise Exception(
-                f"The namefile for this model does not exists: {namefile}"
-            )
 
     # simple little function for the thread to target
     def q_output(output, q):
-        for line in iter(output.readline, b""):
-            q.put(line)
-            # time.sleep(1)
-            # output.close()
+        try:
+            for line in iter(output.readline, b""):
+                q.put(line)
+        finally:
+            # signal the end of stdout, even if reading failed
+            q.put(None)
 
     # create a list of arguments to pass to Popen
-    argv = [exe_name]
-    if namefile is not None:
-        argv.append(namefile)
-
-    # add additional arguments to Popen arguments
-    if cargs is not None:
-        if isinstance(cargs, str):
-            cargs = [cargs]
-        for t in cargs:
-            argv.append(t)
+    argv = _model_argv(exe_name, namefile, cargs)
 
     # run the model with Popen
     proc = Popen(argv, stdout=PIPE, stderr=STDOUT, cwd=model_ws)
@@ -1759,32 +1734,26 @@ def run_model(
     last = datetime.now()
     lastsec = 0.0
     while True:
-        try:
-            line = q.get_nowait()
-        except Queue.Empty:
-            pass
-        else:
-            if line == "":
-                break
-            line = line.decode().lower().strip()
-            if line != "":
-                now = datetime.now()
-                dt = now - last
-                tsecs = dt.total_seconds() - lastsec
-                line = f"(elapsed:{tsecs})-->{line}"
-                lastsec = tsecs + lastsec
-                buff.append(line)
-                if not silent:
-                    print(line)
-                for fword in failed_words:
-                    if fword in line:
-                        success = False
-                        break
-        if proc.poll() is not None:
+        # block until the reader thread has a line instead of polling
+        line = q.get()
+        if line is None:
             break
+        line = line.decode().lower().strip()
+        if line != "":
+            now = datetime.now()
+            dt = now - last
+            tsecs = dt.total_seconds() - lastsec
+            line = f"(elapsed:{tsecs})-->{line}"
+            lastsec = tsecs + lastsec
+            buff.append(line)
+            if not silent:
+                print(line)
+            for fword in failed_words:
+                if fword in line:
+                    success = False
+                    break
     proc.wait()
     thread.join(timeout=1)
-    buff.extend(proc.stdout.readlines())
     proc.stdout.close()
 
     for line in buff:
@@ -1797,3 +1766,419 @@ def run_model(
     if pause:
         input("Press Enter to continue...")
     return success, buff
+
+
+async def run_model_async(
+    exe_name,
+    namefile,
+    model_ws="./",
+    silent=False,
+    report=False,
+    normal_msg="normal termination",
+    cargs=None,
+    timeout=None,
+    callback=None,
+):
+    """
+    Coroutine that runs the model using asyncio.create_subprocess_exec.
+    Model stdout is read without blocking the event loop, so a single
+    python process can supervise many concurrent model runs, for example
+    with asyncio.gather().
+
+    Parameters
+    ----------
+    exe_name : str
+        Executable name (with path, if necessary) to run.
+    namefile : str
+        Namefile of model to run. The namefile must be the
+        filename of the namefile without the path. Namefile can be None
+        to allow programs that do not require a control file (name file)
+        to be passed as a command line argument.
+    model_ws : str
+        Path to the location of the namefile. (default is the
+        current working directory - './')
+    silent : boolean
+        Echo run information to screen (default is True).
+    report : boolean, optional
+        Save stdout lines to a list (buff) which is returned
+        by the method . (default is False).
+    normal_msg : str or list
+        Normal termination message used to determine if the
+        run terminated normally. More than one message can be provided using
+        a list. (Default is 'normal termination')
+    cargs : str or list of strings
+        additional command line arguments to pass to the executable.
+        Default is None
+    timeout : float
+        Maximum wall time of the run in seconds. The model process is
+        killed and asyncio.TimeoutError is raised if the run takes
+        longer. If None, the run is not timed out. (default is None)
+    callback : callable
+        Function or coroutine function called with each line of stdout
+        as it is read. (default is None)
+
+    Returns
+    -------
+    (success, buff)
+    success : boolean
+    buff : list of lines of stdout
+
+    Notes
+    -----
+    The model process is killed if the coroutine is cancelled.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> import flopy
+    >>> async def run_all(dirs):
+    ...     return await asyncio.gather(
+    ...         *[flopy.run_model_async("mf6", None, d) for d in dirs]
+    ...     )
+    >>> results = asyncio.run(run_all(ensemble_dirs))
+
+    """
+    success = False
+    buff = []
+
+    # convert normal_msg to a list of lower case str for comparison
+    normal_msg = _normal_msg_list(normal_msg)
+
+    # Check to make sure that program and namefile exist
+    exe = _resolve_exe(exe_name, namefile, model_ws)
+    if not silent:
+        print(
+            f"FloPy is using the following executable to run the model: {exe}"
+        )
+
+    # run the model as an asyncio subprocess
+    argv = _model_argv(exe_name, namefile, cargs)
+    proc = await asyncio.create_subprocess_exec(
+        *argv, stdout=PIPE, stderr=STDOUT, cwd=model_ws
+    )
+
+    async def read_output():
+        nonlocal success
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            line = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            for msg in normal_msg:
+                if msg in line.lower():
+                    success = True
+                    break
+            if not silent:
+                print(line)
+            if report:
+                buff.append(line)
+            if callback is not None:
+                result = callback(line)
+                if asyncio.iscoroutine(result):
+                    await result
+        await proc.wait()
+
+    try:
+        await asyncio.wait_for(read_output(), timeout)
+    except BaseException:
+        # kill the model if the run timed out or was cancelled
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    return success, buff
+
+
+RunResult = namedtuple(
+    "RunResult",
+    [
+        "index",
+        "exe_name",
+        "namefile",
+        "model_ws",
+        "success",
+        "returncode",
+        "timed_out",
+        "elapsed",
+        "buff",
+    ],
+)
+RunResult.__doc__ = """
+Result of a model run from run_models().
+
+index is the position of the job in the list of jobs, success is True if
+a normal termination message was found in stdout, returncode is the
+process exit code, timed_out is True if the run was killed because it
+exceeded the timeout, elapsed is the wall time of the run in seconds, and
+buff is the list of stdout lines (empty unless report is True).
+"""
+
+
+def run_models(
+    jobs,
+    max_workers=None,
+    timeout=None,
+    silent=True,
+    report=False,
+    normal_msg="normal termination",
+    callback=None,
+):
+    """
+    Run a batch of models concurrently. This is useful for ensemble,
+    calibration, and uncertainty analysis work where many model instances
+    need to be run. Each model runs in its own process and a pool of
+    threads supervises at most max_workers processes at a time.
+
+    Parameters
+    ----------
+    jobs : list
+        Models to run. Each job is a model object (for example, a Modflow
+        instance), a (exe_name, namefile, model_ws) tuple, an
+        (exe_name, namefile, model_ws, cargs) tuple, or a dictionary with
+        exe_name, namefile, and optional model_ws and cargs keys. The
+        arguments have the same meaning as in run_model(). All of the
+        jobs are checked before any model is run.
+    max_workers : int
+        Maximum number of models to run at the same time. If None, the
+        number of processors on the machine is used. (default is None)
+    timeout : float
+        Maximum wall time, in seconds, for each model run. Runs that
+        exceed the timeout are killed and reported with timed_out set to
+        True. If None, runs are not timed out. (default is None)
+    silent : boolean
+        If False, print the status of each run as it completes.
+        (default is True)
+    report : boolean
+        Save stdout lines of each run to the buff attribute of the
+        result. (default is False)
+    normal_msg : str or list
+        Normal termination message used to determine if a run terminated
+        normally. More than one message can be provided using a list.
+        (default is 'normal termination')
+    callback : callable
+        Function called with the job index and each line of stdout as it
+        is read. It is called from the threads that supervise the runs.
+        (default is None)
+
+    Returns
+    -------
+    results : generator of RunResult
+        Status, exit code, wall time, and stdout of each run, in the
+        order the runs complete. Use result.index to relate a result to
+        its job. Runs are started when iteration starts. Queued runs are
+        not started and running models are killed if iteration stops
+        early or an exception is raised.
+
+    Examples
+    --------
+    >>> import flopy
+    >>> jobs = [("mf6", None, ws) for ws in ensemble_dirs]
+    >>> results = sorted(flopy.run_models(jobs, max_workers=8))
+    >>> failed = [r.model_ws for r in results if not r.success]
+
+    """
+    jobs = [_run_job_args(job) for job in jobs]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    runner = _JobRunner(timeout, report, normal_msg, callback)
+    return _run_jobs(jobs, max_workers, runner, silent)
+
+
+def _run_jobs(jobs, max_workers, runner, silent):
+    """
+    Run checked run_models() jobs in a pool of threads and yield each
+    RunResult as the run completes.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(runner.run, idx, job)
+            for idx, job in enumerate(jobs)
+        ]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                if not silent:
+                    if result.timed_out:
+                        status = "timed out"
+                    elif result.success:
+                        status = "normal termination"
+                    else:
+                        status = "failed"
+                    print(
+                        f"run {result.index + 1} of {len(jobs)} "
+                        f"({result.model_ws}): {status} "
+                        f"in {result.elapsed:.2f} seconds"
+                    )
+                yield result
+        finally:
+            # do not start queued runs and kill running models if the
+            # caller stops iterating, so the pool can shut down
+            for future in futures:
+                future.cancel()
+            runner.stop()
+
+
+def _run_job_args(job):
+    """
+    Convert a run_models() job to a dictionary of run_model() arguments
+    and check that the program and namefile exist.
+    """
+    if isinstance(job, BaseModel):
+        job = {
+            "exe_name": job.exe_name,
+            "namefile": job.namefile,
+            "model_ws": job.model_ws,
+        }
+    elif isinstance(job, dict):
+        job = dict(job)
+    elif isinstance(job, (tuple, list)) and 2 <= len(job) <= 4:
+        job = dict(zip(("exe_name", "namefile", "model_ws", "cargs"), job))
+    else:
+        raise ValueError(f"invalid job {job!r}")
+    job.setdefault("model_ws", "./")
+    job.setdefault("cargs", None)
+    _resolve_exe(job["exe_name"], job["namefile"], job["model_ws"])
+    return job
+
+
+class _JobRunner:
+    """
+    Run run_models() jobs and keep track of the running model processes
+    so that they can be killed when the batch is stopped.
+    """
+
+    def __init__(self, timeout, report, normal_msg, callback):
+        self.timeout = timeout
+        self.report = report
+        self.normal_msg = _normal_msg_list(normal_msg)
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._procs = set()
+        self._stopped = False
+
+    def stop(self):
+        """
+        Do not start any more runs and kill the running models.
+        """
+        with self._lock:
+            self._stopped = True
+            procs = list(self._procs)
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+
+    def run(self, index, job):
+        """
+        Run a single job, reading stdout line by line, and return a
+        RunResult, or None if the batch was stopped before the run
+        started.
+        """
+        argv = _model_argv(job["exe_name"], job["namefile"], job["cargs"])
+        start = time.perf_counter()
+        with self._lock:
+            if self._stopped:
+                return None
+            proc = Popen(argv, stdout=PIPE, stderr=STDOUT, cwd=job["model_ws"])
+            self._procs.add(proc)
+
+        timed_out = threading.Event()
+        timer = None
+        if self.timeout is not None:
+
+            def kill():
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(self.timeout, kill)
+            timer.daemon = True
+            timer.start()
+
+        success = False
+        buff = []
+        try:
+            for line in iter(proc.stdout.readline, b""):
+                line = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                if not success:
+                    line_lower = line.lower()
+                    success = any(msg in line_lower for msg in self.normal_msg)
+                if self.report:
+                    buff.append(line)
+                if self.callback is not None:
+                    self.callback(index, line)
+            proc.wait()
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            with self._lock:
+                self._procs.discard(proc)
+        elapsed = time.perf_counter() - start
+
+        return RunResult(
+            index,
+            job["exe_name"],
+            job["namefile"],
+            job["model_ws"],
+            success and not timed_out.is_set(),
+            proc.returncode,
+            timed_out.is_set(),
+            elapsed,
+            buff,
+        )
+
+
+def _resolve_exe(exe_name, namefile, model_ws):
+    """
+    Return the path to exe_name and check that namefile exists in
+    model_ws.
+    """
+    exe = which(exe_name)
+    if exe is None:
+        import platform
+
+        if platform.system() in "Windows":
+            if not exe_name.lower().endswith(".exe"):
+                exe = which(exe_name + ".exe")
+        elif exe_name.lower().endswith(".exe"):
+            exe = which(exe_name[:-4])
+    if exe is None:
+        raise Exception(
+            f"The program {exe_name} does not exist or is not executable."
+        )
+
+    if namefile is not None:
+        if not os.path.isfile(os.path.join(model_ws, namefile)):
+            raise Exception(
+                f"The namefile for this model does not exists: {namefile}"
+            )
+    return exe
+
+
+def _model_argv(exe_name, namefile, cargs):
+    """
+    Create the list of arguments used to run a model with Popen.
+    """
+    argv = [exe_name]
+    if namefile is not None:
+        argv.append(namefile)
+
+    # add additional arguments to Popen arguments
+    if cargs is not None:
+        if isinstance(cargs, str):
+            cargs = [cargs]
+        for t in cargs:
+            argv.append(t)
+    return argv
+
+
+def _normal_msg_list(normal_msg):
+    """
+    Convert normal_msg to a list of lower case str for comparison.
+    """
+    if isinstance(normal_msg, str):
+        normal_msg = [normal_msg]
+    return [s.lower() for s in normal_msg]
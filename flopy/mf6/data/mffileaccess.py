@@ -1,4 +1,5 @@
 import sys, inspect
+from collections import deque
 from copy import deepcopy
 import numpy as np
 from ..mfbase import MFDataException, VerbosityLevel
@@ -1280,8 +1281,17 @@ class MFFileAccessList(MFFileAccess):
         optional_line_info = []
         line_info_processed = False
         data_structs = struct.data_item_structures
+        # lines of a simple block read and converted in bulk
+        block_lines = None
         while line != "":
-            line = file_handle.readline()
+            if block_lines:
+                line, data_line_loaded = block_lines.popleft()
+                if data_line_loaded is not None:
+                    data_loaded.append(data_line_loaded)
+                    line_num += 1
+                    continue
+            else:
+                line = file_handle.readline()
             arr_line = PyListUtil.split_data_line(line)
             if not line or (
                 arr_line
@@ -1339,6 +1349,10 @@ class MFFileAccessList(MFFileAccess):
                                 optional_line_info.append(data_item)
                         else:
                             optional_line_info.append(data_item)
+                if block_lines is None and recarray_len == 1:
+                    # convert the rest of the block in bulk, lines that
+                    # can not be converted are processed below
+                    block_lines = self._read_simple_block(file_handle)
                 if MFComment.is_comment(arr_line, True):
                     arr_line.insert(0, "\n")
                     storage.add_data_line_comment(arr_line, line_num)
@@ -1924,6 +1938,199 @@ class MFFileAccessList(MFFileAccess):
                 data_loaded.append(data_line)
         return data_index, data_line
 
+    def _read_simple_block(self, file_handle):
+        """Read the remaining lines of a simple list block and convert them
+        in bulk.  Returns a deque of (line, data_line) tuples that ends with
+        the block's END line.  data_line is None for lines that must be
+        processed one at a time (comments, quoted or comma delimited text,
+        lines with an unexpected number of items, or values that can not be
+        converted)."""
+        lines = []
+        for line in iter(file_handle.readline, ""):
+            lines.append(line)
+            if line.lstrip()[:3].upper() == "END":
+                break
+        else:
+            # end of file
+            lines.append("")
+        converted = [None] * len(lines)
+        layouts = self._simple_block_layouts()
+        if layouts is None:
+            return deque(zip(lines, converted))
+
+        # group lines that can be converted in bulk by number of items
+        groups = {}
+        for line_index, line in enumerate(lines[:-1]):
+            tokens = line.split()
+            if len(tokens) in layouts:
+                group = groups.setdefault(len(tokens), ([], []))
+                group[0].append(line_index)
+                group[1].append(tokens)
+        for num_tokens, (line_indexes, rows) in groups.items():
+            text = "".join([lines[line_index] for line_index in line_indexes])
+            if any(char in text for char in "#,'\"!/"):
+                # skip comments and text that needs the full line parser
+                keep = [
+                    index
+                    for index, line_index in enumerate(line_indexes)
+                    if not any(char in lines[line_index] for char in "#,'\"")
+                    and rows[index][0][0] != "!"
+                    and rows[index][0][:2] != "//"
+                ]
+                line_indexes = [line_indexes[index] for index in keep]
+                rows = [rows[index] for index in keep]
+                if not rows:
+                    continue
+            data_lines = self._convert_simple_rows(
+                np.array(rows, dtype=str), layouts[num_tokens]
+            )
+            for line_index, data_line in zip(line_indexes, data_lines):
+                converted[line_index] = data_line
+        return deque(zip(lines, converted))
+
+    def _simple_block_layouts(self):
+        """Returns a dictionary of the fields of a simple list line for each
+        number of items a line can contain, or None if the line can not be
+        converted in bulk."""
+        data_structs = self.structure.data_item_structures
+        fields = []
+        cellid = []
+        num_tokens = 0
+        for index, entry in enumerate(self._last_line_info):
+            for sub_entry in entry:
+                if sub_entry[1] is None:
+                    fields.append(("none", None, None, None))
+                    continue
+                if sub_entry[0] != num_tokens:
+                    return None
+                num_tokens += 1
+                if sub_entry[2] > 0:
+                    cellid.append(sub_entry[0])
+                    if len(cellid) == sub_entry[2]:
+                        fields.append(
+                            ("cellid", tuple(cellid), sub_entry[1], None)
+                        )
+                        cellid = []
+                else:
+                    fields.append(
+                        (
+                            "value",
+                            sub_entry[0],
+                            sub_entry[1],
+                            data_structs[index],
+                        )
+                    )
+        if cellid:
+            return None
+
+        # optional auxiliary variables and boundname
+        layouts = {num_tokens: fields}
+        package_dim = self._data_dimensions.package_dim
+        for data_item in data_structs[len(self._last_line_info) :]:
+            if data_item.name == "aux":
+                aux_var_names = package_dim.get_aux_variables()
+                if aux_var_names is None:
+                    continue
+                aux_fields = []
+                for var_name in aux_var_names[0]:
+                    if var_name.lower() != "auxiliary":
+                        aux_fields.append(
+                            ("value", num_tokens, data_item.type, data_item)
+                        )
+                        num_tokens += 1
+                if not aux_fields:
+                    continue
+                fields = fields + aux_fields
+            elif data_item.name == "boundname" and package_dim.boundnames():
+                fields = fields + [
+                    ("value", num_tokens, data_item.type, data_item)
+                ]
+                num_tokens += 1
+            else:
+                continue
+            layouts[num_tokens] = fields
+        return layouts
+
+    def _convert_simple_rows(self, table, fields):
+        """Converts the items of simple list lines, stored as a two
+        dimensional array of text with a row for each line, a column at a
+        time.  Returns a list with a data line tuple for each row, or None
+        for rows that could not be converted."""
+        num_rows = table.shape[0]
+        bad = np.zeros(num_rows, dtype=bool)
+        columns = []
+        for kind, token_index, data_type, data_item in fields:
+            if kind == "none":
+                columns.append([None] * num_rows)
+            elif kind == "cellid":
+                parts = []
+                for index in token_index:
+                    values = self._convert_simple_column(
+                        table[:, index], DatumType.integer, bad
+                    )
+                    parts.append((values - 1).tolist())
+                columns.append(list(zip(*parts)))
+            else:
+                column = table[:, token_index]
+                if data_type == DatumType.string:
+                    if data_item is None or not data_item.preserve_case:
+                        column = np.char.lower(column)
+                    columns.append(column.tolist())
+                elif (
+                    data_type == DatumType.double_precision
+                    and not data_item.support_negative_index
+                ) or (
+                    data_type == DatumType.integer
+                    and not data_item.numeric_index
+                ):
+                    columns.append(
+                        self._convert_simple_column(
+                            column, data_type, bad, data_item
+                        ).tolist()
+                    )
+                else:
+                    columns.append(
+                        self._convert_simple_items(
+                            column.tolist(), data_type, bad, data_item
+                        )
+                    )
+        data_lines = list(zip(*columns))
+        for index in np.flatnonzero(bad):
+            data_lines[index] = None
+        return data_lines
+
+    def _convert_simple_column(self, column, data_type, bad, data_item=None):
+        """Converts a column of numeric text to a numpy array, converting
+        items one at a time if the column can not be converted at once.
+        Items that can not be converted are flagged in bad."""
+        dtype = np.float64 if data_type == DatumType.double_precision else int
+        try:
+            return column.astype(dtype)
+        except (ValueError, TypeError, OverflowError):
+            values = self._convert_simple_items(
+                column.tolist(), data_type, bad, data_item
+            )
+            return np.array(
+                [0 if value is None else value for value in values],
+                dtype=dtype,
+            )
+
+    def _convert_simple_items(self, column, data_type, bad, data_item=None):
+        """Converts a column of text one item at a time with convert_data.
+        Items that can not be converted are flagged in bad."""
+        values = []
+        for index, item in enumerate(column):
+            try:
+                values.append(
+                    convert_data(
+                        item, self._data_dimensions, data_type, data_item
+                    )
+                )
+            except (MFDataException, ValueError, TypeError):
+                values.append(None)
+                bad[index] = True
+        return values
+
     def _process_aux(
         self,
         storage,
@@ -77,6 +77,8 @@ class MFModel(PackageContainer, ModelInterface):
         **kwargs,
     ):
         super().__init__(simulation.simulation_data, modelname)
+        # packages not yet loaded from file by a lazy load
+        self._deferred_packages = []
         self.simulation = simulation
         self.simulation_data = simulation.simulation_data
         self.name = modelname
@@ -522,8 +524,21 @@ class MFModel(PackageContainer, ModelInterface):
     @property
     def packagelist(self):
         """List of model packages."""
+        self._load_deferred_packages()
         return self._packagelist
 
+    @property
+    def package_dict(self):
+        """Returns a copy of the package name dictionary."""
+        self._load_deferred_packages()
+        return super().package_dict
+
+    @property
+    def package_names(self):
+        """Returns a list of package names."""
+        self._load_deferred_packages()
+        return super().package_names
+
     @property
     def namefile(self):
         """Model namefile object."""
@@ -678,6 +693,7 @@ class MFModel(PackageContainer, ModelInterface):
         strict=True,
         model_rel_path=".",
         load_only=None,
+        lazy_load=False,
     ):
         """
         Class method that loads an existing model.
@@ -711,6 +727,12 @@ class MFModel(PackageContainer, ModelInterface):
             setting. subpackages, like time series and observations, will also
             load regardless of this setting.
             example list: ['ic', 'maw', 'npf', 'oc', 'my_well_package_1']
+        lazy_load : bool
+            defer loading packages, other than the discretization packages,
+            until they are first accessed. get_package() and package
+            attributes only load the packages requested, while packagelist,
+            write(), and other operations on all packages load all of the
+            remaining packages.
 
         Returns
         -------
@@ -782,6 +804,14 @@ class MFModel(PackageContainer, ModelInterface):
                     # strip off model relative path from the file path
                     filemgr = simulation.simulation_data.mfpath
                     fname = filemgr.strip_model_relative_path(modelname, fname)
+                if lazy_load and not instance._in_pkg_list(
+                    priority_packages, ftype_orig, pname
+                ):
+                    # load package when it is first accessed
+                    instance._deferred_packages.append(
+                        (ftype, fname, pname, strict)
+                    )
+                    continue
                 if (
                     simulation.simulation_data.verbosity_level.value
                     >= VerbosityLevel.normal.value
@@ -1308,6 +1338,9 @@ class MFModel(PackageContainer, ModelInterface):
         path, package structure : tuple, MFPackageStructure
 
         """
+        if not package.loading_package:
+            # load deferred packages before a new package can replace them
+            self._load_deferred_packages()
         package.container_type = [PackageContainerType.model]
         if package.parent_file is not None:
             path = package.parent_file.path + (package.package_type,)
@@ -1412,6 +1445,60 @@ class MFModel(PackageContainer, ModelInterface):
                 )
         return None, None
 
+    def _load_deferred_packages(self, name=None):
+        """Loads packages deferred by a lazy load.  If name is None all
+        deferred packages are loaded, otherwise only deferred packages with
+        a package type matching name are loaded.  For internal FloPy use,
+        not intended for end user."""
+        if not self._deferred_packages:
+            return
+        if name is None:
+            ftypes = {item[0] for item in self._deferred_packages}
+        else:
+            # load all packages of a matching type so multi-package names
+            # are numbered in the same order as a full load
+            name = name.lower()
+            ftypes = set()
+            for ftype, fname, pname, strict in self._deferred_packages:
+                if name.startswith(ftype) or (
+                    pname is not None and pname.lower().startswith(name)
+                ):
+                    ftypes.add(ftype)
+            if not ftypes:
+                return
+        packages = [
+            item for item in self._deferred_packages if item[0] in ftypes
+        ]
+        self._deferred_packages = [
+            item for item in self._deferred_packages if item[0] not in ftypes
+        ]
+        for ftype, fname, pname, strict in packages:
+            if (
+                self.simulation_data.verbosity_level.value
+                >= VerbosityLevel.normal.value
+            ):
+                print(f"    loading package {ftype}...")
+            self.load_package(ftype, fname, pname, strict, None)
+
+    def get_package(self, name=None):
+        """
+        Finds a package by package name, package key, package type, or partial
+        package name. returns either a single package, a list of packages,
+        or None.  Packages deferred by a lazy load are loaded first.
+
+        Parameters
+        ----------
+        name : str
+            Name of the package, 'RIV', 'LPF', etc.
+
+        Returns
+        -------
+        pp : Package object
+
+        """
+        self._load_deferred_packages(name)
+        return super().get_package(name)
+
     def load_package(
         self,
         ftype,
@@ -123,6 +123,7 @@ class ModflowGwf(mfmodel.MFModel):
         strict=True,
         model_rel_path=".",
         load_only=None,
+        lazy_load=False,
     ):
         return mfmodel.MFModel.load_base(
             simulation,
@@ -135,4 +136,5 @@ class ModflowGwf(mfmodel.MFModel):
             strict,
             model_rel_path,
             load_only,
+            lazy_load,
         )
@@ -602,6 +602,7 @@ class MFSimulation(PackageContainer):
         load_only=None,
         verify_data=False,
         write_headers=True,
+        lazy_load=False,
     ):
         """
         Load an existing model.
@@ -638,6 +639,11 @@ class MFSimulation(PackageContainer):
         write_headers: bool
             When true flopy writes a header to each package file indicating
             that it was created by flopy
+        lazy_load : bool
+            Defer loading model packages, other than the discretization
+            packages, until they are first accessed. This makes loading
+            fast when only a few packages are needed, for example to get
+            the model grid.
 
         Returns
         -------
@@ -719,6 +725,7 @@ class MFSimulation(PackageContainer):
                 strict,
                 path,
                 load_only,
+                lazy_load,
             )
 
         # load exchange packages and dependent packages
@@ -2,5 +2,9 @@
 from . import createpackages
 from .generate_classes import generate_classes
 from .binarygrid_util import MfGrdFile
-from .postprocessing import get_structured_faceflows, get_residuals
+from .postprocessing import (
+    get_structured_faceflows,
+    iter_structured_faceflows,
+    get_residuals,
+)
 from .lakpak_utils import get_lak_connections
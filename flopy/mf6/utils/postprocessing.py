@@ -1,9 +1,12 @@
+import os
+from functools import lru_cache
+
 import numpy as np
 from .binarygrid_util import MfGrdFile
 
 
 def get_structured_faceflows(
-    flowja, grb_file=None, ia=None, ja=None, verbose=False
+    flowja, grb_file=None, ia=None, ja=None, shape=None, verbose=False
 ):
     """
     Get the face flows for the flow right face, flow front face, and
@@ -11,16 +14,25 @@ def get_structured_faceflows(
     be useful for building face flow arrays for MT3DMS, MT3D-USGS, and
     RT3D. This method only works for a structured MODFLOW 6 model.
 
+    The connection maps derived from ia and ja are cached for each binary
+    grid file, so repeated calls for different time steps only index into
+    flowja. Connection maps for ia and ja arrays are not cached.
+
     Parameters
     ----------
     flowja : ndarray
-        flowja array for a structured MODFLOW 6 model
-    grbfile : str
-        MODFLOW 6 binary grid file path
+        flowja array for a structured MODFLOW 6 model. flowja can also be
+        a stack of flowja arrays of shape (ntimes, ..., nja), in which
+        case face flows for all of the stacked arrays are returned.
+    grbfile : str or MfGrdFile
+        MODFLOW 6 binary grid file path or MfGrdFile object
     ia : list or ndarray
         CRS row pointers. Only required if grb_file is not provided.
     ja : list or ndarray
         CRS column pointers. Only required if grb_file is not provided.
+    shape : tuple
+        shape of the structured grid (nlay, nrow, ncol). Only required if
+        grb_file is not provided.
     verbose: bool
         Write information to standard output
 
@@ -33,15 +45,13 @@ def get_structured_faceflows(
     flf : ndarray
         lower face flows
 
+    Face flow arrays have a shape of (nlay, nrow, ncol) for a single
+    flowja array and (ntimes, nlay, nrow, ncol) for stacked flowja arrays.
+
     """
     if grb_file is not None:
-        grb = MfGrdFile(grb_file, verbose=verbose)
-        if grb.grid_type != "DIS":
-            raise ValueError(
-                "get_structured_faceflows method "
-                "is only for structured DIS grids"
-            )
-        ia, ja = grb.ia, grb.ja
+        grb, index = _get_structured_connections(grb_file, verbose=verbose)
+        ia, ja, shape = grb.ia, grb.ja, grb.shape
     else:
         if ia is None or ja is None:
             raise ValueError(
@@ -49,35 +59,86 @@ def get_structured_faceflows(
                 "binary grid file name is not specified."
             )
 
-    # flatten flowja, if necessary
-    if len(flowja.shape) > 0:
-        flowja = flowja.flatten()
-
     # evaluate size of flowja relative to ja
-    __check_flowja_size(flowja, ja)
-
-    # create face flow arrays
-    shape = (grb.nlay, grb.nrow, grb.ncol)
-    frf = np.zeros(shape, dtype=float).flatten()
-    fff = np.zeros(shape, dtype=float).flatten()
-    flf = np.zeros(shape, dtype=float)
-
-    # fill flow terms
-    vmult = [-1.0, -1.0, -1.0]
-    flows = [frf, fff, flf]
-    for n in range(grb.nodes):
-        i0, i1 = ia[n] + 1, ia[n + 1]
-        ipos = 0
-        for j in range(i0, i1):
-            jcol = ja[j]
-            if jcol > n:
-                flows[ipos][n] = vmult[ipos] * flowja[j]
-                ipos += 1
-    # reshape flow terms
-    frf = frf.reshape(shape)
-    fff = fff.reshape(shape)
-    flf = flf.reshape(shape)
-    return frf, fff, flf
+    flowja = __reshape_flowja(flowja, ja)
+
+    if grb_file is None:
+        if shape is None:
+            raise ValueError(
+                "shape must be specified if the MODFLOW 6 binary grid "
+                "file name is not specified."
+            )
+        shape = tuple(shape)
+        if len(ia) - 1 != np.prod(shape):
+            raise ValueError(
+                f"size of ia ({len(ia)}) not equal to number of nodes in "
+                f"shape {shape} plus one"
+            )
+        index = _structured_faceflow_index(ia, ja, shape)
+
+    return __fill_faceflows(flowja, shape, index)
+
+
+def iter_structured_faceflows(
+    cbcobj, grb_file, text="FLOW-JA-FACE", chunk=1, verbose=False
+):
+    """
+    Iterate over the structured face flows for every FLOW-JA-FACE record
+    in a MODFLOW 6 cell budget file.
+
+    Only one block of records is held in memory at a time and the
+    connection maps derived from ia and ja are only built once.
+
+    Parameters
+    ----------
+    cbcobj : CellBudgetFile
+        MODFLOW 6 cell budget file object
+    grbfile : str or MfGrdFile
+        MODFLOW 6 binary grid file path or MfGrdFile object
+    text : str
+        budget record text for the flowja records (default is
+        "FLOW-JA-FACE")
+    chunk : int
+        Maximum number of records in each block. (Default is 1.)
+    verbose: bool
+        Write information to standard output
+
+    Yields
+    ------
+    kstpkper : list of tuples
+        Zero-based (kstp, kper) for each record in the block.
+    totim : numpy array
+        Simulation time of each record in the block.
+    frf : ndarray
+        right face flows of shape (n, nlay, nrow, ncol), where n is the
+        number of records in the block
+    fff : ndarray
+        front face flows of shape (n, nlay, nrow, ncol)
+    flf : ndarray
+        lower face flows of shape (n, nlay, nrow, ncol)
+
+    Examples
+    --------
+    >>> import flopy
+    >>> cbc = flopy.utils.CellBudgetFile("model.cbc")
+    >>> frfmax = 0.0
+    >>> for kstpkper, totim, frf, fff, flf in (
+    ...     flopy.mf6.utils.iter_structured_faceflows(
+    ...         cbc, "model.dis.grb", chunk=10
+    ...     )
+    ... ):
+    ...     frfmax = np.maximum(frfmax, frf.max(axis=0))
+
+    """
+    grb, index = _get_structured_connections(grb_file, verbose=verbose)
+    for kstpkper, totim, flowja in cbcobj.iter_records(text=text, chunk=chunk):
+        if isinstance(flowja, list):
+            flowja = np.array([np.ravel(v) for v in flowja])
+        flowja = __reshape_flowja(
+            flowja.reshape(len(kstpkper), -1), grb.ja, stack=True
+        )
+        frf, fff, flf = __fill_faceflows(flowja, grb.shape, index)
+        yield kstpkper, totim, frf, fff, flf
 
 
 def get_residuals(
@@ -90,9 +151,10 @@ def get_residuals(
     Parameters
     ----------
     flowja : ndarray
-        flowja array for a structured MODFLOW 6 model
-    grbfile : str
-        MODFLOW 6 binary grid file path
+        flowja array for a structured MODFLOW 6 model. flowja can also be
+        a stack of flowja arrays of shape (ntimes, ..., nja).
+    grbfile : str or MfGrdFile
+        MODFLOW 6 binary grid file path or MfGrdFile object
     ia : list or ndarray
         CRS row pointers. Only required if grb_file is not provided.
     ja : list or ndarray
@@ -110,7 +172,7 @@ def get_residuals(
 
     """
     if grb_file is not None:
-        grb = MfGrdFile(grb_file, verbose=verbose)
+        grb = _get_grb(grb_file, verbose=verbose)
         shape = grb.shape
         ia, ja = grb.ia, grb.ja
     else:
@@ -120,37 +182,121 @@ def get_residuals(
                 "binary grid file name is not specified."
             )
 
-    # flatten flowja, if necessary
-    if len(flowja.shape) > 0:
-        flowja = flowja.flatten()
-
     # evaluate size of flowja relative to ja
-    __check_flowja_size(flowja, ja)
-
-    # create residual
-    nodes = grb.nodes
-    residual = np.zeros(nodes, dtype=float)
+    flowja = __reshape_flowja(flowja, ja)
 
-    # fill flow terms
-    for n in range(nodes):
-        i0, i1 = ia[n], ia[n + 1]
-        if i0 < i1:
-            residual[n] = flowja[i0]
-        else:
-            residual[n] = np.nan
+    # the residual is the diagonal, which is the first entry of each row
+    ia = np.asarray(ia)
+    diagonal = ia[:-1]
+    residual = np.full(flowja.shape[:-1] + diagonal.shape, np.nan)
+    active = diagonal < ia[1:]
+    residual[..., active] = flowja[..., diagonal[active]]
 
     # reshape residual terms
     if shape is not None:
-        residual = residual.reshape(shape)
+        residual = residual.reshape(flowja.shape[:-1] + tuple(shape))
     return residual
 
 
 # internal
-def __check_flowja_size(flowja, ja):
+def _get_grb(grb_file, verbose=False):
+    """
+    Return a MfGrdFile object for a binary grid file path or object.
     """
-    Check the shape of flowja relative to ja.
+    if isinstance(grb_file, MfGrdFile):
+        return grb_file
+    fpth = os.path.abspath(grb_file)
+    return _load_structured_connections(fpth, os.path.getmtime(fpth), verbose)[
+        0
+    ]
+
+
+def _get_structured_connections(grb_file, verbose=False):
     """
-    if flowja.shape != ja.shape:
+    Return the MfGrdFile object and structured face connection maps for
+    a binary grid file path or MfGrdFile object. Maps for binary grid files
+    are cached until the file is modified.
+    """
+    if isinstance(grb_file, MfGrdFile):
+        grb = grb_file
+        index = None
+    else:
+        fpth = os.path.abspath(grb_file)
+        grb, index = _load_structured_connections(
+            fpth, os.path.getmtime(fpth), verbose
+        )
+    if grb.grid_type != "DIS":
         raise ValueError(
-            f"size of flowja ({flowja.shape}) not equal to {ja.shape}"
+            "get_structured_faceflows method "
+            "is only for structured DIS grids"
         )
+    if index is None:
+        index = _structured_faceflow_index(grb.ia, grb.ja, grb.shape)
+    return grb, index
+
+
+@lru_cache(maxsize=8)
+def _load_structured_connections(fpth, mtime, verbose):
+    """
+    Read a binary grid file and build its structured face connection maps.
+    The file modification time is part of the cache key.
+    """
+    grb = MfGrdFile(fpth, verbose=verbose)
+    index = None
+    if grb.grid_type == "DIS":
+        index = _structured_faceflow_index(grb.ia, grb.ja, grb.shape)
+    return grb, index
+
+
+def _structured_faceflow_index(ia, ja, shape):
+    """
+    Build the right, front, and lower face connection maps for a
+    structured grid from the CRS ia and ja arrays. Each map is a tuple of
+    (node, position) arrays, where position is the location of the
+    connection from node to its right, front, or lower neighbor in ja.
+    Lower connections include connections through pass-through cells.
+    """
+    ia = np.asarray(ia)
+    ja = np.asarray(ja)
+    n = np.repeat(np.arange(ia.shape[0] - 1), np.diff(ia))
+    k0, i0, j0 = np.unravel_index(n, shape)
+    k1, i1, j1 = np.unravel_index(ja, shape)
+    upper = ja > n
+    right = upper & (k0 == k1) & (i0 == i1) & (j1 == j0 + 1)
+    front = upper & (k0 == k1) & (j0 == j1) & (i1 == i0 + 1)
+    lower = upper & (i0 == i1) & (j0 == j1) & (k1 > k0)
+    index = []
+    for connected in (right, front, lower):
+        pos = np.nonzero(connected)[0]
+        index.append((n[pos], pos))
+    return tuple(index)
+
+
+def __fill_faceflows(flowja, shape, index):
+    """
+    Scatter flat or stacked flowja arrays into right, front, and lower
+    face flow arrays using the structured face connection maps.
+    """
+    nodes = int(np.prod(shape))
+    flows = []
+    for node, pos in index:
+        q = np.zeros(flowja.shape[:-1] + (nodes,), dtype=float)
+        q[..., node] = -flowja[..., pos]
+        flows.append(q.reshape(flowja.shape[:-1] + tuple(shape)))
+    return tuple(flows)
+
+
+def __reshape_flowja(flowja, ja, stack=False):
+    """
+    Check the size of flowja relative to ja and return flowja as a flat
+    array or as a stack of flat arrays of shape (ntimes, nja). Any array
+    of size nja, such as a (1, 1, nja) budget record, is a single flowja
+    record unless stack is True.
+    """
+    flowja = np.asarray(flowja)
+    nja = len(ja)
+    if flowja.size == nja and not stack:
+        return flowja.ravel()
+    if flowja.ndim > 1 and flowja.size > 0 and flowja.shape[-1] == nja:
+        return flowja.reshape(-1, nja)
+    raise ValueError(f"size of flowja ({flowja.shape}) not equal to {nja}")
@@ -1,9 +1,11 @@
 __author__ = "aleaf"
 
 import os
+import time
 import numpy as np
 import warnings
 import copy
+from collections.abc import Mapping
 from numpy.lib import recfunctions
 from ..pakbase import Package
 from ..utils import MfList
@@ -386,6 +388,7 @@ class ModflowSfr2(Package):
 
         self.url = "sfr2.htm"
         self._graph = None  # dict of routing connections
+        self._graph_key = None  # routing in segment_data of the graph
 
         # Dataset 0
         self._generate_heading()
@@ -556,7 +559,7 @@ class ModflowSfr2(Package):
         assert isfropt in [0, 1, 2, 3, 4, 5]
 
         # derived attributes
-        self._paths = None
+        self._routing = None
 
         self.parent.add_package(self)
 
@@ -568,6 +571,7 @@ class ModflowSfr2(Package):
         elif key == "segment_data":
             super().__setattr__("segment_data", value)
             self._dataset_5 = None
+            self._graph = None
         elif key == "const":
             super().__setattr__("_const", value)
         else:  # return to default behavior of pakbase
@@ -622,33 +626,34 @@ class ModflowSfr2(Package):
 
     @property
     def graph(self):
-        """Dictionary of routing connections between segments."""
-        if self._graph is None:
+        """Dictionary of routing connections between segments. The
+        dictionary is remade if the segment or outseg numbers in
+        segment_data were changed."""
+        key = self._routing_key()
+        if self._graph is None or key != self._graph_key:
             self._graph = self._make_graph()
+            self._graph_key = key
         return self._graph
 
     @property
     def paths(self):
-        if self._paths is None:
-            self._set_paths()
-            return self._paths
-        # check to see if routing in segment data was changed
-        nseg = np.array(sorted(self._paths.keys()), dtype=int)
-        nseg = nseg[nseg > 0].copy()
-        outseg = np.array([self._paths[k][1] for k in nseg])
-        existing_nseg = sorted(list(self.graph.keys()))
-        existing_outseg = [self.graph[k] for k in existing_nseg]
-        if not np.array_equal(nseg, existing_nseg) or not np.array_equal(
-            outseg, existing_outseg
-        ):
-            self._set_paths()
-        return self._paths
+        """Dictionary of routing paths from each segment to the outlet (0).
+        Paths are None for segments with circular routing."""
+        return self._get_routing().paths
 
     @property
     def df(self):
         pd = import_optional_dependency("pandas")
         return pd.DataFrame(self.reach_data)
 
+    def _routing_key(self):
+        """Segment and outseg numbers in segment_data, to find in-place
+        changes to the routing."""
+        return [
+            (per, sd["nseg"].tobytes(), sd["outseg"].tobytes())
+            for per, sd in self.segment_data.items()
+        ]
+
     def _make_graph(self):
         # get all segments and their outseg
         graph = {}
@@ -661,9 +666,13 @@ class ModflowSfr2(Package):
         graph.update({o: 0 for o in outlets if o != 0})
         return graph
 
-    def _set_paths(self):
+    def _get_routing(self):
+        """Routing network for the current graph. The network is rebuilt
+        if the routing connections in the graph were changed."""
         graph = self.graph
-        self._paths = {seg: find_path(graph, seg) for seg in graph.keys()}
+        if self._routing is None or not self._routing.matches(graph):
+            self._routing = _RoutingGraph(graph)
+        return self._routing
 
     def _get_flag(self, flagname):
         """
@@ -1072,23 +1081,31 @@ class ModflowSfr2(Package):
 
         Returns
         -------
-        None
+        chk : check object
+            Results of the checks. The time taken by each check is
+            in the timings attribute (see check.timing_report).
 
         Examples
         --------
 
         >>> import flopy
         >>> m = flopy.modflow.Modflow.load('model.nam')
-        >>> m.sfr2.check()
+        >>> chk = m.sfr2.check()
+        >>> print(chk.timing_report())
         """
         self._graph = None  # remake routing graph from segment data
         chk = check(self, verbose=verbose, level=level)
-        chk.for_nans()
-        chk.numbering()
-        chk.routing()
-        chk.overlapping_conductance()
-        chk.elevations()
-        chk.slope()
+        for run_check in (
+            chk.for_nans,
+            chk.numbering,
+            chk.routing,
+            chk.overlapping_conductance,
+            chk.elevations,
+            chk.slope,
+        ):
+            t0 = time.perf_counter()
+            run_check()
+            chk.timings[run_check.__name__] = time.perf_counter() - t0
 
         if f is not None:
             if isinstance(f, str):
@@ -1200,6 +1217,9 @@ class ModflowSfr2(Package):
         Traces all routing connections from each headwater to the outlet.
         """
         txt = ""
+        routing = self._get_routing()
+        outlets = routing.outlets
+        ncol = routing.path_lengths.max(initial=0)
         for per in range(self.nper):
             if (
                 per > 0 > self.dataset_5[per][0]
@@ -1266,13 +1286,16 @@ class ModflowSfr2(Package):
             #
             # use graph instead of above loop
             nrow = len(self.segment_data[per].nseg)
-            ncol = np.max(
-                [len(v) if v is not None else 0 for v in self.paths.values()]
-            )
             all_outsegs = np.zeros((nrow, ncol), dtype=int)
-            for i, (k, v) in enumerate(self.paths.items()):
-                if k > 0:
-                    all_outsegs[i, : len(v)] = v
+            # fill in the paths of all segments one column at a time
+            rows = np.flatnonzero(
+                (routing.nseg > 0) & (routing.path_lengths > 0)
+            )
+            pos = rows
+            for col in range(ncol):
+                all_outsegs[rows, col] = routing.nseg[pos]
+                downstream = routing.down[pos] >= 0
+                rows, pos = rows[downstream], routing.down[pos[downstream]]
             all_outsegs.sort(axis=0)
             self.outsegs[per] = all_outsegs
             # create a dictionary listing outlets associated with each segment
@@ -1282,8 +1305,7 @@ class ModflowSfr2(Package):
             # else i + 1
             #                     for i, r in enumerate(all_outsegs.T)}
             self.outlets[per] = {
-                k: self.paths[k][-1] if k in self.paths else k
-                for k in self.segment_data[per].nseg
+                k: outlets.get(k, k) for k in self.segment_data[per].nseg
             }
         return txt
 
@@ -1313,20 +1335,17 @@ class ModflowSfr2(Package):
         reach1IDs = dict(
             zip(rd[rd.ireach == 1].iseg, rd[rd.ireach == 1].reachID)
         )
-        outreach = []
-        for i in range(len(rd)):
-            # if at the end of reach data or current segment
-            if i + 1 == len(rd) or rd.ireach[i + 1] == 1:
-                nextseg = outseg[rd.iseg[i]]  # get next segment
-                if nextseg > 0:  # current reach is not an outlet
-                    nextrchid = reach1IDs[
-                        nextseg
-                    ]  # get reach 1 of next segment
-                else:
-                    nextrchid = 0
-            else:  # otherwise, it's the next reachID
-                nextrchid = rd.reachID[i + 1]
-            outreach.append(nextrchid)
+        # reaches route to the next reachID, except for the last reach
+        # of each segment, which routes to reach 1 of the next segment
+        outreach = np.zeros(len(rd), dtype=rd.reachID.dtype)
+        outreach[:-1] = rd.reachID[1:]
+        last = np.ones(len(rd), dtype=bool)
+        last[:-1] = rd.ireach[1:] == 1
+        nextsegs = [outseg[s] for s in rd.iseg[last].tolist()]
+        outreach[last] = [
+            reach1IDs[s] if s > 0 else 0  # current reach is an outlet
+            for s in nextsegs
+        ]
         self.reach_data["outreach"] = outreach
 
     def get_slopes(
@@ -1390,7 +1409,8 @@ class ModflowSfr2(Package):
 
         Notes
         -----
-        This method will not work if there are instances of circular routing.
+        Segments that are part of circular routing, or upstream of it, are
+        not included.
 
         """
         all_upsegs = {}
@@ -1400,38 +1420,27 @@ class ModflowSfr2(Package):
             ):  # skip stress periods where seg data not defined
                 continue
             segment_data = self.segment_data[per]
-
-            # make a list of adjacent upsegments keyed to outseg list in Mat2
-            upsegs = {
-                o: segment_data.nseg[segment_data.outseg == o].tolist()
-                for o in np.unique(segment_data.outseg)
-            }
-
-            outsegs = [
-                k for k in list(upsegs.keys()) if k > 0
-            ]  # exclude 0, which is the outlet designator
-
-            # for each outseg key, for each upseg, check for more upsegs,
-            # append until headwaters has been reached
-            for outseg in outsegs:
-
-                up = True
-                upsegslist = upsegs[outseg]
-                while up:
-                    added_upsegs = []
-                    for us in upsegslist:
-                        if us in outsegs:
-                            added_upsegs += upsegs[us]
-                    if len(added_upsegs) == 0:
-                        up = False
-                        break
-                    else:
-                        upsegslist = added_upsegs
-                        upsegs[outseg] += added_upsegs
-
-            # the above algorithm is recursive, so lower order streams
-            # get duplicated many times use a set to get unique upsegs
-            all_upsegs[per] = {u: list(set(upsegs[u])) for u in outsegs}
+            nseg = segment_data.nseg.tolist()
+            outseg = segment_data.outseg.tolist()
+
+            # all segments upstream of each segment, from the headwaters
+            # down, for segments that are not part of circular routing
+            upstream = _RoutingGraph(dict(zip(nseg, outseg))).upstream()
+
+            # make a list of adjacent upsegments keyed to outseg
+            adjacent = {}
+            for s, o in zip(nseg, outseg):
+                adjacent.setdefault(o, []).append(s)
+
+            upsegs = {}
+            for o in np.unique(segment_data.outseg):
+                if o > 0:  # exclude 0, which is the outlet designator
+                    up = set()
+                    for us in adjacent[o]:
+                        up.add(us)
+                        up |= upstream[us]
+                    upsegs[o] = list(up)
+            all_upsegs[per] = upsegs
         return all_upsegs
 
     def get_variable_by_stress_period(self, varname):
@@ -1487,6 +1496,11 @@ class ModflowSfr2(Package):
         r1[0] = 0
         outseg2 = np.array([r1[s] for s in outseg])
 
+        # adjacent upsegs of each outseg, in order of segment number
+        adjacent = {}
+        for s, o in zip(nseg2.tolist(), outseg2.tolist()):
+            adjacent.setdefault(o, []).append(s)
+
         # function re-assigning upseg numbers consecutively at one level
         # relative to outlet(s).  Counts down from the number of segments
         def reassign_upsegs(r, nexts, upsegs):
@@ -1494,7 +1508,7 @@ class ModflowSfr2(Package):
             for u in upsegs:
                 r[u] = nexts if u > 0 else u  # handle lakes
                 nexts -= 1
-                nextupsegs += list(nseg2[outseg2 == u])
+                nextupsegs += adjacent.get(u, [])
             return r, nexts, nextupsegs
 
         ns = len(nseg)
@@ -1504,7 +1518,7 @@ class ModflowSfr2(Package):
         # until all headwaters have been reached
         nexts = ns
         r2 = {0: 0}
-        nextupsegs = nseg2[outseg2 == 0]
+        nextupsegs = adjacent.get(0, [])
         for _ in range(ns):
             r2, nexts, nextupsegs = reassign_upsegs(r2, nexts, nextupsegs)
             if len(nextupsegs) == 0:
@@ -1515,10 +1529,10 @@ class ModflowSfr2(Package):
         # renumber segments in all stress period data
         for per in self.segment_data.keys():
             self.segment_data[per]["nseg"] = [
-                r.get(s, s) for s in self.segment_data[per].nseg
+                r.get(s, s) for s in self.segment_data[per].nseg.tolist()
             ]
             self.segment_data[per]["outseg"] = [
-                r.get(s, s) for s in self.segment_data[per].outseg
+                r.get(s, s) for s in self.segment_data[per].outseg.tolist()
             ]
             self.segment_data[per].sort(order="nseg")
             nseg = self.segment_data[per].nseg
@@ -1532,7 +1546,9 @@ class ModflowSfr2(Package):
         self._graph = None  # reset routing dict
 
         # renumber segments in reach_data
-        self.reach_data["iseg"] = [r.get(s, s) for s in self.reach_data.iseg]
+        self.reach_data["iseg"] = [
+            r.get(s, s) for s in self.reach_data.iseg.tolist()
+        ]
         self.reach_data.sort(order=["iseg", "ireach"])
         self.reach_data["reachID"] = np.arange(1, len(self.reach_data) + 1)
         self.set_outreaches()  # reset the outreaches to ensure continuity
@@ -1697,34 +1713,68 @@ class ModflowSfr2(Package):
         segment_data = self.segment_data[per]
         segment_data.sort(order="nseg")
         reach_data.sort(order=["iseg", "ireach"])
-        reach_values = []
-        for seg in segment_data.nseg:
-            reaches = reach_data[reach_data.iseg == seg]
-            dist = np.cumsum(reaches.rchlen) - 0.5 * reaches.rchlen
-            icalc = segment_data.icalc[segment_data.nseg == seg]
+
+        # reaches of each segment, in order of segment number
+        reaches = reach_data[np.in1d(reach_data.iseg, segment_data.nseg)]
+        iseg = reaches.iseg
+        segidx = np.searchsorted(segment_data.nseg, iseg)
+        _, first, nreaches = np.unique(
+            iseg, return_index=True, return_counts=True
+        )
+        start = np.repeat(first, nreaches)
+        end = start + np.repeat(nreaches, nreaches) - 1
+
+        # distance to the reach midpoints along each segment; segments
+        # with the same number of reaches are summed together
+        dist = np.zeros(len(reaches), dtype=reaches.rchlen.dtype)
+        for n in np.unique(nreaches):
+            inds = first[nreaches == n][:, np.newaxis] + np.arange(n)
+            rchlen = reaches.rchlen[inds]
+            dist[inds] = np.cumsum(rchlen, axis=1) - 0.5 * rchlen
+
+        # interpolate between the segment end values (as in np.interp)
+        x = dist.astype(float)
+        x0 = x[start]
+        x1 = x[end]
+        fp0 = segment_data[segvar1][segidx].astype(float)
+        fp1 = segment_data[segvar2][segidx].astype(float)
+        with np.errstate(all="ignore"):
+            reach_values = (fp1 - fp0) / (x1 - x0) * (x - x0) + fp0
+        reach_values[x == x0] = fp0[x == x0]
+        reach_values[x == x1] = fp1[x == x1]
+        irregular = (
+            ((x0 >= x1) & (start != end))
+            | (x < x0)
+            | (x > x1)
+            | np.isnan(reach_values)
+        )
+        for i0, i1 in set(zip(start[irregular], end[irregular] + 1)):
+            reach_values[i0:i1] = np.interp(
+                x[i0:i1], [x[i0], x[i1 - 1]], [fp0[i0], fp1[i0]]
+            )
+
+        if "width" in segvar1:
+            icalc = segment_data.icalc[segidx]
             # get width from channel cross section length
-            if "width" in segvar1 and icalc == 2:
+            if np.any(icalc == 2):
                 channel_geometry_data = self.channel_geometry_data[per]
-                reach_values += list(
-                    np.ones(len(reaches)) * channel_geometry_data[seg][0][-1]
-                )
+                reach_values[icalc == 2] = [
+                    channel_geometry_data[seg][0][-1]
+                    for seg in iseg[icalc == 2].tolist()
+                ]
             # assign arbitrary width since width is based on flow
-            elif "width" in segvar1 and icalc == 3:
-                reach_values += list(np.ones(len(reaches)) * 5)
+            reach_values[icalc == 3] = 5
             # assume width to be mean from streamflow width/flow table
-            elif "width" in segvar1 and icalc == 4:
+            if np.any(icalc == 4):
                 channel_flow_data = self.channel_flow_data[per]
-                reach_values += list(
-                    np.ones(len(reaches)) * np.mean(channel_flow_data[seg][2])
-                )
-            else:
-                fp = [
-                    segment_data[segment_data["nseg"] == seg][segvar1][0],
-                    segment_data[segment_data["nseg"] == seg][segvar2][0],
+                widths = {
+                    seg: np.mean(channel_flow_data[seg][2])
+                    for seg in np.unique(iseg[icalc == 4]).tolist()
+                }
+                reach_values[icalc == 4] = [
+                    widths[seg] for seg in iseg[icalc == 4].tolist()
                 ]
-                xp = [dist[0], dist[-1]]
-                reach_values += np.interp(dist, xp, fp).tolist()
-        return np.array(reach_values)
+        return reach_values
 
     def _write_1c(self, f_sfr):
 
@@ -2230,6 +2280,8 @@ class check:
         self.errors = []
         self.txt = f"\n{self.sfr.name[0]} ERRORS:\n"
         self.summary_array = None
+        # elapsed time in seconds of each check, by check method name
+        self.timings = {}
 
     def _boolean_compare(
         self,
@@ -2279,22 +2331,22 @@ class check:
         txt = ""
         array = array.view(np.recarray).copy()
         if isinstance(col1, np.ndarray):
-            array = recfunctions.append_fields(
+            array = _append_fields(
                 array, names="tmp1", data=col1, asrecarray=True
             )
             col1 = "tmp1"
         if isinstance(col2, np.ndarray):
-            array = recfunctions.append_fields(
+            array = _append_fields(
                 array, names="tmp2", data=col2, asrecarray=True
             )
             col2 = "tmp2"
         if isinstance(col1, tuple):
-            array = recfunctions.append_fields(
+            array = _append_fields(
                 array, names=col1[0], data=col1[1], asrecarray=True
             )
             col1 = col1[0]
         if isinstance(col2, tuple):
-            array = recfunctions.append_fields(
+            array = _append_fields(
                 array, names=col2[0], data=col2[1], asrecarray=True
             )
             col2 = col2[0]
@@ -2312,11 +2364,10 @@ class check:
                     and c != "diff"
                     and "tmp" not in c
                 ]
-                failed_info = recfunctions.append_fields(
+                failed_info = _append_fields(
                     failed_info[cols].copy(),
                     names="diff",
                     data=diff,
-                    usemask=False,
                     asrecarray=False,
                 )
                 failed_info.sort(order="diff", axis=0)
@@ -2349,14 +2400,14 @@ class check:
         headertxt = "Checking for nan values...\n"
         txt = ""
         passed = False
-        isnan = np.any(np.isnan(np.array(self.reach_data.tolist())), axis=1)
+        isnan = _isnan_records(self.reach_data)
         nanreaches = self.reach_data[isnan]
         if np.any(isnan):
             txt += f"Found {len(nanreaches)} reachs with nans:\n"
             if self.level == 1:
                 txt += _print_rec_array(nanreaches, delimiter=" ")
         for per, sd in self.segment_data.items():
-            isnan = np.any(np.isnan(np.array(sd.tolist())), axis=1)
+            isnan = _isnan_records(sd)
             nansd = sd[isnan]
             if np.any(isnan):
                 txt += (
@@ -2371,6 +2422,23 @@ class check:
     def run_all(self):
         return self.sfr.check()
 
+    def timing_report(self):
+        """
+        Summary of the time taken by each check.
+
+        Returns
+        -------
+        txt : str
+            Elapsed time in seconds of each check in the timings
+            attribute, and the total.
+
+        """
+        txt = "Check timings (seconds):\n"
+        for name, elapsed in self.timings.items():
+            txt += f"  {name:<25s} {elapsed:8.3f}\n"
+        txt += f"  {'total':<25s} {sum(self.timings.values()):8.3f}\n"
+        return txt
+
     def numbering(self):
         """
         Checks for continuity in segment and reach numbering
@@ -2390,9 +2458,19 @@ class check:
             self.sfr.nss, sd["nseg"], level=self.level, datatype="segment"
         )
 
-        # check reach numbering
-        for segment in np.arange(1, self.sfr.nss + 1):
-            reaches = self.reach_data.ireach[self.reach_data.iseg == segment]
+        # check reach numbering; reaches of each segment
+        # should be numbered consecutively from 1
+        iseg = self.reach_data.iseg
+        order = np.argsort(iseg, kind="stable")
+        sorted_iseg = iseg[order]
+        position = np.arange(len(iseg)) - np.searchsorted(
+            sorted_iseg, sorted_iseg
+        )
+        invalid = np.unique(
+            sorted_iseg[self.reach_data.ireach[order] != position + 1]
+        )
+        for segment in invalid[(invalid >= 1) & (invalid <= self.sfr.nss)]:
+            reaches = self.reach_data.ireach[iseg == segment]
             t = _check_numbers(
                 len(reaches), reaches, level=self.level, datatype="reach"
             )
@@ -2410,6 +2488,7 @@ class check:
 
         headertxt = "Checking for increasing segment numbers in downstream direction...\n"
         txt = ""
+        t = ""
         passed = False
         if self.verbose:
             print(headertxt.strip())
@@ -2446,7 +2525,8 @@ class check:
 
         # txt += self.sfr.get_outlets(level=self.level, verbose=False)  # will print twice if verbose=True
         # simpler check method using paths from routing graph
-        circular_segs = [k for k, v in self.sfr.paths.items() if v is None]
+        outlets = self.sfr._get_routing().outlets
+        circular_segs = [k for k, v in outlets.items() if v is None]
         if len(circular_segs) > 0:
             txt += "{0} instances where an outlet was not found after {1} consecutive segments!\n".format(
                 len(circular_segs), self.sfr.nss
@@ -2474,23 +2554,19 @@ class check:
 
             x0 = xcentergrid[rd.i, rd.j]
             y0 = ycentergrid[rd.i, rd.j]
-            loc = dict(zip(rd.reachID, zip(x0, y0)))
 
             # compute distances between node centers of connected reaches
             headertxt = "Checking reach connections for proximity...\n"
             txt = ""
             if self.verbose:
                 print(headertxt.strip())
-            dist = []
-            for r in rd.reachID:
-                x0, y0 = loc[r]
-                outreach = rd.outreach[r - 1]
-                if outreach == 0:
-                    dist.append(0)
-                else:
-                    x1, y1 = loc[outreach]
-                    dist.append(np.sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2))
-            dist = np.array(dist)
+            dist = np.zeros(len(rd))
+            connected = rd.outreach != 0
+            outreach = np.searchsorted(rd.reachID, rd.outreach[connected])
+            dist[connected] = np.sqrt(
+                (x0[outreach] - x0[connected]) ** 2
+                + (y0[outreach] - y0[connected]) ** 2
+            )
 
             # compute max width of reach nodes (hypotenuse for rectangular nodes)
             delr = self.mg.delr
@@ -2522,7 +2598,15 @@ class check:
                     )
                     with open(fpath, "w") as fp:
                         fp.write(",".join(rd.dtype.names) + "\n")
-                        np.savetxt(fp, rd, "%s", ",")
+                        # same text as np.savetxt(fp, rd, "%s", ","),
+                        # converting one column at a time
+                        columns = [
+                            rd[name].astype(str).tolist()
+                            for name in rd.dtype.names
+                        ]
+                        fp.writelines(
+                            ",".join(row) + "\n" for row in zip(*columns)
+                        )
                     txt += f"See {fpath} for details."
                 if self.verbose:
                     print(txt)
@@ -2556,13 +2640,14 @@ class check:
         # make nodes based on unique row, col pairs
         # if np.diff(reach_data.node).max() == 0:
         # always use unique rc, since flopy assigns nodes by k, i, j
-        uniquerc = {}
-        for i, (r, c) in enumerate(reach_data[["i", "j"]]):
-            if (r, c) not in uniquerc:
-                uniquerc[(r, c)] = i + 1
-        reach_data["node"] = [
-            uniquerc[(r, c)] for r, c in reach_data[["i", "j"]]
-        ]
+        # number nodes by the first reach in each cell
+        _, first, cells = np.unique(
+            np.column_stack((reach_data["i"], reach_data["j"])),
+            axis=0,
+            return_index=True,
+            return_inverse=True,
+        )
+        reach_data["node"] = first[cells] + 1
 
         K = reach_data["strhc1"]
         if K.max() == 0:
@@ -2579,20 +2664,18 @@ class check:
         binv[idx] = 1.0 / b[idx]
         Cond = K * w * L * binv
 
-        shared_cells = _get_duplicates(reach_data["node"])
-
-        nodes_with_multiple_conductance = set()
-        for node in shared_cells:
-
-            # select the collocated reaches for this cell
-            conductances = Cond[reach_data["node"] == node].copy()
-            conductances.sort()
+        # smallest and largest conductance of the collocated reaches
+        # in each cell (nan if any conductance is nan)
+        order = np.argsort(cells, kind="stable")
+        starts = np.searchsorted(cells[order], np.arange(len(first)))
+        cond_min = np.minimum.reduceat(Cond[order], starts)
+        cond_max = np.maximum.reduceat(Cond[order], starts)
 
-            # list nodes with multiple non-zero SFR reach conductances
-            if conductances[-1] != 0.0 and (
-                conductances[0] / conductances[-1] > tol
-            ):
-                nodes_with_multiple_conductance.update({node})
+        # list nodes with multiple non-zero SFR reach conductances
+        shared = np.bincount(cells) > 1
+        with np.errstate(all="ignore"):
+            multiple = shared & (cond_max != 0.0) & (cond_min / cond_max > tol)
+        nodes_with_multiple_conductance = set(first[multiple] + 1)
 
         if len(nodes_with_multiple_conductance) > 0:
             txt += (
@@ -2624,19 +2707,13 @@ class check:
                     ]
                 ]
 
-                reach_data = recfunctions.append_fields(
+                reach_data = _append_fields(
                     reach_data,
                     names=["width", "conductance"],
                     data=[w, Cond],
-                    usemask=False,
                     asrecarray=False,
                 )
-                has_multiple = np.array(
-                    [
-                        True if n in nodes_with_multiple_conductance else False
-                        for n in reach_data["node"]
-                    ]
-                )
+                has_multiple = multiple[cells]
                 reach_data = reach_data[has_multiple]
                 reach_data = reach_data[cols]
                 txt += _print_rec_array(reach_data, delimiter="\t")
@@ -2745,7 +2822,7 @@ class check:
 
                 # first check for segments where elevdn > elevup
                 d_elev = segment_data.elevdn - segment_data.elevup
-                segment_data = recfunctions.append_fields(
+                segment_data = _append_fields(
                     segment_data, names="d_elev", data=d_elev, asrecarray=True
                 )
                 txt += self._boolean_compare(
@@ -2764,19 +2841,14 @@ class check:
                 non_outlets_seg_data = segment_data[
                     non_outlets
                 ]  # lake outsegs are < 0
-                outseg_elevup = np.array(
-                    [
-                        segment_data.elevup[o - 1]
-                        for o in segment_data.outseg
-                        if o > 0
-                    ]
-                )
+                outseg_elevup = segment_data.elevup[
+                    segment_data.outseg[non_outlets] - 1
+                ]
                 d_elev2 = outseg_elevup - segment_data.elevdn[non_outlets]
-                non_outlets_seg_data = recfunctions.append_fields(
+                non_outlets_seg_data = _append_fields(
                     non_outlets_seg_data,
                     names=["outseg_elevup", "d_elev2"],
                     data=[outseg_elevup, d_elev2],
-                    usemask=False,
                     asrecarray=False,
                 )
 
@@ -2828,18 +2900,18 @@ class check:
 
             # compute changes in elevation
             rd = self.reach_data.copy()
-            elev = dict(zip(rd.reachID, rd.strtop))
-            dnelev = {
-                rid: elev[rd.outreach[i]] if rd.outreach[i] != 0 else -9999
-                for i, rid in enumerate(rd.reachID)
-            }
-            strtopdn = np.array([dnelev[r] for r in rd.reachID])
-            diffs = np.array(
-                [
-                    (dnelev[i] - elev[i]) if dnelev[i] != -9999 else -0.001
-                    for i in rd.reachID
-                ]
-            )
+            outlets = rd.outreach == 0
+            dtype = np.float64 if np.any(outlets) else rd.strtop.dtype
+            order = np.argsort(rd.reachID)
+            outreach = order[
+                np.searchsorted(rd.reachID, rd.outreach, sorter=order)
+            ]
+            strtopdn = rd.strtop[outreach]
+            diffs = strtopdn - rd.strtop
+            strtopdn = strtopdn.astype(dtype)
+            strtopdn[outlets] = -9999
+            diffs = diffs.astype(dtype)
+            diffs[strtopdn == -9999] = -0.001
 
             reach_data = (
                 self.sfr.reach_data
@@ -2852,11 +2924,10 @@ class check:
             # non_outlets = reach_data[reach_data.outreach != 0]
             # outreach_elevdn = np.array([reach_data.strtop[o - 1] for o in reach_data.outreach])
             # d_strtop = outreach_elevdn[reach_data.outreach != 0] - non_outlets.strtop
-            rd = recfunctions.append_fields(
+            rd = _append_fields(
                 rd,
                 names=["strtopdn", "d_strtop"],
                 data=[strtopdn, diffs],
-                usemask=False,
                 asrecarray=False,
             )
 
@@ -2909,11 +2980,10 @@ class check:
             # check streambed bottoms in relation to respective cell bottoms
             bots = self.sfr.parent.dis.botm.array[k, i, j]
             streambed_bots = reach_data["strtop"] - reach_data["strthick"]
-            reach_data = recfunctions.append_fields(
+            reach_data = _append_fields(
                 reach_data,
                 names=["layerbot", "strbot"],
                 data=[bots, streambed_bots],
-                usemask=False,
                 asrecarray=False,
             )
 
@@ -2943,11 +3013,10 @@ class check:
                 )
             # check streambed elevations in relation to model top
             tops = self.sfr.parent.dis.top.array[i, j]
-            reach_data = recfunctions.append_fields(
+            reach_data = _append_fields(
                 reach_data,
                 names="modeltop",
                 data=tops,
-                usemask=False,
                 asrecarray=False,
             )
 
@@ -3031,11 +3100,10 @@ class check:
             i, j = segment_ends.i, segment_ends.j
             tops = self.sfr.parent.dis.top.array[i, j]
             diff = tops - segment_ends.strtop
-            segment_ends = recfunctions.append_fields(
+            segment_ends = _append_fields(
                 segment_ends,
                 names=["modeltop", "diff"],
                 data=[tops, diff],
-                usemask=False,
                 asrecarray=False,
             )
 
@@ -3208,17 +3276,38 @@ def _get_dataset(line, dataset):
     return dataset
 
 
-def _get_duplicates(a):
+def _append_fields(base, names, data, asrecarray=False):
     """
-    Returns duplicate values in an array, similar to pandas .duplicated()
-    method
-    http://stackoverflow.com/questions/11528078/determining-duplicate-values-in-an-array
+    Add new fields to a record array, like
+    numpy.lib.recfunctions.append_fields, but copying each field at once
+    instead of record by record. The arrays are not masked.
     """
-    s = np.sort(a, axis=None)
-    equal_to_previous_item = np.append(
-        s[1:] == s[:-1], False
-    )  # maintain same dimension for boolean array
-    return np.unique(s[equal_to_previous_item])
+    if isinstance(names, str):
+        names = [names]
+        data = [data]
+    data = [np.asarray(d) for d in data]
+    dtype = [(name, base.dtype[name]) for name in base.dtype.names]
+    dtype += [(name, d.dtype) for name, d in zip(names, data)]
+    output = np.empty(len(base), dtype=dtype)
+    for name in base.dtype.names:
+        output[name] = base[name]
+    for name, d in zip(names, data):
+        output[name] = d
+    if asrecarray:
+        output = output.view(np.recarray)
+    return output
+
+
+def _isnan_records(recarray):
+    """
+    Returns a boolean array that is True for records with a nan value
+    in any field
+    """
+    isnan = np.zeros(len(recarray), dtype=bool)
+    for name in recarray.dtype.names:
+        if recarray.dtype[name].kind == "f":
+            isnan |= np.isnan(recarray[name])
+    return isnan
 
 
 def _get_item2_names(nstrm, reachinput, isfropt, structured=False):
@@ -3563,26 +3652,190 @@ def find_path(graph, start, end=0):
     path : list
         List of segment numbers along routing path.
     """
-    graph = graph.copy()
-    return _find_path(graph, start, end=end)
-
-
-def _find_path(graph, start, end=0, path=None):
-    """Like find_path, but doesn't copy the routing
-    dictionary (graph) so that the recursion works.
-    """
-    if path is None:
-        path = list()
-    path = path + [start]
+    path = [start]
     if start == end:
         return path
     if start not in graph:
         return None
-    if not isinstance(graph[start], list):
-        graph[start] = [graph[start]]
-    for node in graph[start]:
-        if node not in path:
-            newpath = _find_path(graph, node, end, path)
-            if newpath:
-                return newpath
+    # depth first search, with a stack of the remaining
+    # outsegs of each segment in the path
+    visited = {start}
+    stack = [iter(np.atleast_1d(graph[start]).tolist())]
+    while stack:
+        for node in stack[-1]:
+            if node in visited:
+                continue
+            path.append(node)
+            if node == end:
+                return path
+            if node in graph:
+                visited.add(node)
+                stack.append(iter(np.atleast_1d(graph[node]).tolist()))
+                break
+            path.pop()
+        else:
+            stack.pop()
+            visited.discard(path.pop())
     return None
+
+
+class _RoutingGraph:
+    """Routing network built once from a dictionary of seg : outseg
+    numbers. Outlets and upstream segments are found without
+    recursion, in time proportional to the size of the network, and
+    outlets are cached. The path of a segment is only built when it is
+    first looked up.
+
+    Parameters
+    ----------
+    graph : dict
+        Dictionary of seg : outseg numbers
+    """
+
+    def __init__(self, graph):
+        self.segments = list(graph.keys())
+        self.outsegs = list(graph.values())
+        self.nseg = np.array(self.segments, dtype=int)
+        self.outseg = np.array(self.outsegs, dtype=int)
+
+        # position of the outseg of each segment; -1 for segments
+        # routed to the end (0), -2 for outsegs that are not segments
+        self.down = np.full(len(self.nseg), -2, dtype=int)
+        if len(self.nseg) > 0:
+            srt = np.argsort(self.nseg)
+            pos = srt[
+                np.minimum(
+                    np.searchsorted(self.nseg, self.outseg, sorter=srt),
+                    len(srt) - 1,
+                )
+            ]
+            isasegment = self.nseg[pos] == self.outseg
+            self.down[isasegment] = pos[isasegment]
+        self.down[self.outseg == 0] = -1
+        self._order = None
+        self._path_lengths = None
+        self._paths = None
+        self._outlets = None
+
+    def matches(self, graph):
+        """Check if the network was built from the same routing
+        connections as graph."""
+        return (
+            list(graph.keys()) == self.segments
+            and list(graph.values()) == self.outsegs
+        )
+
+    @property
+    def order(self):
+        """Positions of the segments that are not part of (or upstream of)
+        circular routing, ordered so that each segment comes after
+        the segment it routes to."""
+        if self._order is None:
+            down = self.down.tolist()
+            upsegs = [[] for _ in down]
+            for i, d in enumerate(down):
+                if d >= 0:
+                    upsegs[d].append(i)
+            order = [i for i, d in enumerate(down) if d < 0]
+            for i in order:
+                order += upsegs[i]
+            self._order = order
+        return self._order
+
+    @property
+    def path_lengths(self):
+        """Number of segments in the routing path of each segment,
+        including the outlet (0), or 0 for segments that do not reach
+        an outlet."""
+        if self._path_lengths is None:
+            down = self.down.tolist()
+            lengths = [0] * len(down)
+            for i in self.order:
+                d = down[i]
+                if self.segments[i] == 0:
+                    lengths[i] = 1
+                elif d == -1:
+                    lengths[i] = 2
+                elif d >= 0 and lengths[d] > 0:
+                    lengths[i] = lengths[d] + 1
+            self._path_lengths = np.array(lengths, dtype=int)
+        return self._path_lengths
+
+    @property
+    def paths(self):
+        """Dictionary of routing paths from each segment to the outlet (0).
+        Paths are None for segments that do not reach an outlet."""
+        if self._paths is None:
+            self._paths = _RoutingPaths(self)
+        return self._paths
+
+    @property
+    def outlets(self):
+        """Dictionary of the last segment along the routing path of each
+        segment, or None for segments that do not reach an outlet."""
+        if self._outlets is None:
+            down = self.down.tolist()
+            outlets = [None] * len(down)
+            for i in self.order:
+                d = down[i]
+                if d == -1:
+                    outlets[i] = self.segments[i]
+                elif d >= 0:
+                    outlets[i] = outlets[d]
+            self._outlets = dict(zip(self.segments, outlets))
+        return self._outlets
+
+    def upstream(self):
+        """Dictionary of sets of all segments upstream of each segment.
+        Sets are empty for segments that are part of circular routing."""
+        down = self.down.tolist()
+        upstream = [set() for _ in down]
+        for i in reversed(self.order):
+            d = down[i]
+            if d >= 0:
+                upstream[d].add(self.segments[i])
+                upstream[d] |= upstream[i]
+        return dict(zip(self.segments, upstream))
+
+
+class _RoutingPaths(Mapping):
+    """Read-only dictionary of the routing paths of a _RoutingGraph.
+    The path of a segment is built when it is first looked up.
+
+    Parameters
+    ----------
+    routing : _RoutingGraph
+        Routing network
+    """
+
+    def __init__(self, routing):
+        self._routing = routing
+        self._down = routing.down.tolist()
+        self._position = dict(
+            zip(routing.segments, range(len(routing.segments)))
+        )
+        self._paths = {}
+
+    def __getitem__(self, seg):
+        if seg not in self._paths:
+            i = self._position[seg]
+            routing = self._routing
+            if routing.path_lengths[i] == 0:
+                path = None
+            elif seg == 0:
+                path = [0]
+            else:
+                path = [seg]
+                d = self._down[i]
+                while d >= 0:
+                    path.append(routing.segments[d])
+                    d = self._down[d]
+                path.append(0)
+            self._paths[seg] = path
+        return self._paths[seg]
+
+    def __iter__(self):
+        return iter(self._routing.segments)
+
+    def __len__(self):
+        return len(self._routing.segments)
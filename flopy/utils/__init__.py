@@ -31,6 +31,7 @@ from .binaryfile import (
     CellBudgetFile,
     HeadUFile,
 )
+from .ensemblefile import EnsembleFile
 from .formattedfile import FormattedHeadFile
 from .modpathfile import PathlineFile, EndpointFile, TimeseriesFile
 from .swroutputfile import (
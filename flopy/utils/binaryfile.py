@@ -8,10 +8,16 @@ important classes that can be accessed by the user.
 *  CellBudgetFile (Binary cell-by-cell flow file)
 
 """
+import array
+import os
+import struct
 import numpy as np
 import warnings
 from ..utils.datafile import Header, LayerFile
 
+# increment if the content of the index cache files changes
+INDEX_CACHE_VERSION = 1
+
 
 class BinaryHeader(Header):
     """
@@ -269,6 +275,102 @@ def get_headfile_precision(filename):
     return result
 
 
+def _read_index_cache(filename):
+    """
+    Read the index cache for a binary file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the binary file.  The index is read from filename with a
+        .flopyidx suffix appended.
+
+    Returns
+    -------
+    index : dict or None
+        Dictionary of index arrays, or None if the cache does not exist or
+        if the size or modification time of the binary file have changed
+        since the cache was written.
+
+    """
+    fpth = f"{filename}.flopyidx"
+    if not os.path.isfile(fpth):
+        return None
+    stat = os.stat(filename)
+    try:
+        with np.load(fpth, allow_pickle=False) as f:
+            index = {key: f[key] for key in f.files}
+    except (OSError, ValueError):
+        return None
+    if (
+        index.get("version") != INDEX_CACHE_VERSION
+        or index.get("filesize") != stat.st_size
+        or index.get("mtime") != stat.st_mtime_ns
+    ):
+        return None
+    return index
+
+
+def _write_index_cache(filename, **kwargs):
+    """
+    Write the index cache for a binary file, along with the size and
+    modification time of the file that are used to validate the cache.
+    A warning is issued if the cache cannot be written.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the binary file.  The index is written to filename with a
+        .flopyidx suffix appended.
+    **kwargs : dict
+        index arrays to save
+
+    """
+    fpth = f"{filename}.flopyidx"
+    stat = os.stat(filename)
+    tpth = f"{fpth}.{os.getpid()}.tmp"
+    try:
+        with open(tpth, "wb") as f:
+            np.savez(
+                f,
+                version=INDEX_CACHE_VERSION,
+                filesize=stat.st_size,
+                mtime=stat.st_mtime_ns,
+                **kwargs,
+            )
+        # replace the cache in one step so that other processes never
+        # read a partially written file
+        os.replace(tpth, fpth)
+    except OSError as e:
+        warnings.warn(f"Could not write index cache {fpth}: {e}")
+        if os.path.isfile(tpth):
+            os.remove(tpth)
+    return
+
+
+def _headers_match(obj, recordarray, iposheader, totalbytes):
+    """
+    Check that every header in recordarray is at its position in iposheader
+    in the file of a binary layer file object, byte for byte, and that the
+    file extends to totalbytes.  Each header is read with one seek and one
+    small read.  The file is positioned at the start when the check is
+    done.
+
+    """
+    f = obj.file
+    f.seek(0, 2)
+    match = len(recordarray) > 0 and f.tell() >= totalbytes
+    if match:
+        hsize = recordarray.dtype.itemsize
+        headers = bytearray()
+        for ipos in iposheader.tolist():
+            f.seek(ipos, 0)
+            headers += f.read(hsize)
+        match = headers == np.ascontiguousarray(recordarray).tobytes()
+    f.seek(0, 0)
+    return match
+
+
 class BinaryLayerFile(LayerFile):
     """
     The BinaryLayerFile class is the super class from which specific derived
@@ -277,7 +379,13 @@ class BinaryLayerFile(LayerFile):
     """
 
     def __init__(self, filename, precision, verbose, kwargs):
+        use_memmap = kwargs.pop("memmap", False)
+        self._memmap = None
+        self._index_cache = kwargs.pop("index_cache", False)
+        self._index_from = kwargs.pop("index_from", None)
         super().__init__(filename, precision, verbose, kwargs)
+        if use_memmap:
+            self._memmap = np.memmap(self.filename, dtype=np.uint8, mode="r")
         return
 
     def __enter__(self):
@@ -286,12 +394,165 @@ class BinaryLayerFile(LayerFile):
     def __exit__(self, *exc):
         self.close()
 
+    def close(self):
+        """
+        Close the file handle and release the memory map, if used.
+
+        """
+        self._memmap = None
+        super().close()
+        return
+
+    def _record_view(self, idx, shp):
+        """
+        Return a read-only view of the data for record idx in the
+        memory-mapped file.
+
+        """
+        return np.ndarray(
+            shp,
+            dtype=self.realtype,
+            buffer=self._memmap,
+            offset=int(self.iposarray[idx]),
+        )
+
+    def _strided_view(self, keyindices, shp):
+        """
+        Return a single read-only view of shape (len(keyindices),) + shp
+        if the records in keyindices are equally spaced in the file, so
+        they can be addressed with a constant stride.  Otherwise return
+        None.
+
+        """
+        ipos = self.iposarray[keyindices].astype(np.int64)
+        if len(ipos) > 1:
+            stride = np.diff(ipos)
+            if stride[0] <= 0 or np.any(stride != stride[0]):
+                return None
+            stride = int(stride[0])
+        else:
+            stride = int(np.prod(shp)) * self.realtype(1).itemsize
+        # strides for the data dimensions are C-contiguous
+        strides = (stride,) + tuple(
+            self.realtype(1).itemsize * int(np.prod(shp[i + 1 :]))
+            for i in range(len(shp))
+        )
+        return np.ndarray(
+            (len(keyindices),) + tuple(shp),
+            dtype=self.realtype,
+            buffer=self._memmap,
+            offset=int(ipos[0]),
+            strides=strides,
+        )
+
+    def _get_data_array(self, totim=0):
+        """
+        Get the three dimensional data array for the specified totim value.
+        If the file is memory-mapped and all layers are saved in order, a
+        read-only view into the memory map is returned instead of a copy.
+
+        """
+        if self._memmap is None:
+            return super()._get_data_array(totim)
+
+        keyindices = np.where(self.recordarray["totim"] == totim)[0]
+        if len(keyindices) == 0:
+            msg = f"totim value ({totim}) not found in file..."
+            raise Exception(msg)
+
+        nrow = self.recordarray["nrow"][keyindices]
+        ncol = self.recordarray["ncol"][keyindices]
+        ilay = self.recordarray["ilay"][keyindices]
+        shp = (nrow[0], ncol[0])
+        if (
+            np.array_equal(ilay, np.arange(1, self.nlay + 1))
+            and np.all(nrow == nrow[0])
+            and np.all(ncol == ncol[0])
+        ):
+            data = self._strided_view(keyindices, shp)
+            if data is not None:
+                return data
+
+        # layers are missing or out of order, so copy them into a new array
+        data = np.empty((self.nlay,) + shp, dtype=self.realtype)
+        data[:, :, :] = np.nan
+        for idx in keyindices:
+            shp = (
+                self.recordarray["nrow"][idx],
+                self.recordarray["ncol"][idx],
+            )
+            data[self.recordarray["ilay"][idx] - 1] = self._record_view(
+                idx, shp
+            )
+        return data
+
+    def get_alldata(self, mflay=None, nodata=-9999):
+        """
+        Get all of the data from the file.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        nodata : float
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan.  If the file is memory-mapped
+           and nodata is None, a read-only view into the memory map is
+           returned when the records are equally spaced in the file.
+
+        Returns
+        ----------
+        data : numpy array
+            Array has size (ntimes, nlay, nrow, ncol) if mflay is None or it
+            has size (ntimes, nrow, ncol) if mlay is specified.
+
+        """
+        if self._memmap is None:
+            return super().get_alldata(mflay=mflay, nodata=nodata)
+
+        rv = None
+        nrec = len(self.times) * self.nlay
+        if nrec == len(self.iposarray) and nrec == len(self.recordarray):
+            nrow = self.recordarray["nrow"]
+            ncol = self.recordarray["ncol"]
+            ilay = self.recordarray["ilay"]
+            if (
+                np.array_equal(
+                    ilay, np.tile(np.arange(1, self.nlay + 1), len(self.times))
+                )
+                and np.all(nrow == nrow[0])
+                and np.all(ncol == ncol[0])
+            ):
+                rv = self._strided_view(np.arange(nrec), (nrow[0], ncol[0]))
+        if rv is None:
+            rv = np.array(
+                [self._get_data_array(totim) for totim in self.times]
+            )
+        else:
+            rv = rv.reshape((len(self.times), self.nlay) + rv.shape[1:])
+        if mflay is not None:
+            rv = rv[:, mflay]
+        if nodata is not None:
+            rv = np.where(rv == nodata, np.nan, rv)
+        return rv
+
     def _build_index(self):
         """
         Build the recordarray and iposarray, which maps the header information
-        to the position in the binary file.
+        to the position in the binary file.  If index_cache is True, the
+        index is read from the index cache file if it is current and is
+        written to the index cache file after it is built otherwise.
 
         """
+        if self._index_cache and self._read_index():
+            return
+        if self._index_from is not None and self._share_index(
+            self._index_from
+        ):
+            return
+
         header = self._get_header()
         self.nrow = header["nrow"]
         self.ncol = header["ncol"]
@@ -304,37 +565,172 @@ class BinaryLayerFile(LayerFile):
             s = "Possible error. ncol ({}) * nrow ({}) > 10,000,000 "
             s = s.format(self.ncol, self.nrow)
             warnings.warn(s)
+        self.totalbytes = 0
+        self.recordarray = np.array([], dtype=self.header_dtype)
+        self.iposarray = np.array([], dtype=np.int64)
+        self._index_records()
+
+        if self._index_cache:
+            self._write_index()
+        return
+
+    def _index_records(self):
+        """
+        Add the records between totalbytes and the end of the file to the
+        recordarray and iposarray, and update totalbytes to the end of the
+        last complete record.  A partially written record at the end of the
+        file is not indexed.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index
+
+        """
         self.file.seek(0, 2)
-        self.totalbytes = self.file.tell()
-        self.file.seek(0, 0)
-        ipos = 0
-        while ipos < self.totalbytes:
+        filesize = self.file.tell()
+        hsize = self.header_dtype.itemsize
+        ipos = self.totalbytes
+        self.file.seek(ipos, 0)
+        headers = []
+        iposarray = []
+        while ipos + hsize <= filesize:
             header = self._get_header()
-            self.recordarray.append(header)
+            databytes = int(self.get_databytes(header))
+            if databytes < 0:
+                raise Exception(f"invalid record header at byte {ipos}")
+            if ipos + hsize + databytes > filesize:
+                break
+            ipos += hsize + databytes
             if self.text.upper() not in header["text"]:
+                self.file.seek(ipos, 0)
                 continue
-            if ipos == 0:
-                self.times.append(header["totim"])
+            headers.append(header)
+            totim = header["totim"]
+            if len(self.times) == 0 or totim != self.times[-1]:
+                self.times.append(totim)
                 kstpkper = (header["kstp"], header["kper"])
                 self.kstpkper.append(kstpkper)
-            else:
-                totim = header["totim"]
-                if totim != self.times[-1]:
-                    self.times.append(totim)
-                    kstpkper = (header["kstp"], header["kper"])
-                    self.kstpkper.append(kstpkper)
-            ipos = self.file.tell()
-            self.iposarray.append(ipos)
-            databytes = self.get_databytes(header)
-            self.file.seek(databytes, 1)
-            ipos = self.file.tell()
+            iposarray.append(ipos - databytes)
+            self.file.seek(ipos, 0)
+        self.totalbytes = ipos
 
         # self.recordarray contains a recordarray of all the headers.
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposarray = np.array(self.iposarray)
-        self.nlay = np.max(self.recordarray["ilay"])
+        if len(headers) > 0:
+            self.recordarray = np.concatenate(
+                (self.recordarray, np.array(headers, dtype=self.header_dtype))
+            )
+            self.iposarray = np.concatenate(
+                (self.iposarray, np.array(iposarray, dtype=np.int64))
+            )
+            self.nlay = np.max(self.recordarray["ilay"])
+        return len(headers)
+
+    def refresh(self):
+        """
+        Index records that were written to the file after it was opened or
+        last refreshed, for example by a simulation that is still running.
+        A partially written record at the end of the file is indexed by a
+        later call to refresh once it is complete.
+
+        Returns
+        -------
+        nrecords : int
+            Number of new records
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> while hdobj.refresh() > 0:
+        ...     print(hdobj.get_times()[-1])
+
+        """
+        nrecords = self._index_records()
+        if nrecords > 0 and self._memmap is not None:
+            self._memmap = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        return nrecords
+
+    def _get_index(self):
+        """
+        Return the index as a dictionary of arrays and values.
+
+        """
+        return {
+            "header_dtype": str(self.header_dtype.descr),
+            "text": self.text,
+            "recordarray": self.recordarray,
+            "iposarray": self.iposarray,
+            "times": np.array(self.times, dtype=self.realtype),
+            "kstpkper": np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2),
+            "nrow": self.nrow,
+            "ncol": self.ncol,
+            "nlay": self.nlay,
+            "totalbytes": self.totalbytes,
+        }
+
+    def _set_index(self, index):
+        """
+        Set the index from a dictionary returned by _get_index.  Returns
+        False if the index was built for a different header type or text.
+
+        """
+        if (
+            index["header_dtype"] != str(self.header_dtype.descr)
+            or index["text"] != self.text
+        ):
+            return False
+        self.recordarray = index["recordarray"]
+        self.iposarray = index["iposarray"]
+        self.times = list(index["times"])
+        self.kstpkper = [tuple(kstpkper) for kstpkper in index["kstpkper"]]
+        self.nrow = int(index["nrow"])
+        self.ncol = int(index["ncol"])
+        self.nlay = int(index["nlay"])
+        self.totalbytes = int(index["totalbytes"])
+        return True
+
+    def _read_index(self):
+        """
+        Set the index from the index cache file.  Returns False if there
+        is no current index cache for the file.
+
+        """
+        index = _read_index_cache(self.filename)
+        if index is None:
+            return False
+        return self._set_index(index)
+
+    def _write_index(self):
+        """
+        Write the index to the index cache file.
+
+        """
+        _write_index_cache(self.filename, **self._get_index())
         return
 
+    def _share_index(self, index_from):
+        """
+        Set the index from another file with the same record layout and
+        index any additional records at the end of this file.  Returns
+        False if any record in the index is not in this file.
+
+        """
+        if isinstance(index_from, dict):
+            index = index_from
+        else:
+            index = index_from._get_index()
+        iposheader = index["iposarray"] - self.header_dtype.itemsize
+        if not _headers_match(
+            self, index["recordarray"], iposheader, index["totalbytes"]
+        ):
+            return False
+        if not self._set_index(index):
+            return False
+        self._index_records()
+        return True
+
     def get_databytes(self, header):
         """
 
@@ -392,6 +788,9 @@ class BinaryLayerFile(LayerFile):
         The layer, row, and column values must be zero-based, and must be
         within the following ranges: 0 <= k < nlay; 0 <= i < nrow; 0 <= j < ncol
 
+        Cells are grouped by layer, so each layer record in the file is
+        read once regardless of the number of cells requested.
+
         Examples
         --------
 
@@ -402,27 +801,92 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = (
-                    header["ilay"] - 1
-                )  # change ilay from header to zero-based
-                if ilay != k:
-                    continue
-                ipos = int(self.iposarray[irec])
-
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + int(ioffset), 0)
+        # map each time to its row in the result array
+        time_index = {totim: itim for itim, totim in enumerate(self.times)}
+
+        # group the cells by layer so that each layer record is read once
+        # and all of the cells in the layer are gathered with one index
+        kij = np.array(kijlist, dtype=int).reshape(-1, 3)
+        for k in np.unique(kij[:, 0]):
+            istat = np.where(kij[:, 0] == k)[0]
+            irow = kij[istat, 1]
+            jcol = kij[istat, 2]
+            irecs = np.where(self.recordarray["ilay"] == k + 1)[0]
+            irecs = irecs[irecs < len(self.iposarray)]
+            itims = np.array(
+                [
+                    time_index.get(t, -1)
+                    for t in self.recordarray["totim"][irecs]
+                ],
+                dtype=int,
+            )
+            irecs, itims = irecs[itims >= 0], itims[itims >= 0]
+            if len(irecs) == 0:
+                continue
+            nrow = self.recordarray["nrow"][irecs]
+            ncol = self.recordarray["ncol"][irecs]
+            shp = (nrow[0], ncol[0])
+
+            # a memory-mapped layer that is saved with a constant stride
+            # can be gathered for all times at once
+            data = None
+            if (
+                self._memmap is not None
+                and np.all(nrow == nrow[0])
+                and np.all(ncol == ncol[0])
+            ):
+                data = self._strided_view(irecs, shp)
+            if data is not None:
+                result[itims[:, None], istat + 1] = data[:, irow, jcol]
+                continue
 
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header["totim"])[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
+            # otherwise only the parts of each record that contain the
+            # cells are read
+            reads = {}
+            for irec, itim, n, m in zip(irecs, itims, nrow, ncol):
+                if self._memmap is not None:
+                    data = self._record_view(irec, (n, m))[irow, jcol]
+                else:
+                    if m not in reads:
+                        reads[m] = self._cell_reads(irow * m + jcol)
+                    data = self._read_cells(self.iposarray[irec], reads[m])
+                result[itim, istat + 1] = data
         return result
 
+    @staticmethod
+    def _cell_reads(icell, gap=1024):
+        """
+        Plan the reads of the cells at flat indices icell of a layer
+        record.  Cells that are less than gap values apart are read
+        together, and cells that are further apart are read separately.
+
+        """
+        cells, inverse = np.unique(icell, return_inverse=True)
+        split = np.flatnonzero(np.diff(cells) > gap) + 1
+        istart = np.concatenate(([0], split)).tolist()
+        iend = np.concatenate((split, [len(cells)])).tolist()
+        groups = [
+            (int(cells[i0]), cells[i0:i1] - cells[i0])
+            for i0, i1 in zip(istart, iend)
+        ]
+        return groups, inverse.ravel()
+
+    def _read_cells(self, ipos, reads):
+        """
+        Read the cell values of the layer record with data at ipos with a
+        plan from _cell_reads, using one seek and one read per group of
+        cells.
+
+        """
+        groups, inverse = reads
+        isz = self.realtype(1).itemsize
+        values = []
+        for first, offsets in groups:
+            self.file.seek(int(ipos) + first * isz, 0)
+            span = np.fromfile(self.file, self.realtype, int(offsets[-1]) + 1)
+            values.append(span[offsets])
+        return np.concatenate(values)[inverse]
+
 
 class HeadFile(BinaryLayerFile):
     """
@@ -438,6 +902,23 @@ class HeadFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    memmap : bool
+        Keyword argument.  If True, data are accessed through a read-only
+        numpy memory map of the file and get_data returns views into the
+        map instead of copies where the record layout allows it.  Several
+        processes reading the same file then share the operating system
+        page cache.  Default is False.
+    index_cache : bool
+        Keyword argument.  If True, the record index is saved to a
+        <filename>.flopyidx file and reused when the file is opened again,
+        as long as the size and modification time of the file have not
+        changed.  Default is False.
+    index_from : HeadFile
+        Keyword argument.  An open HeadFile for another file with the same
+        record layout, such as the output of another realization of the
+        same model.  Its index is reused if every indexed record is at the
+        same position in this file with the same header, and this file is
+        indexed as usual otherwise.  Default is None.
 
     Attributes
     ----------
@@ -506,6 +987,23 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    memmap : bool
+        Keyword argument.  If True, data are accessed through a read-only
+        numpy memory map of the file and get_data returns views into the
+        map instead of copies where the record layout allows it.  Several
+        processes reading the same file then share the operating system
+        page cache.  Default is False.
+    index_cache : bool
+        Keyword argument.  If True, the record index is saved to a
+        <filename>.flopyidx file and reused when the file is opened again,
+        as long as the size and modification time of the file have not
+        changed.  Default is False.
+    index_from : UcnFile
+        Keyword argument.  An open UcnFile for another file with the same
+        record layout, such as the output of another realization of the
+        same model.  Its index is reused if every indexed record is at the
+        same position in this file with the same header, and this file is
+        indexed as usual otherwise.  Default is None.
 
     Attributes
     ----------
@@ -576,6 +1074,17 @@ class CellBudgetFile:
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    index_cache : bool
+        Keyword argument.  If True, the record index is saved to a
+        <filename>.flopyidx file and reused when the file is opened again,
+        as long as the size and modification time of the file have not
+        changed.  Default is False.
+    index_from : CellBudgetFile
+        Keyword argument.  An open CellBudgetFile for another file with the same
+        record layout, such as the output of another realization of the
+        same model.  Its index is reused if every indexed record is at the
+        same position in this file with the same header, and this file is
+        indexed as usual otherwise.  Default is None.
 
     Attributes
     ----------
@@ -624,6 +1133,7 @@ class CellBudgetFile:
         self.imethlist = []
         self.paknamlist = []
         self.nrecords = 0
+        self._recorddict = None
 
         self.dis = None
         self.modelgrid = None
@@ -656,6 +1166,8 @@ class CellBudgetFile:
                 )
         if "modelgrid" in kwargs.keys():
             self.modelgrid = kwargs.pop("modelgrid")
+        self._index_cache = kwargs.pop("index_cache", False)
+        self._index_from = kwargs.pop("index_from", None)
         if len(kwargs.keys()) > 0:
             args = ",".join(kwargs.keys())
             raise Exception(f"LayerFile error: unrecognized kwargs: {args}")
@@ -709,6 +1221,7 @@ class CellBudgetFile:
         self.imethlist = []
         self.paknamlist = []
         self.nrecords = 0
+        self._recorddict = None
 
     def _set_precision(self, precision="single"):
         """
@@ -789,185 +1302,497 @@ class CellBudgetFile:
 
     def _build_index(self):
         """
-        Build the ordered dictionary, which maps the header information
-        to the position in the binary file.
+        Build the recordarray and iposarray, which maps the header
+        information to the position in the binary file.
+
+        Headers are read as raw bytes with a minimum of Python work per
+        record and converted to the recordarray in a single step.  Unique
+        times, time steps, text and package names are determined from the
+        recordarray once all of the headers have been read.  If
+        index_cache is True, the index is read from the index cache file if
+        it is current and is written to the index cache file after it is
+        built otherwise.
+        """
+        if self._index_cache and self._read_index():
+            return
+        if self._index_from is not None and self._share_index(
+            self._index_from
+        ):
+            return
+
+        self.totalbytes = 0
+        self.recordarray = np.array([], dtype=self.header_dtype)
+        self.iposheader = np.array([], dtype=np.int64)
+        self.iposarray = np.array([], dtype=np.int64)
+
+        # a partially written record at the end of the file can only be
+        # distinguished from a file read with the wrong precision if the
+        # precision is specified
+        self._index_records(partial=self.precision != "auto")
+
+        if self._index_cache:
+            self._write_index()
+        return
+
+    def _index_records(self, partial=True):
         """
-        asciiset = " "
-        for i in range(33, 127):
-            asciiset += chr(i)
+        Add the records between totalbytes and the end of the file to the
+        index, and update totalbytes to the end of the last complete
+        record.
+
+        Parameters
+        ----------
+        partial : bool
+            If True, a partially written record at the end of the file is
+            not indexed.  If False, a BudgetIndexError is raised for a
+            partially written record.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index
+
+        """
+        # printable ascii characters, used to check the precision
+        printable = bytes(range(32, 127))
+
+        isz = self.realtype(1).itemsize
+        h1 = struct.Struct("=2i16s3i")
+        if self.realtype == np.float32:
+            h2 = struct.Struct("=i3f")
+        else:
+            h2 = struct.Struct("=i3d")
+        i4 = struct.Struct("=i")
+        hsize = self.header_dtype.itemsize
+        h2pad = bytes(hsize - h1.size)
+        names = bytes(hsize - h1.size - h2.size)
+        names_size = len(names)
 
-        # read first record
-        header = self._get_header()
-        nrow = header["nrow"]
-        ncol = header["ncol"]
-        text = header["text"]
-        if isinstance(text, bytes):
-            text = text.decode()
-        if nrow < 0 or ncol < 0:
-            raise Exception("negative nrow, ncol")
-        if not text.endswith("FLOW-JA-FACE"):
-            self.nrow = nrow
-            self.ncol = ncol
-            self.nlay = np.abs(header["nlay"])
         self.file.seek(0, 2)
-        self.totalbytes = self.file.tell()
-        self.file.seek(0, 0)
-        self.recorddict = {}
-        # read the remaining records
-        ipos = 0
-        while ipos < self.totalbytes:
-            self.iposheader.append(ipos)
-            header = self._get_header()
-            self.nrecords += 1
-            totim = header["totim"]
-            if totim == 0:
-                totim = self._totim_from_kstpkper(
-                    (header["kstp"] - 1, header["kper"] - 1)
-                )
-                header["totim"] = totim
-            if totim >= 0 and totim not in self.times:
-                self.times.append(totim)
-            kstpkper = (header["kstp"], header["kper"])
-            if kstpkper not in self.kstpkper:
-                self.kstpkper.append(kstpkper)
-            if header["text"] not in self.textlist:
-                # check the precision of the file using text records
-                try:
-                    tlist = [header["text"], header["modelnam"]]
-                    for text in tlist:
-                        if isinstance(text, bytes):
-                            text = text.decode()
-                        for t in text:
-                            if t.upper() not in asciiset:
-                                raise Exception()
+        filesize = self.file.tell()
+        read = self.file.read
+        seek = self.file.seek
+
+        headers = bytearray()
+        iposheader = array.array("q")
+        iposarray = array.array("q")
+        texts = set()
+
+        def read_record(ipos):
+            """
+            Read the header of the record at ipos into headers and return
+            the position of the data and the end of the record, or None
+            if the record is incomplete.
+            """
+            buf = read(h1.size)
+            if len(buf) < h1.size:
+                return None
+            kstp, kper, text, ncol, nrow, nlay = h1.unpack(buf)
+            if nrow < 0 or ncol < 0:
+                if ipos == 0:
+                    raise Exception("negative nrow, ncol")
+                raise BudgetIndexError("Improper precision")
+            headers.extend(buf)
+            ipos += h1.size
+            imeth = 0
+            if nlay < 0:
+                buf = read(h2.size)
+                if len(buf) < h2.size:
+                    return None
+                imeth = h2.unpack(buf)[0]
+                headers.extend(buf)
+                ipos += h2.size
+                if imeth == 6:
+                    buf = read(names_size)
+                    if len(buf) < names_size:
+                        return None
+                    headers.extend(buf)
+                    ipos += names_size
+                else:
+                    headers.extend(names)
+            else:
+                headers.extend(h2pad)
+
+            # check the precision of the file using new text records
+            if text not in texts:
+                modelnam = bytes(headers[-names_size:][:16])
+                for t in (text, modelnam):
+                    if len(t.rstrip(b"\x00").translate(None, printable)) > 0:
+                        raise BudgetIndexError("Improper precision")
+                texts.add(text)
+
+            # position right after header2
+            idata = ipos
+
+            # find the end of the data
+            nlay = abs(nlay)
+            if imeth in (0, 1):
+                nbytes = nrow * ncol * nlay * isz
+            elif imeth == 2:
+                buf = read(4)
+                if len(buf) < 4:
+                    return None
+                nlist = i4.unpack(buf)[0]
+                ipos += 4
+                nbytes = nlist * (4 + isz)
+            elif imeth == 3:
+                nbytes = nrow * ncol * (isz + 4)
+            elif imeth == 4:
+                nbytes = nrow * ncol * isz
+            elif imeth in (5, 6):
+                buf = read(4)
+                if len(buf) < 4:
+                    return None
+                naux = i4.unpack(buf)[0] - 1
+                seek(naux * 16, 1)
+                buf = read(4)
+                if len(buf) < 4:
+                    return None
+                nlist = i4.unpack(buf)[0]
+                ipos += 8 + naux * 16
+                nbytes = nlist * ((imeth - 4) * 4 + isz + naux * isz)
+                if self.verbose:
+                    print("naux: ", naux)
+                    print("nlist: ", nlist)
+            else:
+                raise Exception(f"invalid method code {imeth}")
+            if nbytes < 0:
+                raise BudgetIndexError("Improper precision")
+            ipos += nbytes
+            if ipos > filesize:
+                return None
+            return idata, ipos
+
+        ipos = self.totalbytes
+        seek(ipos, 0)
+        while ipos < filesize:
+            hstart = len(headers)
+            record = read_record(ipos)
+            if record is None:
+                if not partial:
+                    raise BudgetIndexError("Incomplete record")
+                del headers[hstart:]
+                break
+            iposheader.append(ipos)
+            iposarray.append(record[0])
+            ipos = record[1]
+            seek(ipos, 0)
+        self.totalbytes = ipos
+
+        nrecords = len(iposheader)
+        if nrecords > 0:
+            self._add_records(
+                np.frombuffer(headers, dtype=self.header_dtype),
+                np.array(iposheader, dtype=np.int64),
+                np.array(iposarray, dtype=np.int64),
+            )
+        return nrecords
 
-                except:
-                    raise BudgetIndexError("Improper precision")
-                self.textlist.append(header["text"])
-                self.imethlist.append(header["imeth"])
-            if header["paknam"] not in self.paknamlist:
-                self.paknamlist.append(header["paknam"])
-            ipos = self.file.tell()
+    def _add_records(self, recordarray, iposheader, iposarray):
+        """
+        Add records to the index and update the unique times, time steps,
+        text and package names.
 
-            if self.verbose:
-                for itxt in [
-                    "kstp",
-                    "kper",
-                    "text",
-                    "ncol",
-                    "nrow",
-                    "nlay",
-                    "imeth",
-                    "delt",
-                    "pertim",
-                    "totim",
-                    "modelnam",
-                    "paknam",
-                    "modelnam2",
-                    "paknam2",
-                ]:
+        """
+        recordarray = recordarray.copy()
+        if self.verbose:
+            for header, ipos in zip(recordarray, iposarray):
+                for itxt in self.header_dtype.names:
                     s = header[itxt]
                     if isinstance(s, bytes):
                         s = s.decode()
                     print(f"{itxt}: {s}")
                 print("file position: ", ipos)
-                if (
-                    int(header["imeth"]) != 5
-                    and int(header["imeth"]) != 6
-                    and int(header["imeth"]) != 7
-                ):
-                    print("")
-
-            # set the nrow, ncol, and nlay if they have not been set
-            if self.nrow == 0:
-                text = header["text"]
-                if isinstance(text, bytes):
-                    text = text.decode()
-                if not text.endswith("FLOW-JA-FACE"):
-                    self.nrow = header["nrow"]
-                    self.ncol = header["ncol"]
-                    self.nlay = np.abs(header["nlay"])
-
-            # store record and byte position mapping
-            self.recorddict[
-                tuple(header)
-            ] = ipos  # store the position right after header2
-            self.recordarray.append(header)
-            self.iposarray.append(
-                ipos
-            )  # store the position right after header2
-
-            # skip over the data to the next record and set ipos
-            self._skip_record(header)
-            ipos = self.file.tell()
-
-        # convert to numpy arrays
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposheader = np.array(self.iposheader, dtype=np.int64)
-        self.iposarray = np.array(self.iposarray, dtype=np.int64)
-        self.nper = self.recordarray["kper"].max()
+                print("")
+
+        # set totim from the discretization if it is not in the file
+        totim = recordarray["totim"]
+        izero = np.where(totim == 0)[0]
+        if len(izero) > 0:
+            kstpkper = np.stack(
+                (recordarray["kstp"][izero], recordarray["kper"][izero]),
+                axis=1,
+            )
+            kstpkper, inverse = np.unique(
+                kstpkper, axis=0, return_inverse=True
+            )
+            values = [
+                self._totim_from_kstpkper((k - 1, p - 1)) for k, p in kstpkper
+            ]
+            totim[izero] = np.array(values)[inverse.ravel()]
+
+        self.recordarray = np.concatenate((self.recordarray, recordarray))
+        self.iposheader = np.concatenate((self.iposheader, iposheader))
+        self.iposarray = np.concatenate((self.iposarray, iposarray))
+        self.nrecords = len(self.recordarray)
+        self._recorddict = None
+
+        # unique values in the order that they occur in the file
+        def first_index(*arrays):
+            _, index = np.unique(
+                np.stack(arrays, axis=1), axis=0, return_index=True
+            )
+            return np.sort(index)
+
+        totim = self.recordarray["totim"]
+        kstp = self.recordarray["kstp"]
+        kper = self.recordarray["kper"]
+        text = self.recordarray["text"]
+        paknam = self.recordarray["paknam"]
+        self.times = [t for t in totim[first_index(totim)] if t >= 0]
+        self.kstpkper = [(kstp[i], kper[i]) for i in first_index(kstp, kper)]
+        _, itexts = np.unique(text, return_index=True)
+        itexts = np.sort(itexts)
+        self.textlist = list(text[itexts])
+        self.imethlist = list(self.recordarray["imeth"][itexts])
+        _, ipaknam = np.unique(paknam, return_index=True)
+        self.paknamlist = list(paknam[np.sort(ipaknam)])
+
+        # set the nrow, ncol, and nlay from the first record that is not
+        # a FLOW-JA-FACE record
+        for itext in itexts:
+            header = self.recordarray[itext]
+            if not header["text"].decode().endswith("FLOW-JA-FACE"):
+                self.nrow = header["nrow"]
+                self.ncol = header["ncol"]
+                self.nlay = np.abs(header["nlay"])
+                break
+
+        if self.nrecords > 0:
+            self.nper = self.recordarray["kper"].max()
+        return
+
+    def refresh(self):
+        """
+        Index records that were written to the file after it was opened or
+        last refreshed, for example by a simulation that is still running.
+        A partially written record at the end of the file is indexed by a
+        later call to refresh once it is complete.
+
+        Returns
+        -------
+        nrecords : int
+            Number of new records
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc', precision='double')
+        >>> if cbb.refresh() > 0:
+        ...     print(cbb.get_times()[-1])
+
+        """
+        return self._index_records(partial=True)
+
+    def _get_index(self):
+        """
+        Return the index as a dictionary of arrays and values.
+
+        """
+        return {
+            "header_dtype": str(self.header_dtype.descr),
+            "recordarray": self.recordarray,
+            "iposheader": self.iposheader,
+            "iposarray": self.iposarray,
+            "times": np.array(self.times, dtype=self.realtype),
+            "kstpkper": np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2),
+            "textlist": np.array(self.textlist, dtype="S16"),
+            "imethlist": np.array(self.imethlist, dtype=np.int32),
+            "paknamlist": np.array(self.paknamlist, dtype="S16"),
+            "nrow": self.nrow,
+            "ncol": self.ncol,
+            "nlay": self.nlay,
+            "nper": self.nper,
+            "totalbytes": self.totalbytes,
+        }
+
+    def _set_index(self, index):
+        """
+        Set the index from a dictionary returned by _get_index.
+
+        """
+        self.recordarray = index["recordarray"]
+        self.iposheader = index["iposheader"]
+        self.iposarray = index["iposarray"]
+        self.nrecords = len(self.recordarray)
+        self._recorddict = None
+        self.times = list(index["times"])
+        self.kstpkper = [tuple(kstpkper) for kstpkper in index["kstpkper"]]
+        self.textlist = list(index["textlist"])
+        self.imethlist = list(index["imethlist"])
+        self.paknamlist = list(index["paknamlist"])
+        self.nrow = int(index["nrow"])
+        self.ncol = int(index["ncol"])
+        self.nlay = int(index["nlay"])
+        self.nper = int(index["nper"])
+        self.totalbytes = int(index["totalbytes"])
         return
 
-    def _skip_record(self, header):
+    def _read_index(self):
         """
-        Skip over this record, not counting header and header2.
+        Set the index from the index cache file.  Returns False if there
+        is no current index cache for the file.
 
         """
-        nlay = abs(header["nlay"])
-        nrow = header["nrow"]
-        ncol = header["ncol"]
-        imeth = header["imeth"]
-        if imeth == 0:
-            nbytes = nrow * ncol * nlay * self.realtype(1).nbytes
-        elif imeth == 1:
-            nbytes = nrow * ncol * nlay * self.realtype(1).nbytes
-        elif imeth == 2:
-            nlist = binaryread(self.file, np.int32)[0]
-            nbytes = nlist * (np.int32(1).nbytes + self.realtype(1).nbytes)
-        elif imeth == 3:
-            nbytes = nrow * ncol * self.realtype(1).nbytes
-            nbytes += nrow * ncol * np.int32(1).nbytes
-        elif imeth == 4:
-            nbytes = nrow * ncol * self.realtype(1).nbytes
-        elif imeth == 5:
-            nauxp1 = binaryread(self.file, np.int32)[0]
-            naux = nauxp1 - 1
+        index = _read_index_cache(self.filename)
+        if index is None:
+            return False
+        if index["header_dtype"] != str(self.header_dtype.descr):
+            # the file was indexed using a different precision
+            raise BudgetIndexError("Improper precision")
+        self._set_index(index)
+        return True
 
-            for i in range(naux):
-                temp = binaryread(self.file, str, charlen=16)
-            nlist = binaryread(self.file, np.int32)[0]
-            if self.verbose:
-                print("naux: ", naux)
-                print("nlist: ", nlist)
-                print("")
-            nbytes = nlist * (
-                np.int32(1).nbytes
-                + self.realtype(1).nbytes
-                + naux * self.realtype(1).nbytes
-            )
-        elif imeth == 6:
-            # read rest of list data
-            nauxp1 = binaryread(self.file, np.int32)[0]
-            naux = nauxp1 - 1
+    def _write_index(self):
+        """
+        Write the index to the index cache file.
 
-            for i in range(naux):
-                temp = binaryread(self.file, str, charlen=16)
-            nlist = binaryread(self.file, np.int32)[0]
-            if self.verbose:
-                print("naux: ", naux)
-                print("nlist: ", nlist)
-                print("")
-            nbytes = nlist * (
-                np.int32(1).nbytes * 2
-                + self.realtype(1).nbytes
-                + naux * self.realtype(1).nbytes
-            )
-        else:
-            raise Exception(f"invalid method code {imeth}")
-        if nbytes != 0:
-            self.file.seek(nbytes, 1)
+        """
+        _write_index_cache(self.filename, **self._get_index())
         return
 
+    def _share_index(self, index_from):
+        """
+        Set the index from another file with the same record layout and
+        index any additional records at the end of this file.  Returns
+        False if the index was built with a different precision or if any
+        record in the index is not in this file.
+
+        """
+        if isinstance(index_from, dict):
+            index = index_from
+        else:
+            index = index_from._get_index()
+        if index["header_dtype"] != str(self.header_dtype.descr):
+            return False
+        if not self._index_matches(index):
+            return False
+        self._set_index(index)
+        self._index_records(partial=True)
+        return True
+
+    def _index_matches(self, index):
+        """
+        Check that every record in an index returned by _get_index is in
+        this file: each header is at its position with the same values,
+        and each list record has the same number of entries, so every
+        record ends where the next one starts.  Times that are not in the
+        file are not compared because they are set from the
+        discretization.  The headers are read into one buffer, with one
+        seek and one read per record, and compared with the recordarray
+        in bulk.  The file is positioned at the start when the check is
+        done.
+
+        """
+        recordarray = index["recordarray"]
+        iposheader = index["iposheader"]
+        iposarray = index["iposarray"]
+        totalbytes = int(index["totalbytes"])
+        nrecords = len(recordarray)
+        isz = self.realtype(1).itemsize
+        h2end = self.header1_dtype.itemsize + self.header2_dtype0.itemsize
+        hsize = self.header_dtype.itemsize
+        width = hsize + 4
+
+        # size of the header of each record in the file; list records are
+        # read with the item after the header (nlist or number of names)
+        nlay = recordarray["nlay"].astype(np.int64)
+        imeth = np.where(nlay < 0, recordarray["imeth"], 0)
+        islist = np.isin(imeth, (2, 5, 6))
+        hbytes = np.where(nlay < 0, h2end, self.header1_dtype.itemsize)
+        hbytes[imeth == 6] = hsize
+        nread = hbytes + 4 * islist
+
+        self.file.seek(0, 2)
+        match = (
+            nrecords > 0
+            and self.file.tell() >= totalbytes
+            and np.all((imeth >= 0) & (imeth <= 6))
+            and np.array_equal(iposarray - iposheader, hbytes)
+        )
+        if match:
+            # read each header to the start of its row, so the headers
+            # line up with the recordarray
+            headers = np.zeros((nrecords, width), dtype=np.uint8)
+            buf = memoryview(headers.reshape(-1))
+            seek = self.file.seek
+            readinto = self.file.readinto
+            start = np.arange(nrecords, dtype=np.int64) * width
+            nbytes = 0
+            for ipos, i0, i1 in zip(
+                iposheader.tolist(), start.tolist(), (start + nread).tolist()
+            ):
+                seek(ipos, 0)
+                nbytes += readinto(buf[i0:i1])
+            match = nbytes == nread.sum()
+        if match:
+            # move the item after the header out of the names of imeth 2
+            # and 5 records
+            i = islist & (imeth != 6)
+            headers[i, hsize:] = headers[i, h2end : h2end + 4]
+            headers[i, h2end : h2end + 4] = 0
+            nitems = headers[:, hsize:].copy().view(np.int32).ravel()
+            nitems = nitems.astype(np.int64)
+
+            # compare the headers, except for times that are not in the file
+            expected = np.ascontiguousarray(recordarray).view(np.uint8)
+            expected = expected.reshape(nrecords, hsize)
+            i0 = self.header_dtype.fields["totim"][1]
+            i1 = i0 + isz
+            totim = headers[:, i0:i1].copy().view(self.realtype).ravel()
+            match = (
+                np.array_equal(headers[:, :i0], expected[:, :i0])
+                and np.array_equal(headers[:, i1:hsize], expected[:, i1:])
+                and np.all((totim == recordarray["totim"]) | (totim == 0.0))
+            )
+
+        if match:
+            # the data must end where the next record starts
+            nrow = recordarray["nrow"].astype(np.int64)
+            ncol = recordarray["ncol"].astype(np.int64)
+            nbytes = nrow * ncol * np.abs(nlay) * isz
+            nbytes[imeth == 3] = (nrow * ncol * (isz + 4))[imeth == 3]
+            nbytes[imeth == 4] = (nrow * ncol * isz)[imeth == 4]
+            i = imeth == 2
+            nbytes[i] = 4 + nitems[i] * (4 + isz)
+            for i in np.flatnonzero((imeth == 5) | (imeth == 6)).tolist():
+                naux = int(nitems[i]) - 1
+                if naux < 0:
+                    match = False
+                    break
+                self.file.seek(int(iposarray[i]) + 4 + naux * 16, 0)
+                buf = self.file.read(4)
+                if len(buf) < 4:
+                    match = False
+                    break
+                nlist = int(np.frombuffer(buf, dtype=np.int32)[0])
+                nbytes[i] = (
+                    8
+                    + naux * 16
+                    + nlist * ((imeth[i] - 4) * 4 + isz + naux * isz)
+                )
+        if match:
+            iposend = np.append(iposheader[1:], totalbytes)
+            match = np.array_equal(iposarray + nbytes, iposend)
+        self.file.seek(0, 0)
+        return bool(match)
+
+    @property
+    def recorddict(self):
+        """
+        Dictionary that maps each header, as a tuple, to the position of
+        the data in the binary file.  The dictionary is built on first
+        access.
+
+        """
+        if self._recorddict is None:
+            self._recorddict = {
+                tuple(header): ipos
+                for header, ipos in zip(self.recordarray, self.iposarray)
+            }
+        return self._recorddict
+
     def _get_header(self):
         """
         Read the file header
@@ -1347,6 +2172,84 @@ class CellBudgetFile:
 
         return recordlist
 
+    def iter_records(self, text=None, paknam=None, chunk=1, full3D=False):
+        """
+        Iterate over budget records in file order, in blocks of records.
+
+        Only one block of records is held in memory at a time, so
+        reductions over long transient runs (time-averaged flux, maximum
+        leakage, etc.) can be computed in a single pass through the file.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.  If None,
+            all records are included. (Default is None.)
+        paknam : str
+            The package name for the records.  If None, records for all
+            packages are included. (Default is None.)
+        chunk : int
+            Maximum number of records in each block. (Default is 1.)
+        full3D : boolean
+            If true, then return list-style 'COMPACT BUDGET' records as
+            three dimensional numpy masked arrays. (Default is False.)
+
+        Yields
+        ------
+        kstpkper : list of tuples
+            Zero-based (kstp, kper) for each record in the block.
+        totim : numpy array
+            Simulation time of each record in the block.
+        data : numpy array or list
+            If all records in the block are arrays of the same shape, a
+            numpy array of size (n, ...), where n is the number of records
+            in the block.  Otherwise a list of records as returned by
+            get_record().
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> total, n = 0.0, 0
+        >>> for kstpkper, totim, q in cbb.iter_records(
+        ...     text='FLOW RIGHT FACE', chunk=10
+        ... ):
+        ...     total += q.sum(axis=0)
+        ...     n += q.shape[0]
+        >>> qavg = total / n
+
+        """
+        chunk = int(chunk)
+        if chunk < 1:
+            raise ValueError("chunk must be a positive integer")
+        select = np.ones(self.nrecords, dtype=bool)
+        if text is not None:
+            select &= self.recordarray["text"] == self._find_text(text)
+        if paknam is not None:
+            select &= self.recordarray["paknam"] == self._find_paknam(paknam)
+        select_indices = np.nonzero(select)[0]
+
+        for i0 in range(0, select_indices.shape[0], chunk):
+            block = select_indices[i0 : i0 + chunk]
+            header = self.recordarray[block]
+            kstpkper = [
+                (int(kstp) - 1, int(kper) - 1)
+                for kstp, kper in zip(header["kstp"], header["kper"])
+            ]
+            data = [self.get_record(idx, full3D=full3D) for idx in block]
+            if all(
+                isinstance(d, np.ndarray)
+                and d.dtype.names is None
+                and d.shape == data[0].shape
+                for d in data
+            ):
+                if any(isinstance(d, np.ma.MaskedArray) for d in data):
+                    data = np.ma.stack(data)
+                else:
+                    data = np.stack(data)
+            yield kstpkper, header["totim"].copy(), data
+
     def get_ts(self, idx, text=None, times=None):
         """
         Get a time series from the binary budget file.
@@ -1357,17 +2260,20 @@ class CellBudgetFile:
             idx can be (layer, row, column) or it can be a list in the form
             [(layer, row, column), (layer, row, column), ...].  The layer,
             row, and column values must be zero based.
-        text : str
+        text : str or list of str
             The text identifier for the record.  Examples include
-            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.  A list of
+            text identifiers can be specified to extract time series for
+            several records in a single pass over the file.
         times : iterable of floats
             List of times to from which to get time series.
 
         Returns
         ----------
-        out : numpy array
+        out : numpy array or dict
             Array has size (ntimes, ncells + 1).  The first column in the
-            data array will contain time (totim).
+            data array will contain time (totim).  If text is a list, a
+            dictionary of arrays keyed by the text identifiers is returned.
 
         See Also
         --------
@@ -1378,6 +2284,11 @@ class CellBudgetFile:
         The layer, row, and column values must be zero-based, and must be
         within the following ranges: 0 <= k < nlay; 0 <= i < nrow; 0 <= j < ncol
 
+        Only the bytes spanning the requested cells are read for array
+        records.  List records are read once per time step and matched to
+        the requested cells with a node lookup that is reused while the
+        node list of a package does not change.
+
         Examples
         --------
 
@@ -1388,13 +2299,14 @@ class CellBudgetFile:
                 "text keyword must be provided to CellBudgetFile "
                 "get_ts() method."
             )
+        if isinstance(text, (list, tuple)):
+            textlist = list(text)
+        else:
+            textlist = [text]
 
         kijlist = self._build_kijlist(idx)
         nstation = self._get_nstation(idx, kijlist)
 
-        # Initialize result array and put times in first column
-        result = self._init_result(nstation)
-
         kk = self.get_kstpkper()
         timesint = self.get_times()
         if len(timesint) < 1:
@@ -1410,51 +2322,130 @@ class CellBudgetFile:
                         "not {}".format(len(kk), len(times))
                     )
                 timesint = times
-        for idx, t in enumerate(timesint):
-            result[idx, 0] = t
-
-        for itim, k in enumerate(kk):
-            try:
-                v = self.get_data(kstpkper=k, text=text, full3D=True)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    v = v[0]
-                    istat = 1
-                    for k, i, j in kijlist:
-                        result[itim, istat] = v[k, i, j].copy()
-                        istat += 1
-            except ValueError:
-                v = self.get_data(kstpkper=k, text=text)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    if self.modelgrid is None:
-                        s = (
-                            "A modelgrid instance must be provided during "
-                            "instantiation to get IMETH=6 timeseries data"
-                        )
-                        raise AssertionError(s)
-
-                    if self.modelgrid.grid_type == "structured":
-                        ndx = [
-                            lrc[0]
-                            * (self.modelgrid.nrow * self.modelgrid.ncol)
-                            + lrc[1] * self.modelgrid.ncol
-                            + (lrc[2] + 1)
-                            for lrc in kijlist
-                        ]
-                    else:
-                        ndx = [
-                            lrc[0] * self.modelgrid.ncpl + (lrc[-1] + 1)
-                            for lrc in kijlist
-                        ]
 
-                    for vv in v:
-                        field = vv.dtype.names[2]
-                        dix = np.where(np.isin(vv["node"], ndx))[0]
-                        if len(dix) > 0:
-                            result[itim, 1:] = vv[field][dix]
+        # Initialize result arrays and put times in first column
+        results = []
+        for _ in textlist:
+            result = self._init_result(nstation)
+            for itim, t in enumerate(timesint):
+                result[itim, 0] = t
+            results.append(result)
+
+        # zero-based node numbers of the requested cells
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        if (
+            self.modelgrid is not None
+            and self.modelgrid.grid_type != "structured"
+        ):
+            nodes = kij[:, 0] * self.modelgrid.ncpl + kij[:, -1]
+        else:
+            nodes = (kij[:, 0] * self.nrow + kij[:, 1]) * self.ncol + kij[:, 2]
+
+        # select the first record for each time step and text, and
+        # process the selected records in file order
+        kstpkper_index = {k: itim for itim, k in enumerate(self.kstpkper)}
+        selected = []
+        for itext, t in enumerate(textlist):
+            text16 = self._find_text(t)
+            found = set()
+            for irec in np.where(self.recordarray["text"] == text16)[0]:
+                header = self.recordarray[irec]
+                kstpkper = (header["kstp"], header["kper"])
+                if kstpkper in found:
+                    continue
+                found.add(kstpkper)
+                selected.append((irec, itext, kstpkper_index[kstpkper]))
+        selected.sort(key=lambda rec: self.iposarray[rec[0]])
+
+        cache = {}
+        for irec, itext, itim in selected:
+            results[itext][itim, 1:] = self._get_ts_values(
+                irec, kij, nodes, cache
+            )
 
-        return result
+        if isinstance(text, (list, tuple)):
+            return dict(zip(textlist, results))
+        return results[0]
+
+    def _get_ts_values(self, idx, kij, nodes, cache):
+        """
+        Read the values for zero-based nodes from record idx.  Values for
+        nodes that are not in the record are returned as nan.
+
+        Parameters
+        ----------
+        idx : int
+            The zero-based record number.
+        kij : numpy array
+            (ncells, 3) array of zero-based layer, row, and column values.
+        nodes : numpy array
+            zero-based node numbers of the cells
+        cache : dict
+            node lookups for list records, keyed by text and package name
+
+        Returns
+        -------
+        values : numpy array
+            Values for each node
+
+        """
+        header = self.recordarray[idx]
+        imeth = header["imeth"]
+        nlay = abs(header["nlay"])
+        nrow = header["nrow"]
+        ncol = header["ncol"]
+        ipos = int(self.iposarray[idx])
+        values = np.full(len(nodes), np.nan, dtype=self.realtype)
+
+        if imeth in (0, 1, 3, 4):
+            if imeth in (0, 1):
+                icell = nodes
+                nvals = nlay * nrow * ncol
+                valid = icell < nvals
+            else:
+                icell = kij[:, 1] * ncol + kij[:, 2]
+                nvals = nrow * ncol
+                valid = icell < nvals
+                if imeth == 4:
+                    # imeth 4 records only contain values for layer 1
+                    valid &= kij[:, 0] == 0
+            if not np.any(valid):
+                return values
+
+            # read the span of the record that contains the cells
+            i0 = icell[valid].min()
+            i1 = icell[valid].max() + 1
+            isz = self.realtype(1).itemsize
+            if imeth == 3:
+                self.file.seek(ipos + i0 * np.int32(1).itemsize, 0)
+                ilayer = np.fromfile(self.file, np.int32, i1 - i0)
+                valid[valid] = ilayer[icell[valid] - i0] - 1 == kij[valid, 0]
+                ipos += nvals * np.int32(1).itemsize
+            self.file.seek(ipos + i0 * isz, 0)
+            data = np.fromfile(self.file, self.realtype, i1 - i0)
+            values[valid] = data[icell[valid] - i0]
+            return values
+
+        # list records
+        data = self.get_record(idx)
+        key = (header["text"], header["paknam"])
+        node = data["node"]
+        if key in cache and np.array_equal(cache[key][0], node):
+            unique_nodes, inverse, loc = cache[key][1:]
+        else:
+            unique_nodes, inverse = np.unique(nodes, return_inverse=True)
+            # node numbers in the budget file are one-based
+            loc = np.searchsorted(unique_nodes, node - 1)
+            loc[loc == len(unique_nodes)] = 0
+            loc[unique_nodes[loc] != node - 1] = -1
+            cache[key] = (node.copy(), unique_nodes, inverse, loc)
+        found = loc >= 0
+        n = len(unique_nodes)
+        count = np.bincount(loc[found], minlength=n)
+        q = np.bincount(loc[found], weights=data["q"][found], minlength=n)
+        q = np.where(count > 0, q, np.nan)
+        values[:] = q[inverse]
+        return values
 
     def _build_kijlist(self, idx):
         if isinstance(idx, list):
@@ -1827,6 +2818,23 @@ class HeadUFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    memmap : bool
+        Keyword argument.  If True, data are accessed through a read-only
+        numpy memory map of the file and get_data returns views into the
+        map instead of copies where the record layout allows it.  Several
+        processes reading the same file then share the operating system
+        page cache.  Default is False.
+    index_cache : bool
+        Keyword argument.  If True, the record index is saved to a
+        <filename>.flopyidx file and reused when the file is opened again,
+        as long as the size and modification time of the file have not
+        changed.  Default is False.
+    index_from : HeadUFile
+        Keyword argument.  An open HeadUFile for another file with the same
+        record layout, such as the output of another realization of the
+        same model.  Its index is reused if every indexed record is at the
+        same position in this file with the same header, and this file is
+        indexed as usual otherwise.  Default is None.
 
     Attributes
     ----------
@@ -1912,10 +2920,24 @@ class HeadUFile(BinaryLayerFile):
             npl = nend - nstrt + 1
             if self.verbose:
                 print(f"Byte position in file: {ipos} for layer {ilay}")
-            self.file.seek(ipos, 0)
-            data[ilay - 1] = binaryread(self.file, self.realtype, shape=(npl,))
+            if self._memmap is not None:
+                data[ilay - 1] = self._record_view(idx, (npl,))
+            else:
+                self.file.seek(ipos, 0)
+                data[ilay - 1] = binaryread(
+                    self.file, self.realtype, shape=(npl,)
+                )
         return data
 
+    def get_alldata(self, mflay=None, nodata=-9999):
+        """
+        Get all of the data from the file.  Layers in an unstructured file
+        can have different sizes, so data are always read one time at a
+        time and cannot be returned as a single view of a memory map.
+
+        """
+        return LayerFile.get_alldata(self, mflay=mflay, nodata=nodata)
+
     def get_databytes(self, header):
         """
 
@@ -573,6 +573,68 @@ class LayerFile:
         rv[rv == nodata] = np.nan
         return rv
 
+    def iter_records(self, chunk=1, mflay=None, nodata=-9999):
+        """
+        Iterate over the data in the file in blocks of simulation times.
+
+        Only one block of data is held in memory at a time, so reductions
+        over long transient runs can be computed in a single pass without
+        building the full (ntimes, nlay, nrow, ncol) array returned by
+        get_alldata().
+
+        Parameters
+        ----------
+        chunk : int
+            Maximum number of simulation times in each block. (Default is 1.)
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan.
+
+        Yields
+        ------
+        kstpkper : list of tuples
+            Zero-based (kstp, kper) for each time in the block.
+        totim : numpy array
+            Simulation times in the block.
+        data : numpy array
+            Array has size (n, nlay, nrow, ncol) if mflay is None or it
+            has size (n, nrow, ncol) if mlay is specified, where n is the
+            number of times in the block.  For unstructured files with
+            ragged layers, a list with one entry per time is returned.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> hmax = None
+        >>> for kstpkper, totim, h in hdobj.iter_records(chunk=10):
+        ...     h = np.nanmax(h, axis=0)
+        ...     hmax = h if hmax is None else np.fmax(hmax, h)
+
+        """
+        chunk = int(chunk)
+        if chunk < 1:
+            raise ValueError("chunk must be a positive integer")
+        rectimes = self.recordarray["totim"]
+        for i0 in range(0, len(self.times), chunk):
+            times = self.times[i0 : i0 + chunk]
+            kstpkper = []
+            data = []
+            for totim in times:
+                header = self.recordarray[np.argmax(rectimes == totim)]
+                kstpkper.append(
+                    (int(header["kstp"]) - 1, int(header["kper"]) - 1)
+                )
+                data.append(self.get_data(totim=totim, mflay=mflay))
+            if all(isinstance(d, np.ndarray) for d in data):
+                data = np.array(data)
+                data[data == nodata] = np.nan
+            yield kstpkper, np.array(times), data
+
     def _read_data(self, shp):
         """
         Read data from file
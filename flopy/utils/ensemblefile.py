@@ -0,0 +1,235 @@
+"""
+Module to read the same data from the binary output files of an ensemble
+of model realizations.  The module contains one important class that can
+be accessed by the user.
+
+*  EnsembleFile (binary head, concentration or budget files of an ensemble)
+
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .binaryfile import HeadFile
+
+
+def _stack(arrays):
+    """
+    Stack a list of arrays, keeping masks if any of the arrays are masked.
+
+    """
+    if any(isinstance(a, np.ma.MaskedArray) for a in arrays):
+        return np.ma.stack(arrays)
+    return np.stack(arrays)
+
+
+def _read_realization(filetype, filename, kwargs, index, method, args, kw):
+    """
+    Open the output file of one realization and call one of its methods.
+    Lists of records returned by budget files are stacked into a single
+    array.  This is a module level function so that it can be used with a
+    process pool.
+
+    """
+    if index is not None:
+        kwargs = dict(kwargs, index_from=index)
+    with filetype(filename, **kwargs) as f:
+        result = getattr(f, method)(*args, **kw)
+    if isinstance(result, list):
+        result = _stack(result)
+    return result
+
+
+class EnsembleFile:
+    """
+    Read the same data from the binary output files of every realization
+    of an ensemble and return it as one array with a leading realization
+    dimension.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Output file for each realization.
+    filetype : class
+        Class used to read each file, for example HeadFile, UcnFile or
+        CellBudgetFile.  (Default is HeadFile.)
+    max_workers : int
+        Maximum number of files read at the same time.  If 1, the files are
+        read one after the other.  If None, the default of
+        concurrent.futures is used.  (Default is None.)
+    multiprocess : bool
+        If True, files are read in a pool of processes instead of a pool of
+        threads.  (Default is False.)
+    share_index : bool
+        If True, the record index of the first file is reused for the other
+        files, which share the same record layout when they are output
+        from realizations of the same model.  (Default is True.)
+    **kwargs : dict
+        Keyword arguments passed to filetype when each file is opened,
+        for example precision or text.
+
+    Notes
+    -----
+    Each call opens every file, reads the data and closes the file again,
+    so the number of open files does not grow with the size of the
+    ensemble.  Realizations must have the same number of times and records
+    for the results to be stacked.
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> files = [f'real{i:03d}/model.hds' for i in range(500)]
+    >>> ens = flopy.utils.EnsembleFile(files, max_workers=8)
+    >>> ts = ens.get_ts([(0, 10, 10), (2, 5, 7)])
+
+    """
+
+    def __init__(
+        self,
+        filenames,
+        filetype=HeadFile,
+        max_workers=None,
+        multiprocess=False,
+        share_index=True,
+        **kwargs,
+    ):
+        self.filenames = list(filenames)
+        if len(self.filenames) == 0:
+            raise ValueError("EnsembleFile requires at least one file")
+        self.nreal = len(self.filenames)
+        self.filetype = filetype
+        self.max_workers = max_workers
+        self.multiprocess = multiprocess
+        self.kwargs = kwargs
+
+        # index the first file and keep the times from it
+        with filetype(self.filenames[0], **kwargs) as f:
+            self.times = f.get_times()
+            self.kstpkper = f.get_kstpkper()
+            if share_index:
+                self._index = f._get_index()
+            else:
+                self._index = None
+        return
+
+    def get_times(self):
+        """
+        Get a list of unique times in the first file of the ensemble
+
+        Returns
+        ----------
+        out : list of floats
+            List contains unique simulation times (totim) in binary file.
+
+        """
+        return self.times
+
+    def get_kstpkper(self):
+        """
+        Get a list of unique stress periods and time steps in the first
+        file of the ensemble
+
+        Returns
+        ----------
+        out : list of (kstp, kper) tuples
+            List of unique kstp, kper combinations in binary file.  kstp and
+            kper values are zero-based.
+
+        """
+        return self.kstpkper
+
+    def _map(self, method, *args, **kw):
+        """
+        Call a method of the file object for every realization and stack
+        the results.
+
+        """
+        tasks = [
+            (self.filetype, fname, self.kwargs, self._index, method, args, kw)
+            for fname in self.filenames
+        ]
+        if self.max_workers == 1:
+            results = [_read_realization(*task) for task in tasks]
+        else:
+            if self.multiprocess:
+                executor = ProcessPoolExecutor
+            else:
+                executor = ThreadPoolExecutor
+            with executor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(_read_realization, *zip(*tasks)))
+        if isinstance(results[0], dict):
+            return {
+                key: _stack([result[key] for result in results])
+                for key in results[0]
+            }
+        return _stack(results)
+
+    def get_ts(self, idx, **kwargs):
+        """
+        Get a time series from every file in the ensemble.
+
+        Parameters
+        ----------
+        idx : tuple of ints, or a list of a tuple of ints
+            idx can be (layer, row, column) or it can be a list in the form
+            [(layer, row, column), (layer, row, column), ...].
+        **kwargs : dict
+            Additional arguments of the get_ts method of filetype, for
+            example text for budget files.
+
+        Returns
+        ----------
+        out : numpy array
+            Array has size (nreal, ntimes, ncells + 1).  The first column
+            of the last dimension has the simulation time.  A dictionary of
+            arrays is returned if get_ts of filetype returns a dictionary.
+
+        """
+        return self._map("get_ts", idx, **kwargs)
+
+    def get_data(self, **kwargs):
+        """
+        Get data from every file in the ensemble.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Arguments of the get_data method of filetype, for example
+            kstpkper, totim and mflay for head files or kstpkper, text and
+            full3D for budget files.
+
+        Returns
+        ----------
+        out : numpy array
+            Array has size (nreal, nlay, nrow, ncol) for head files.  For
+            budget files, the records selected in each file are stacked and
+            the array has size (nreal, nrecords, ...), so only array records
+            or full3D records can be returned.
+
+        """
+        return self._map("get_data", **kwargs)
+
+    def get_alldata(self, mflay=None, nodata=-9999):
+        """
+        Get all of the data from every head or concentration file in the
+        ensemble.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan.
+
+        Returns
+        ----------
+        data : numpy array
+            Array has size (nreal, ntimes, nlay, nrow, ncol) if mflay is
+            None or it has size (nreal, ntimes, nrow, ncol) if mlay is
+            specified.
+
+        """
+        return self._map("get_alldata", mflay=mflay, nodata=nodata)
@@ -382,6 +382,80 @@ def get_url_text(url, error_msg=None):
         return
 
 
+def _parse_free_block(lines, ra):
+    """
+    Parse a block of whitespace separated list lines into ra in one pass.
+    Values after the last column of ra are ignored.  A ValueError or
+    IndexError is raised if a line has too few values or a value cannot
+    be converted.
+
+    Parameters
+    ----------
+    lines : list of str
+        lines of the list, one per row of ra
+    ra : np.recarray
+        record array that is filled with the list
+
+    """
+    ncol = len(ra.dtype.names)
+    data = np.loadtxt(
+        lines,
+        dtype=ra.dtype,
+        comments=None,
+        usecols=range(ncol),
+        ndmin=1,
+    )
+    if data.shape[0] != len(lines):
+        raise ValueError("list has blank lines")
+    ra[:] = data
+
+
+def _parse_fixed_block(lines, ra, length=10):
+    """
+    Parse a block of fixed format list lines into ra in one pass, using
+    the same rules as read_fixed_var: each column is length characters
+    wide and blank or missing columns are zero.
+
+    Parameters
+    ----------
+    lines : list of str
+        lines of the list, one per row of ra
+    ra : np.recarray
+        record array that is filled with the list
+    length : int
+        width of each column. (default is 10)
+
+    """
+    ncol = len(ra.dtype.names)
+    nlist = len(lines)
+    # truncate or pad each line to ncol fields and split into fields
+    text = np.array(
+        [line.rstrip() for line in lines], dtype=f"U{ncol * length}"
+    )
+    codes = text.view(np.uint32).reshape(nlist, ncol, length)
+    if codes.max(initial=0) > 127:
+        raise ValueError("list contains non-ascii characters")
+
+    # separate the fields with a space, set blank fields to zero and
+    # parse the block as whitespace separated text
+    buf = np.full((nlist, ncol, length + 1), 32, dtype=np.uint8)
+    buf[:, :, :length] = codes
+    buf[buf == 0] = 32
+    blank = ~(codes > 32).any(axis=2)
+    buf[blank, 0] = ord("0")
+    buf = buf.reshape(nlist, -1)
+    buf[:, -1] = ord("\n")
+    data = np.loadtxt(
+        buf.tobytes().decode("ascii").splitlines(),
+        dtype=ra.dtype,
+        comments=None,
+        ndmin=1,
+    )
+    if data.shape[0] != nlist:
+        raise ValueError("list has too few lines")
+    ra[:] = data
+
+
 def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
     """
     Read a list and allow for open/close, binary, external, sfac, etc.
@@ -477,28 +551,35 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
         ra = ra.view(np.recarray)
 
     # else, read ascii
-    else:
-
-        for ii in range(nlist):
-
-            # first line was already read
-            if ii != 0:
-                line = file_handle.readline()
-
+    elif nlist > 0:
+        # first line was already read
+        lines = [line]
+        for ii in range(1, nlist):
+            lines.append(file_handle.readline())
+
+        # parse the whole block at once and fall back to parsing each
+        # line if the block is ragged or has values numpy cannot convert
+        try:
             if model.free_format_input:
-                # whitespace separated
-                t = line.strip().split()
-                if len(t) < ncol:
-                    t = t + (ncol - len(t)) * [0.0]
-                else:
-                    t = t[:ncol]
-                t = tuple(t)
-                ra[ii] = t
+                _parse_free_block(lines, ra)
             else:
-                # fixed format
-                t = read_fixed_var(line, ncol=ncol)
-                t = tuple(t)
-                ra[ii] = t
+                _parse_fixed_block(lines, ra)
+        except (ValueError, IndexError):
+            for ii, line in enumerate(lines):
+                if model.free_format_input:
+                    # whitespace separated
+                    t = line.strip().split()
+                    if len(t) < ncol:
+                        t = t + (ncol - len(t)) * [0.0]
+                    else:
+                        t = t[:ncol]
+                    t = tuple(t)
+                    ra[ii] = t
+                else:
+                    # fixed format
+                    t = read_fixed_var(line, ncol=ncol)
+                    t = tuple(t)
+                    ra[ii] = t
 
     # scale the data and check
     for column_name in sfac_columns:
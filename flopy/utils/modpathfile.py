@@ -7,14 +7,62 @@ important classes that can be accessed by the user.
 
 """
 
+import io
 import itertools
+import os
+import warnings
 import numpy as np
 
 from numpy.lib.recfunctions import append_fields, stack_arrays
 
+from ..utils import import_optional_dependency
 from ..utils.flopy_io import loadtxt
 from ..utils.recarray_utils import ra_slice
 
+# number of lines parsed at a time and number of records filtered at a time
+CHUNKSIZE = 100000
+
+# increment if the content of the columnar cache files changes
+CACHE_VERSION = 1
+
+
+def _sort_order(partid, time):
+    """
+    Get the indices that sort records by particle id and time, or None if
+    the records are already sorted. The sort is stable, so points with
+    equal times stay in file order.
+    """
+    if partid.size > 1:
+        same = partid[1:] == partid[:-1]
+        if np.any(partid[1:] < partid[:-1]) or np.any(
+            same & (time[1:] < time[:-1])
+        ):
+            return np.lexsort((time, partid))
+    return None
+
+
+def _particle_offsets(partid):
+    """
+    Get the unique particle ids of records that are sorted by particle id
+    and the offsets of the first record of each particle id. The last
+    offset is the number of records.
+    """
+    if partid.size > 0:
+        starts = np.flatnonzero(partid[1:] != partid[:-1]) + 1
+        starts = np.concatenate(([0], starts))
+    else:
+        starts = np.zeros(0, dtype=int)
+    return np.array(partid[starts]), np.append(starts, partid.size)
+
+
+def _slices_to_index(start, end):
+    """
+    Get an index array for the records in a set of [start, end) slices.
+    """
+    lengths = end - start
+    index = np.arange(lengths.sum())
+    return index + np.repeat(start - (np.cumsum(lengths) - lengths), lengths)
+
 
 class _ModpathSeries(object):
     """
@@ -31,10 +79,15 @@ class _ModpathSeries(object):
         Write information to the screen. Default is False
     output_type : str
         pathline or timeseries file type
+    cache_dir : str
+        Directory for a columnar cache of the data. If None, all of the data
+        are loaded into memory. Default is None
 
     """
 
-    def __init__(self, filename, verbose=False, output_type="pathline"):
+    def __init__(
+        self, filename, verbose=False, output_type="pathline", cache_dir=None
+    ):
         self.fname = filename
         self.verbose = verbose
         self.output_type = output_type.upper()
@@ -44,6 +97,272 @@ class _ModpathSeries(object):
         # set output type
         self.outdtype = self._get_outdtype()
 
+        # set data dtype and read the data
+        self.dtype = self._get_dtypes()
+        self._records = None
+        self._columns = None
+        if cache_dir is None:
+            self._load_data()
+        else:
+            self._load_cache(cache_dir)
+
+        # close the input file
+        self.file.close()
+
+    @property
+    def _data(self):
+        """
+        All of the records, sorted by particle id and time. Records are
+        read from the cache the first time all of them are needed.
+        """
+        if self._records is None:
+            self._records = self._get_records(slice(None))
+        return self._records
+
+    @_data.setter
+    def _data(self, data):
+        self._records = data
+        self._columns = None
+
+    def _read_chunks(self, chunksize=CHUNKSIZE):
+        """
+        Parse the data in chunks of chunksize lines with the pandas C
+        parser.
+
+        Parameters
+        ----------
+        chunksize : int
+            Number of lines parsed at a time.
+
+        Yields
+        ------
+        data : np.ndarray
+            Records in the chunk, with zero-based indices.
+
+        """
+        pd = import_optional_dependency("pandas")
+        self.file.seek(0)
+        reader = pd.read_csv(
+            self.file,
+            dtype=self.dtype,
+            skiprows=self.skiprows,
+            delim_whitespace=True,
+            names=self.dtype.names,
+            chunksize=chunksize,
+        )
+        for df in reader:
+            yield self._zero_based(df.to_records(index=False))
+
+    def _zero_based(self, data):
+        """
+        Convert layer, row, and column indices; particle id and group; and
+        line segment indices to zero-based.
+        """
+        for n in self.kijnames:
+            if n in data.dtype.names:
+                data[n] -= 1
+        return data
+
+    def _load_data(self):
+        """
+        Load all of the data into memory.
+        """
+        chunks = list(self._read_chunks())
+        if chunks:
+            data = np.concatenate(chunks)
+        else:
+            data = np.zeros(0, dtype=self.dtype)
+        del chunks
+        if self.verbose:
+            print(f"read {data.size} {self.output_type.lower()} records")
+        order = _sort_order(data["particleid"], data["time"])
+        if order is not None:
+            data = data[order]
+        self._data = data.view(np.recarray)
+        self.nid, self._offsets = _particle_offsets(data["particleid"])
+
+    def _load_cache(self, cache_dir):
+        """
+        Memory-map the columns of the data from the cache in cache_dir.
+        The file is converted to the cache first if the cache does not
+        exist or if the size or modification time of the file have changed
+        since the cache was written. All of the data are loaded into memory
+        if the cache cannot be written.
+        """
+        prefix = os.path.join(cache_dir, os.path.basename(self.fname))
+        index = self._read_cache_index(prefix)
+        if index is None:
+            try:
+                index = self._write_cache(prefix)
+            except OSError as e:
+                warnings.warn(f"Could not write cache {prefix}: {e}")
+                self._load_data()
+                return
+        self.nid = index["nid"]
+        self._offsets = index["offsets"]
+        self._columns = {
+            name: np.load(f"{prefix}.{name}.npy", mmap_mode="r")
+            for name in self.dtype.names
+        }
+
+    def _read_cache_index(self, prefix):
+        """
+        Read the index of the cache with the file name prefix. Returns None
+        if the cache does not exist or is not current.
+        """
+        fpth = f"{prefix}.index.npz"
+        if not os.path.isfile(fpth):
+            return None
+        stat = os.stat(self.fname)
+        try:
+            with np.load(fpth, allow_pickle=False) as f:
+                index = {key: f[key] for key in f.files}
+        except (OSError, ValueError):
+            return None
+        if (
+            index.get("version") != CACHE_VERSION
+            or index.get("filesize") != stat.st_size
+            or index.get("mtime") != stat.st_mtime_ns
+            or index.get("dtype") != str(self.dtype.descr)
+        ):
+            return None
+        return index
+
+    def _write_cache(self, prefix):
+        """
+        Convert the file to a cache with a .npy file for each column of the
+        data, sorted by particle id and time, and an index file. The file
+        is parsed in chunks, and columns are sorted one at a time, so all of
+        the data are never held in memory.
+        """
+        stat = os.stat(self.fname)
+        fpth = f"{prefix}.index.npz"
+        os.makedirs(os.path.dirname(fpth) or ".", exist_ok=True)
+        if os.path.isfile(fpth):
+            os.remove(fpth)
+
+        # temporary files for the columns in file order
+        tmp = {
+            name: f"{prefix}.{name}.{os.getpid()}.tmp"
+            for name in self.dtype.names
+        }
+        try:
+            self._write_cache_columns(prefix, tmp)
+        finally:
+            for fname in tmp.values():
+                if os.path.isfile(fname):
+                    os.remove(fname)
+
+        # write the index last, so an incomplete cache is never used
+        partid = np.load(f"{prefix}.particleid.npy", mmap_mode="r")
+        nid, offsets = _particle_offsets(partid)
+        del partid
+        index = {
+            "version": CACHE_VERSION,
+            "filesize": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "dtype": str(self.dtype.descr),
+            "nid": nid,
+            "offsets": offsets,
+        }
+        tpth = f"{fpth}.{os.getpid()}.tmp"
+        with open(tpth, "wb") as f:
+            np.savez(f, **index)
+        os.replace(tpth, fpth)
+        return index
+
+    def _write_cache_columns(self, prefix, tmp):
+        """
+        Write a sorted .npy file for each column of the data, using the
+        temporary files in tmp for the columns in file order.
+        """
+        names = self.dtype.names
+
+        # write the raw columns in file order
+        for name in names:
+            open(tmp[name], "wb").close()
+        nrecords = 0
+        is_sorted = True
+        last = None
+        for data in self._read_chunks():
+            for name in names:
+                with open(tmp[name], "ab") as f:
+                    np.ascontiguousarray(data[name]).tofile(f)
+            if data.size > 0:
+                partid, time = data["particleid"], data["time"]
+                if is_sorted and last is not None:
+                    is_sorted = partid[0] > last[0] or (
+                        partid[0] == last[0] and time[0] >= last[1]
+                    )
+                if is_sorted:
+                    is_sorted = _sort_order(partid, time) is None
+                last = (partid[-1], time[-1])
+            nrecords += data.size
+        if self.verbose:
+            print(f"read {nrecords} {self.output_type.lower()} records")
+
+        def load_raw(name):
+            if nrecords == 0:
+                return np.zeros(0, dtype=self.dtype[name])
+            return np.memmap(
+                tmp[name], dtype=self.dtype[name], mode="r", shape=(nrecords,)
+            )
+
+        order = None
+        if not is_sorted:
+            order = np.lexsort((load_raw("time"), load_raw("particleid")))
+
+        # write the sorted columns
+        for name in names:
+            raw = load_raw(name)
+            out = f"{prefix}.{name}.npy"
+            if nrecords == 0:
+                np.save(out, raw)
+            else:
+                column = np.lib.format.open_memmap(
+                    out, mode="w+", dtype=raw.dtype, shape=(nrecords,)
+                )
+                for i0 in range(0, nrecords, CHUNKSIZE):
+                    i1 = i0 + CHUNKSIZE
+                    if order is None:
+                        column[i0:i1] = raw[i0:i1]
+                    else:
+                        column[i0:i1] = raw[order[i0:i1]]
+                column.flush()
+                del column
+            del raw
+            os.remove(tmp[name])
+
+    def _column(self, name):
+        """
+        Get a column of the data, which is memory-mapped if a cache is used.
+        """
+        if name not in self.dtype.names:
+            raise KeyError(
+                f"could not extract '{name}' key from "
+                f"{self.output_type.lower()} data"
+            )
+        if self._columns is not None:
+            return self._columns[name]
+        return self._records[name]
+
+    def _get_records(self, idx):
+        """
+        Get a copy of the records selected by the slice or index array idx.
+        """
+        if self._columns is None:
+            ra = self._records[idx]
+            if isinstance(idx, slice):
+                ra = ra.copy()
+            return ra
+        ra = None
+        for name in self.dtype.names:
+            column = self._columns[name][idx]
+            if ra is None:
+                ra = np.empty(column.shape[0], dtype=self.dtype)
+            ra[name] = column
+        return ra.view(np.recarray)
+
     def _build_index(self):
         """
         Set position of the start of the pathline data.
@@ -102,6 +421,23 @@ class _ModpathSeries(object):
         )
         return outdtype
 
+    def _get_particle_slices(self, partids):
+        """
+        Get the start and end positions in _data of the records for each
+        particle id in partids. Particle ids that are not in the file have
+        an empty slice.
+        """
+        partids = np.atleast_1d(partids)
+        pos = np.searchsorted(self.nid, partids)
+        pos[pos >= self.nid.size] = 0
+        if self.nid.size > 0:
+            found = self.nid[pos] == partids
+        else:
+            found = np.zeros(partids.shape, dtype=bool)
+        start = np.where(found, self._offsets[pos], 0)
+        end = np.where(found, self._offsets[pos + 1], 0)
+        return start, end
+
     def get_maxid(self):
         """
         Get the maximum timeseries number in the file timeseries file
@@ -112,7 +448,7 @@ class _ModpathSeries(object):
             Maximum pathline number.
 
         """
-        return self._data["particleid"].max()
+        return self._column("particleid").max()
 
     def get_maxtime(self):
         """
@@ -124,7 +460,7 @@ class _ModpathSeries(object):
             Maximum pathline time.
 
         """
-        return self._data["time"].max()
+        return self._column("time").max()
 
     def get_data(self, partid=0, totim=None, ge=True):
         """
@@ -146,20 +482,13 @@ class _ModpathSeries(object):
             Recarray with the x, y, z, time, k, and particleid.
 
         """
-        ra = self._data
-        ra.sort(order=["particleid", "time"])
+        start, end = self._get_particle_slices(partid)
+        ra = self._get_records(slice(start[0], end[0]))
         if totim is not None:
             if ge:
-                idx = np.where(
-                    (ra["time"] >= totim) & (ra["particleid"] == partid)
-                )[0]
+                ra = ra[ra["time"] >= totim]
             else:
-                idx = np.where(
-                    (ra["time"] <= totim) & (ra["particleid"] == partid)
-                )[0]
-        else:
-            idx = np.where(ra["particleid"] == partid)[0]
-        ra = ra[idx]
+                ra = ra[ra["time"] <= totim]
         return ra[["x", "y", "z", "time", "k", "particleid"]]
 
     def get_alldata(self, totim=None, ge=True):
@@ -180,17 +509,19 @@ class _ModpathSeries(object):
             A list of numpy recarrays
 
         """
-        ra = self._data
-        ra.sort(order=["particleid", "time"])
+        ra = self._data[["x", "y", "z", "time", "k", "particleid"]].copy()
+        start, end = self._get_particle_slices(np.arange(self.nid.size))
         if totim is not None:
             if ge:
-                idx = np.where(ra["time"] >= totim)[0]
+                idx = ra["time"] >= totim
             else:
-                idx = np.where(ra["time"] <= totim)[0]
-            if len(idx) > 0:
+                idx = ra["time"] <= totim
+            if idx.any():
+                # shift the particle slices to the selected records
+                count = np.concatenate(([0], np.cumsum(idx)))
+                start, end = count[start], count[end]
                 ra = ra[idx]
-        ra = ra[["x", "y", "z", "time", "k", "particleid"]]
-        return [ra[ra["particleid"] == i] for i in range(self.nid.size)]
+        return [ra[i0:i1] for i0, i1 in zip(start, end)]
 
     def get_destination_data(self, dest_cells, to_recarray=True):
         """
@@ -217,23 +548,33 @@ class _ModpathSeries(object):
 
         """
 
-        # create local copy of _data
-        ra = np.array(self._data)
+        partids = self._get_destination_particles(dest_cells)
+        if to_recarray:
+            # use particle ids to get the rest of the paths
+            start, end = self._get_particle_slices(partids)
+            series = self._get_records(_slices_to_index(start, end))
+        else:
+            # build list of unique particleids in selection
+            series = [self.get_data(partid) for partid in partids]
 
-        # find the intersection of pathlines and dest_cells
+        return series
+
+    def _get_destination_particles(self, dest_cells):
+        """
+        Get the unique particle ids of the records in a set of destination
+        cells. Records are checked a chunk at a time.
+        """
         # convert dest_cells to same dtype for comparison
         if self.version < 7:
-            try:
-                raslice = ra[["k", "i", "j"]]
-            except (KeyError, ValueError):
+            names = ["k", "i", "j"]
+            if not set(names).issubset(self.dtype.names):
                 raise KeyError(
                     "could not extract 'k', 'i', and 'j' keys "
                     "from {} data".format(self.output_type.lower())
                 )
         else:
-            try:
-                raslice = ra[["node"]]
-            except (KeyError, ValueError):
+            names = ["node"]
+            if "node" not in self.dtype.names:
                 msg = "could not extract 'node' key from {} data".format(
                     self.output_type.lower()
                 )
@@ -242,30 +583,90 @@ class _ModpathSeries(object):
                 allint = all(isinstance(el, int) for el in dest_cells)
                 # convert to a list of tuples
                 if allint:
-                    t = []
-                    for el in dest_cells:
-                        t.append((el,))
-                        dest_cells = t
+                    dest_cells = [(el,) for el in dest_cells]
+        dtype = np.dtype([(name, self.dtype[name]) for name in names])
+        dest_cells = np.array(dest_cells, dtype=dtype)
 
-        dest_cells = np.array(dest_cells, dtype=raslice.dtype)
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        # find the intersection of the data and dest_cells
+        partid = self._column("particleid")
+        partids = [np.zeros(0, dtype=partid.dtype)]
+        for i0 in range(0, partid.size, CHUNKSIZE):
+            idx = slice(i0, i0 + CHUNKSIZE)
+            cells = np.empty(partid[idx].size, dtype=dtype)
+            for name in names:
+                cells[name] = self._column(name)[idx]
+            inds = np.in1d(cells, dest_cells)
+            partids.append(np.unique(partid[idx][inds]))
+        return np.unique(np.concatenate(partids))
+
+    def select_data(
+        self, particlegroup=None, tmin=None, tmax=None, dest_cells=None
+    ):
+        """
+        Get the records that pass a set of filters. Records are filtered a
+        chunk at a time, so only the selected records are loaded into
+        memory when a cache is used.
 
-        if to_recarray:
-            # use particle ids to get the rest of the paths
-            inds = np.in1d(ra["particleid"], epdest.particleid)
-            series = ra[inds].copy()
-            series.sort(order=["particleid", "time"])
-            series = series.view(np.recarray)
-        else:
+        Parameters
+        ----------
+        particlegroup : int or list of ints
+            Zero-based particle group(s) of the records to select. Default
+            is None (all particle groups).
+        tmin : float
+            Minimum time of the records to select. Default is None.
+        tmax : float
+            Maximum time of the records to select. Default is None.
+        dest_cells : list or array of tuples
+            (k, i, j) of each destination cell for MODPATH versions less
+            than MODPATH 7 or node number of each destination cell (zero
+            based). Only records for particles that pass through dest_cells
+            are selected. Default is None.
 
-            # get list of unique particleids in selection
-            partids = np.unique(epdest["particleid"])
+        Returns
+        -------
+        ra : np.recarray
+            Selected records, sorted by particle id and time.
 
-            # build list of unique particleids in selection
-            series = [self.get_data(partid) for partid in partids]
+        Examples
+        --------
 
-        return series
+        >>> import flopy
+        >>> p = flopy.utils.PathlineFile('modpath.pathline', cache_dir='.')
+        >>> ra = p.select_data(particlegroup=0, tmax=3650.)
+
+        """
+        if particlegroup is not None:
+            groups = self._column("particlegroup")
+        if tmin is not None or tmax is not None:
+            time = self._column("time")
+
+        # records to check
+        if dest_cells is None:
+            nrecords = self._column("particleid").size
+            candidates = None
+        else:
+            partids = self._get_destination_particles(dest_cells)
+            start, end = self._get_particle_slices(partids)
+            candidates = _slices_to_index(start, end)
+            nrecords = candidates.size
+
+        selected = [np.zeros(0, dtype=int)]
+        for i0 in range(0, nrecords, CHUNKSIZE):
+            i1 = min(i0 + CHUNKSIZE, nrecords)
+            if candidates is None:
+                idx = slice(i0, i1)
+                positions = np.arange(i0, i1)
+            else:
+                idx = positions = candidates[i0:i1]
+            mask = np.ones(i1 - i0, dtype=bool)
+            if particlegroup is not None:
+                mask &= np.in1d(groups[idx], particlegroup)
+            if tmin is not None:
+                mask &= time[idx] >= tmin
+            if tmax is not None:
+                mask &= time[idx] <= tmax
+            selected.append(positions[mask])
+        return self._get_records(np.concatenate(selected))
 
     def write_shapefile(
         self,
@@ -321,8 +722,7 @@ class _ModpathSeries(object):
                     s = stack_arrays((s, series[n]))
                 series = s.view(np.recarray)
 
-        series = series.copy()
-        series.sort(order=["particleid", "time"])
+        series = series[np.lexsort((series.time, series.particleid))]
 
         if mg is None:
             raise ValueError("A modelgrid object was not provided.")
@@ -330,7 +730,10 @@ class _ModpathSeries(object):
         if epsg is None:
             epsg = mg.epsg
 
-        particles = np.unique(series.particleid)
+        # series is sorted by particle id, so split it into the records
+        # for each particle
+        particles, starts = np.unique(series.particleid, return_index=True)
+        paths = np.split(series, starts[1:])
         geoms = []
 
         # create dtype with select attributes in pth
@@ -356,9 +759,7 @@ class _ModpathSeries(object):
                 loc_inds = -1
 
             sdata = []
-            for pid in particles:
-                ra = series[series.particleid == pid]
-
+            for pid, ra in zip(particles, paths):
                 x, y = geometry.transform(
                     ra.x, ra.y, mg.xoffset, mg.yoffset, mg.angrot_radians
                 )
@@ -386,8 +787,7 @@ class _ModpathSeries(object):
         else:
             dtype = series.dtype
             sdata = []
-            for pid in particles:
-                ra = series[series.particleid == pid]
+            for pid, ra in zip(particles, paths):
                 if isinstance(mg, StructuredGrid):
                     x, y = geometry.transform(
                         ra.x, ra.y, mg.xoffset, mg.yoffset, mg.angrot_radians
@@ -422,6 +822,14 @@ class PathlineFile(_ModpathSeries):
         Name of the pathline file
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_dir : str
+        Directory for a columnar cache of the pathline data. The file is
+        parsed in chunks and converted to a .npy file for each column the
+        first time it is opened, and the columns are memory-mapped from the
+        cache after that, so large files can be used without loading all of
+        the data into memory. The cache is rebuilt if the size or
+        modification time of the file change. If None, all of the data are
+        loaded into memory. Default is None.
 
     Examples
     --------
@@ -444,38 +852,22 @@ class PathlineFile(_ModpathSeries):
         "sequencenumber",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, cache_dir=None):
         """
         Class constructor.
 
         """
 
-        super().__init__(filename, verbose=verbose, output_type="pathline")
-
-        # set data dtype and read pathline data
-        if self.version == 7:
-            self.dtype, self._data = self._get_mp7data()
-        else:
-            self.dtype = self._get_dtypes()
-            self._data = loadtxt(
-                self.file, dtype=self.dtype, skiprows=self.skiprows
-            )
-
-        # convert layer, row, and column indices; particle id and group; and
-        #  line segment indices to zero-based
-        for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
-
-        # set number of particle ids
-        self.nid = np.unique(self._data["particleid"])
-
-        # close the input file
-        self.file.close()
+        super().__init__(
+            filename,
+            verbose=verbose,
+            output_type="pathline",
+            cache_dir=cache_dir,
+        )
 
     def _get_dtypes(self):
         """
-        Build numpy dtype for the MODPATH 6 pathline file.
+        Build numpy dtype for the pathline file.
         """
         if self.version == 3 or self.version == 5:
             dtype = np.dtype(
@@ -514,97 +906,114 @@ class PathlineFile(_ModpathSeries):
                 ]
             )
         elif self.version == 7:
-            raise TypeError(
-                "_get_dtypes() should not be called for "
-                "MODPATH 7 pathline files"
+            dtype = np.dtype(
+                [
+                    ("particleid", np.int32),
+                    ("particlegroup", np.int32),
+                    ("sequencenumber", np.int32),
+                    ("particleidloc", np.int32),
+                    ("time", np.float32),
+                    ("x", np.float32),
+                    ("y", np.float32),
+                    ("z", np.float32),
+                    ("k", np.int32),
+                    ("node", np.int32),
+                    ("xloc", np.float32),
+                    ("yloc", np.float32),
+                    ("zloc", np.float32),
+                    ("stressperiod", np.int32),
+                    ("timestep", np.int32),
+                ]
             )
         return dtype
 
-    def _get_mp7data(self):
-        dtyper = np.dtype(
-            [
-                ("node", np.int32),
-                ("x", np.float32),
-                ("y", np.float32),
-                ("z", np.float32),
-                ("time", np.float32),
-                ("xloc", np.float32),
-                ("yloc", np.float32),
-                ("zloc", np.float32),
-                ("k", np.int32),
-                ("stressperiod", np.int32),
-                ("timestep", np.int32),
-            ]
-        )
-        dtype = np.dtype(
-            [
-                ("particleid", np.int32),
-                ("particlegroup", np.int32),
-                ("sequencenumber", np.int32),
-                ("particleidloc", np.int32),
-                ("time", np.float32),
-                ("x", np.float32),
-                ("y", np.float32),
-                ("z", np.float32),
-                ("k", np.int32),
-                ("node", np.int32),
-                ("xloc", np.float32),
-                ("yloc", np.float32),
-                ("zloc", np.float32),
-                ("stressperiod", np.int32),
-                ("timestep", np.int32),
-            ]
-        )
-        idx = 0
-        part_dict = {}
-        ndata = 0
+    def _read_chunks(self, chunksize=CHUNKSIZE):
+        """
+        Parse the data in chunks of chunksize lines with the pandas C
+        parser. Each MODPATH 7 pathline starts with a line with the
+        sequence number, particle group, particle id, and number of points,
+        and the values on this line are added to each point.
+
+        Parameters
+        ----------
+        chunksize : int
+            Number of lines parsed at a time.
+
+        Yields
+        ------
+        data : np.ndarray
+            Records in the chunk, with zero-based indices.
+
+        """
+        if self.version != 7:
+            yield from super()._read_chunks(chunksize)
+            return
+
+        pd = import_optional_dependency("pandas")
+        names = [
+            "node",
+            "x",
+            "y",
+            "z",
+            "time",
+            "xloc",
+            "yloc",
+            "zloc",
+            "k",
+            "stressperiod",
+            "timestep",
+        ]
+        # start each chunk with a line of point values, so that the parser
+        # always finds a point line even if a chunk only has header lines
+        first = " ".join(["0"] * len(names)) + "\n"
+        self.file.seek(0)
+        for _ in range(self.skiprows):
+            self.file.readline()
+        # header of the pathline that continues from the previous chunk
+        header = None
         while True:
-            if idx == 0:
-                for n in range(self.skiprows):
-                    line = self.file.readline()
-            # read header line
-            try:
-                line = self.file.readline().strip()
-                if self.verbose:
-                    print(line)
-                if len(line) < 1:
-                    break
-            except:
+            lines = list(itertools.islice(self.file, chunksize))
+            if not lines:
                 break
-            t = [int(s) for j, s in enumerate(line.split()) if j < 4]
-            sequencenumber, group, particleid, pathlinecount = t[0:4]
-            ndata += pathlinecount
-            # read in the particle data
-            d = np.loadtxt(
-                itertools.islice(self.file, 0, pathlinecount), dtype=dtyper
+            df = pd.read_csv(
+                io.BytesIO((first + "".join(lines)).encode()),
+                dtype=np.float64,
+                delim_whitespace=True,
+                header=None,
+                names=names,
             )
-            key = (idx, sequencenumber, group, particleid, pathlinecount)
-            part_dict[key] = d.copy()
-            idx += 1
-
-        # create data array
-        data = np.zeros(ndata, dtype=dtype)
-
-        # fill data
-        ipos0 = 0
-        for key, value in part_dict.items():
-            idx, sequencenumber, group, particleid, pathlinecount = key[0:5]
-            ipos1 = ipos0 + pathlinecount
-            # fill constant items for particle
+            del lines
+            values = df.to_numpy()[1:]
+
+            # pathline header lines only have four values
+            isheader = np.isnan(values[:, 4])
+            pos = np.where(isheader, np.arange(isheader.size), -1)
+            pos = np.maximum.accumulate(pos)
+            headers = values[np.maximum(pos, 0), :4]
+            if pos[0] < 0:
+                if header is None:
+                    raise Exception(
+                        f"{self.fname} is not a valid pathline file"
+                    )
+                headers[pos < 0] = header
+            header = headers[-1]
+
+            # fill the data for the points
+            ispoint = ~isheader
+            headers = headers[ispoint]
+            values = values[ispoint]
+            data = np.zeros(values.shape[0], dtype=self.dtype)
             # particleid is not necessarily unique for all pathlines - use
             # sequencenumber which is unique
-            data["particleid"][ipos0:ipos1] = sequencenumber
+            data["particleid"] = headers[:, 0]
             # set particlegroup and sequence number
-            data["particlegroup"][ipos0:ipos1] = group
-            data["sequencenumber"][ipos0:ipos1] = sequencenumber
+            data["particlegroup"] = headers[:, 1]
+            data["sequencenumber"] = headers[:, 0]
             # save particleidloc to particleid
-            data["particleidloc"][ipos0:ipos1] = particleid
-            # fill particle data
-            for name in value.dtype.names:
-                data[name][ipos0:ipos1] = value[name]
-            ipos0 = ipos1
-
-        return dtype, data
+            data["particleidloc"] = headers[:, 2]
+            for idx, name in enumerate(names):
+                data[name] = values[:, idx]
+            yield self._zero_based(data)
 
     def get_maxid(self):
         """
@@ -1269,6 +1678,14 @@ class TimeseriesFile(_ModpathSeries):
         Name of the timeseries file
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_dir : str
+        Directory for a columnar cache of the timeseries data. The file is
+        parsed in chunks and converted to a .npy file for each column the
+        first time it is opened, and the columns are memory-mapped from the
+        cache after that, so large files can be used without loading all of
+        the data into memory. The cache is rebuilt if the size or
+        modification time of the file change. If None, all of the data are
+        loaded into memory. Default is None.
 
     Examples
     --------
@@ -1291,34 +1708,18 @@ class TimeseriesFile(_ModpathSeries):
         "timepointindex",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, cache_dir=None):
         """
         Class constructor.
 
         """
-        super().__init__(filename, verbose=verbose, output_type="timeseries")
-
-        # set dtype
-        self.dtype = self._get_dtypes()
-
-        # read data
-        self._data = loadtxt(
-            self.file, dtype=self.dtype, skiprows=self.skiprows
+        super().__init__(
+            filename,
+            verbose=verbose,
+            output_type="timeseries",
+            cache_dir=cache_dir,
         )
 
-        # convert layer, row, and column indices; particle id and group; and
-        #  line segment indices to zero-based
-        for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
-
-        # set number of particle ids
-        self.nid = np.unique(self._data["particleid"])
-
-        # close the input file
-        self.file.close()
-        return
-
     def _build_index(self):
         """
         Set position of the start of the timeseries data.
@@ -1,6 +1,7 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-import threading
-import queue
 
 from .utl_import import import_optional_dependency
 
@@ -325,6 +326,7 @@ class Raster:
         multithread=False,
         thread_pool=2,
         extrapolate_edges=False,
+        tile_rows=None,
     ):
         """
         Method to resample the raster data to a
@@ -351,15 +353,25 @@ class Raster:
             ``mean`` for mean sampling
 
             ``median`` for median sampling
+
+            ``min`` for minimum sampling
+
+            ``max`` for maximum sampling
         multithread : bool
-            boolean flag indicating if multithreading should be used with
-            the ``mean`` and ``median`` sampling methods
+            boolean flag indicating if multithreading should be used to
+            process raster tiles with the ``mean``, ``median``, ``min`` and
+            ``max`` sampling methods
         thread_pool : int
-            number of threads to use for mean and median sampling
+            number of threads to use for mean, median, min and max sampling
         extrapolate_edges : bool
             boolean flag indicating if areas without data should be filled
             using the ``nearest`` interpolation method. This option
             has no effect when using the ``nearest`` interpolation method.
+        tile_rows : int
+            number of raster rows in each tile for mean, median, min and
+            max sampling. Raster data are read one tile at a time when the
+            raster is backed by a rasterio dataset. Default is None, which
+            processes the raster as a single tile.
 
         Returns
         -------
@@ -399,66 +411,21 @@ class Raster:
                 method=method,
             )
 
-        elif method in ("median", "mean"):
-            # these methods are slow and could use a speed u
+        elif method in ("median", "mean", "min", "max"):
             ncpl = modelgrid.ncpl
             data_shape = modelgrid.xcellcenters.shape
             if isinstance(ncpl, (list, np.ndarray)):
                 ncpl = ncpl[0]
 
-            data = np.zeros((ncpl,), dtype=float)
-
-            if multithread:
-                q = queue.Queue()
-                container = threading.BoundedSemaphore(thread_pool)
-
-                # determine the number of thread pairs required to
-                # fill the grid
-                nthreadpairs = int(ncpl / thread_pool)
-                if ncpl % thread_pool != 0:
-                    nthreadpairs += 1
-
-                # iterate over the tread pairs
-                for idx in range(nthreadpairs):
-                    i0 = idx * thread_pool
-                    nthreads = thread_pool
-                    if i0 + thread_pool > ncpl:
-                        nthreads = ncpl - i0
-                    i1 = i0 + nthreads
-                    threads = []
-                    for node in range(i0, i1):
-                        t = threading.Thread(
-                            target=self.__threaded_resampling,
-                            args=(modelgrid, node, band, method, container, q),
-                        )
-                        threads.append(t)
-
-                    # start the threads
-                    for thread in threads:
-                        thread.daemon = True
-                        thread.start()
-
-                    # wait until all threads are terminated
-                    for thread in threads:
-                        thread.join()
-
-                    for idx in range(nthreads):
-                        node, val = q.get()
-                        data[node] = val
-
-            else:
-                for node in range(ncpl):
-                    verts = modelgrid.get_cell_vertices(node)
-                    rstr_data = self.sample_polygon(verts, band)
-                    msk = np.in1d(rstr_data, self.nodatavals)
-                    rstr_data[msk] = np.nan
-
-                    if method == "median":
-                        val = np.nanmedian(rstr_data)
-                    else:
-                        val = np.nanmean(rstr_data)
-
-                    data[node] = val
+            data = self._zonal_statistics(
+                modelgrid,
+                ncpl,
+                band,
+                method,
+                multithread,
+                thread_pool,
+                tile_rows,
+            )
         else:
             raise TypeError(f"{method} method not supported")
 
@@ -502,41 +469,200 @@ class Raster:
 
         return data
 
-    def __threaded_resampling(
-        self, modelgrid, node, band, method, container, q
+    def _label_tile(self, shapes, bounds, row0, row1):
+        """
+        Rasterize model cell polygons into a label array for a tile of
+        raster rows. Raster cells are labeled with the model cell number
+        plus one if the raster cell center is in the model cell, and with
+        zero otherwise.
+
+        Parameters
+        ----------
+        shapes : list
+            list of geojson polygons, one for each model cell
+        bounds : np.ndarray
+            array of (ymin, ymax) for each model cell
+        row0 : int
+            first raster row of the tile
+        row1 : int
+            last raster row of the tile plus one
+
+        Returns
+        -------
+            np.ndarray of labels with shape (row1 - row0, width)
+        """
+        from rasterio.features import rasterize
+
+        transform = self._meta["transform"]
+        width = self._meta["width"]
+        y0 = transform[5] + row0 * transform[4]
+        y1 = transform[5] + row1 * transform[4]
+        ymin, ymax = min(y0, y1), max(y0, y1)
+        nodes = np.where((bounds[:, 1] >= ymin) & (bounds[:, 0] <= ymax))[0]
+        labels = np.zeros((row1 - row0, width), dtype=np.int32)
+        if len(nodes) == 0:
+            return labels
+
+        tile_transform = transform * self._affine.Affine.translation(0, row0)
+        return rasterize(
+            ((shapes[node], node + 1) for node in nodes),
+            out_shape=labels.shape,
+            transform=tile_transform,
+            fill=0,
+            dtype=np.int32,
+        )
+
+    def _get_tile(self, band, row0, row1):
+        """
+        Get the raster values for a tile of raster rows as a float array
+        with nodata values set to np.nan
+
+        Parameters
+        ----------
+        band : int
+            raster band to read
+        row0 : int
+            first raster row of the tile
+        row1 : int
+            last raster row of the tile plus one
+
+        Returns
+        -------
+            np.ndarray
+        """
+        if self._dataset is None:
+            array = self.__arr_dict[band][row0:row1]
+        else:
+            from rasterio.windows import Window
+
+            window = Window(0, row0, self._meta["width"], row1 - row0)
+            array = self._dataset.read(band, window=window)
+
+        array = array.astype(float)
+        for v in self.nodatavals:
+            if v is not None:
+                array[array == v] = np.nan
+        return array
+
+    def _zonal_statistics(
+        self,
+        modelgrid,
+        ncpl,
+        band,
+        method,
+        multithread,
+        thread_pool,
+        tile_rows,
     ):
         """
-        Threaded resampling handler to speed up bottlenecks
+        Method to calculate the mean, median, minimum or maximum of the
+        raster values in each model cell. All model cells are rasterized
+        into a label raster, one tile of raster rows at a time, and the
+        statistics are calculated with grouped numpy reductions.
 
         Parameters
         ----------
         modelgrid : flopy.discretization.Grid object
             flopy grid to sample to
-        node : int
-            node number
+        ncpl : int
+            number of model cells per layer
         band : int
             raster band to sample from
         method : str
-            resampling method
-        container : threading.BoundedSemaphore
-        q : queue.Queue
+            ``mean``, ``median``, ``min`` or ``max``
+        multithread : bool
+            boolean flag indicating if tiles are processed in a thread pool
+        thread_pool : int
+            number of threads used to process tiles
+        tile_rows : int
+            number of raster rows in each tile
 
         Returns
         -------
-            None
+            np.ndarray of size ncpl, with np.nan for cells that do not
+            contain raster cell centers
         """
-        container.acquire()
-        verts = modelgrid.get_cell_vertices(node)
-        rstr_data = self.sample_polygon(verts, band)
-        msk = np.in1d(rstr_data, self.nodatavals)
-        rstr_data[msk] = np.nan
+        import_optional_dependency("rasterio")
+
+        shapes = []
+        bounds = np.zeros((ncpl, 2), dtype=float)
+        for node in range(ncpl):
+            verts = modelgrid.get_cell_vertices(node)
+            verts = [(float(x), float(y)) for x, y in verts]
+            if verts[0] != verts[-1]:
+                verts.append(verts[0])
+            shapes.append({"type": "Polygon", "coordinates": [verts]})
+            y = [v[1] for v in verts]
+            bounds[node] = min(y), max(y)
+
+        height = self._meta["height"]
+        if tile_rows is None:
+            tile_rows = height
+        tile_rows = max(int(tile_rows), 1)
+        tiles = [
+            (row0, min(row0 + tile_rows, height))
+            for row0 in range(0, height, tile_rows)
+        ]
+
+        def sample_tile(tile):
+            labels = self._label_tile(shapes, bounds, *tile)
+            values = self._get_tile(band, *tile)
+            idx = (labels > 0) & np.isfinite(values)
+            labels = labels[idx] - 1
+            values = values[idx]
+            if method == "median":
+                return labels, values
+
+            count = np.bincount(labels, minlength=ncpl)
+            total = np.bincount(labels, weights=values, minlength=ncpl)
+            vmin = np.full(ncpl, np.nan)
+            vmax = np.full(ncpl, np.nan)
+            if len(labels) > 0:
+                order = np.argsort(labels, kind="stable")
+                labels, values = labels[order], values[order]
+                starts = np.flatnonzero(np.diff(labels, prepend=-1))
+                nodes = labels[starts]
+                vmin[nodes] = np.minimum.reduceat(values, starts)
+                vmax[nodes] = np.maximum.reduceat(values, starts)
+            return count, total, vmin, vmax
+
+        if multithread and len(tiles) > 1:
+            from rasterio.errors import NotGeoreferencedWarning
+
+            # gdal can report tiles that are rasterized at the same time in
+            # other threads as not georeferenced
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", NotGeoreferencedWarning)
+                with ThreadPoolExecutor(max_workers=thread_pool) as pool:
+                    results = list(pool.map(sample_tile, tiles))
+        else:
+            results = [sample_tile(tile) for tile in tiles]
 
         if method == "median":
-            val = np.nanmedian(rstr_data)
+            labels = np.concatenate([r[0] for r in results])
+            values = np.concatenate([r[1] for r in results])
+            order = np.lexsort((values, labels))
+            values = values[order]
+            count = np.bincount(labels, minlength=ncpl)
+            start = np.cumsum(count) - count
+            idx = count > 0
+            lo = start[idx] + (count[idx] - 1) // 2
+            hi = start[idx] + count[idx] // 2
+            data = np.full(ncpl, np.nan)
+            data[idx] = (values[lo] + values[hi]) / 2.0
+            return data
+
+        count = np.sum([r[0] for r in results], axis=0)
+        if method == "mean":
+            total = np.sum([r[1] for r in results], axis=0)
+            data = np.full(ncpl, np.nan)
+            idx = count > 0
+            data[idx] = total[idx] / count[idx]
+        elif method == "min":
+            data = np.fmin.reduce([r[2] for r in results], axis=0)
         else:
-            val = np.nanmean(rstr_data)
-        q.put((node, val))
-        container.release()
+            data = np.fmax.reduce([r[3] for r in results], axis=0)
+        return data
 
     def crop(self, polygon, invert=False):
         """
@@ -8,9 +8,11 @@ util_array module.  Contains the util_2d, util_3d and transient_2d classes.
 # from future.utils import with_metaclass
 
 import os
+import re
 import shutil
 import copy
 import numpy as np
+from itertools import islice
 from warnings import warn
 from ..utils.binaryfile import BinaryHeader
 from ..utils.flopy_io import line_parse
@@ -450,6 +452,75 @@ def new_u2d(old_util2d, value):
     return new_util2d
 
 
+# characters removed by str.strip() that can appear in an ascii field
+_blank_chars = np.zeros(256, dtype=bool)
+_blank_chars[list(b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")] = True
+
+# python format fields that have an equivalent printf-style format
+_printf_pattern = re.compile(
+    r"\{0?:([+ ]?)(#?)(0?)([1-9][0-9]*)?(\.[0-9]+)?([EeFfGgd])\}"
+)
+
+
+def _read_fixed_width(file_in, num_items, dtype, npl, width):
+    """
+    Read num_items values from fixed width fields, with up to npl fields
+    of width characters on each line.  Blank fields are skipped.
+
+    Lines are read in batches and split into fields in bulk.  Each batch
+    is only as many lines as are needed if every line is full, so lines
+    after the array are never read from file_in.
+
+    """
+    nchar = npl * width
+    batches = []
+    num_read = 0
+    while num_read < num_items:
+        num_lines = -(-(num_items - num_read) // npl)
+        lines = list(islice(iter(file_in.readline, ""), num_lines))
+        if len(lines) < num_lines:
+            raise ValueError("Util2d.load_txt(): no data found")
+        text = "".join([line.rstrip().ljust(nchar)[:nchar] for line in lines])
+        try:
+            fields = np.frombuffer(text.encode("ascii"), dtype=f"S{width}")
+            chars = fields.view(np.uint8).reshape(-1, width)
+            blank = (chars <= 32).all(axis=1)
+            blank[blank] = _blank_chars[chars[blank]].all(axis=1)
+        except UnicodeEncodeError:
+            fields = np.frombuffer(
+                text.encode("utf-32-le"), dtype=f"<U{width}"
+            )
+            blank = np.char.strip(fields) == ""
+        fields = fields[~blank]
+        batches.append(fields)
+        num_read += fields.size
+    fields = np.concatenate(batches)[:num_items]
+    if np.dtype(dtype).kind in "iuf":
+        try:
+            return fields.astype(dtype)
+        except (ValueError, TypeError, OverflowError):
+            pass
+    # convert one value at a time
+    items = np.char.strip(fields.astype(str)).tolist()
+    return np.fromiter(items, dtype=dtype, count=num_items)
+
+
+def _printf_format(output_fmt, dtype):
+    """
+    Return the printf-style equivalent of a python format string for a
+    single value, e.g. '%15.6E' for '{0:15.6E}', or None if there is no
+    exact equivalent for values of dtype.
+
+    """
+    match = _printf_pattern.fullmatch(output_fmt)
+    if match is None or dtype.kind not in "iuf":
+        return None
+    precision, fmt = match.group(5), match.group(6)
+    if fmt == "d" and (precision is not None or dtype.kind == "f"):
+        return None
+    return "%" + "".join(group or "" for group in match.groups())
+
+
 class Util3d(DataInterface):
     """
     Util3d class for handling 3-D model arrays.  just a thin wrapper around
@@ -2538,12 +2609,12 @@ class Util2d(DataInterface):
         if openfile:
             file_in = open(file_in, "r")
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
-        items = []
-        while len(items) < num_items:
-            line = file_in.readline()
-            if len(line) == 0:
-                raise ValueError("Util2d.load_txt(): no data found")
-            if npl == "free":
+        if npl == "free":
+            items = []
+            while len(items) < num_items:
+                line = file_in.readline()
+                if len(line) == 0:
+                    raise ValueError("Util2d.load_txt(): no data found")
                 if "," in line:
                     line = line.replace(",", " ")
                 if "*" in line:  # use slower method for these types of lines
@@ -2556,19 +2627,11 @@ class Util2d(DataInterface):
                             items.append(item)
                 else:
                     items += line.split()
-            else:  # fixed width
-                pos = 0
-                for i in range(npl):
-                    try:
-                        item = line[pos : pos + width].strip()
-                        pos += width
-                        if item:
-                            items.append(item)
-                    except IndexError:
-                        break
+            data = np.fromiter(items, dtype=dtype, count=num_items)
+        else:  # fixed width
+            data = _read_fixed_width(file_in, num_items, dtype, npl, width)
         if openfile:
             file_in.close()
-        data = np.fromiter(items, dtype=dtype, count=num_items)
         if data.size != num_items:
             raise ValueError(
                 "Util2d.load_txt(): expected array size {0},"
@@ -2642,6 +2705,19 @@ class Util2d(DataInterface):
                 )
         # write the array to a string
         len_data = data.size
+        printf_fmt = None
+        if not np.ma.isMaskedArray(data):
+            printf_fmt = _printf_format(output_fmt, data.dtype)
+        if printf_fmt is not None:
+            # format all values at once, with a newline after the last
+            # value of each line
+            i = np.arange(len_data)
+            eol = ((i + 1) % column_length == 0) & ((i != 0) | (ncol == 1))
+            eol |= ((i + 1) == ncol) & (ncol != 1)
+            eol[-1:] = True
+            counts = np.diff(np.flatnonzero(eol), prepend=-1).tolist()
+            line_fmt = "".join([printf_fmt * n + "\n" for n in counts])
+            return line_fmt % tuple(data.ravel().tolist())
         str_fmt_data = [
             output_fmt.format(d) + "\n"
             if (((i + 1) % column_length == 0.0) and (i != 0 or ncol == 1))
@@ -1,7 +1,7 @@
 import os
 import copy
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from itertools import groupby
 from .utils_def import totim_to_datetime
 from . import import_optional_dependency
 
@@ -28,6 +28,12 @@ class ZoneBudget:
         When using this option in conjunction with a list of zones, the
         zone(s) passed may either be all strings (aliases), all integers,
         or mixed.
+    max_workers : int
+        Maximum number of processes used to compute the budgets of
+        different time steps.  Each process opens the cell budget file
+        itself.  If 1, the budgets are computed one after the other in
+        this process.  If None, the default of concurrent.futures is used.
+        (default is 1)
 
     Returns
     -------
@@ -51,6 +57,7 @@ class ZoneBudget:
         totim=None,
         aliases=None,
         verbose=False,
+        max_workers=1,
         **kwargs,
     ):
         from .binaryfile import CellBudgetFile
@@ -94,6 +101,11 @@ class ZoneBudget:
         self.nlay, self.nrow, self.ncol = self.cbc_shape
         self.cbc_times = self.cbc.get_times()
         self.cbc_kstpkper = self.cbc.get_kstpkper()
+        self._cbc_totim = {}
+        self._cbc_kstpkper = {}
+        for kk, t in zip(self.cbc_kstpkper, self.cbc_times):
+            self._cbc_totim.setdefault(kk, t)
+            self._cbc_kstpkper.setdefault(t, kk)
         self.kstpkper = None
         self.totim = None
 
@@ -199,24 +211,48 @@ class ZoneBudget:
             n for n in self.record_names if n not in internal_flow_terms
         ]
 
-        # Initialize budget recordarray
-        array_list = []
+        # Zone index of each cell and the cells on either side of each
+        # face, which are used for every time step
+        self._izone_index = np.searchsorted(self.allzones, izone.ravel())
+        self._faces = self._build_face_connectivity()
+
+        # Initialize budget recordarray.  Every time step has the same
+        # records, so the records of the first time step are repeated.
         if self.kstpkper is not None:
-            for kk in self.kstpkper:
-                recordarray = self._initialize_budget_recordarray(
-                    kstpkper=kk, totim=None
-                )
-                array_list.append(recordarray)
+            timesteps = [tuple(kk) for kk in self.kstpkper]
+            recordarray = self._initialize_budget_recordarray(
+                kstpkper=timesteps[0], totim=None
+            )
         elif self.totim is not None:
-            for t in self.totim:
-                recordarray = self._initialize_budget_recordarray(
-                    kstpkper=None, totim=t
-                )
-                array_list.append(recordarray)
-        self._budget = np.concatenate(array_list, axis=0)
+            timesteps = list(self.totim)
+            recordarray = self._initialize_budget_recordarray(
+                kstpkper=None, totim=timesteps[0]
+            )
+        nrecords = len(recordarray)
+        self._budget = np.tile(recordarray, len(timesteps))
+        for n, timestep in enumerate(timesteps):
+            if self.kstpkper is not None:
+                t, kk = self._get_budget_time(timestep, None)
+            else:
+                t, kk = self._get_budget_time(None, timestep)
+            block = self._budget[n * nrecords : (n + 1) * nrecords]
+            block["totim"] = t
+            block["time_step"] = kk[0]
+            block["stress_period"] = kk[1]
+
+        # Position of the records of each time step and of each record
+        # name in the records of a time step
+        self._budget_offsets = {
+            timestep: n * nrecords for n, timestep in enumerate(timesteps)
+        }
+        self._record_index = {
+            name: n for n, name in enumerate(recordarray["name"])
+        }
 
         # Update budget record array
-        if self.kstpkper is not None:
+        if max_workers != 1 and len(timesteps) > 1:
+            self._compute_budget_parallel(aliases, max_workers, verbose)
+        elif self.kstpkper is not None:
             for kk in self.kstpkper:
                 if verbose:
                     s = (
@@ -234,6 +270,65 @@ class ZoneBudget:
                     print(s)
                 self._compute_budget(totim=t)
 
+    def _compute_budget_parallel(self, aliases, max_workers, verbose):
+        """
+        Compute the budgets of groups of time steps in a pool of processes
+        and merge them in time step order.
+
+        Parameters
+        ----------
+        aliases : dict
+            A dictionary with key, value pairs of zones and aliases.
+        max_workers : int
+            Maximum number of processes.  If None, the default of
+            concurrent.futures is used.
+        verbose : bool
+            Print the number of time steps and processes.
+
+        Returns
+        -------
+        None
+
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if self.kstpkper is not None:
+            timesteps = list(self.kstpkper)
+        else:
+            timesteps = list(self.totim)
+        nchunks = min(max_workers, len(timesteps))
+        chunks = np.array_split(np.arange(len(timesteps)), nchunks)
+        if verbose:
+            print(
+                f"Computing the budget for {len(timesteps)} time steps "
+                f"with {nchunks} processes"
+            )
+
+        # the index of the cell budget file is shared with the processes
+        # so that they do not have to read every record header again
+        tasks = []
+        for chunk in chunks:
+            chunk = [timesteps[n] for n in chunk]
+            if self.kstpkper is not None:
+                kstpkper, totim = chunk, None
+            else:
+                kstpkper, totim = None, chunk
+            tasks.append(
+                (
+                    self.cbc.filename,
+                    self.cbc.precision,
+                    self.cbc._get_index(),
+                    self.izone,
+                    kstpkper,
+                    totim,
+                    aliases,
+                )
+            )
+        with ProcessPoolExecutor(max_workers=nchunks) as pool:
+            budgets = list(pool.map(_compute_budget_chunk, *zip(*tasks)))
+        self._budget = np.concatenate(budgets)
+        return
+
     def _compute_budget(self, kstpkper=None, totim=None):
         """
         Creates a budget for the specified zone array. This function only
@@ -272,22 +367,34 @@ class ZoneBudget:
             )[0]
             ich[np.ma.where(chd != 0.0)] = 1
         if "FLOW RIGHT FACE" in self.record_names:
-            self._accumulate_flow_frf("FLOW RIGHT FACE", ich, kstpkper, totim)
+            self._accumulate_face_flow(
+                "FLOW RIGHT FACE", 2, ich, kstpkper, totim
+            )
         if "FLOW FRONT FACE" in self.record_names:
-            self._accumulate_flow_fff("FLOW FRONT FACE", ich, kstpkper, totim)
+            self._accumulate_face_flow(
+                "FLOW FRONT FACE", 1, ich, kstpkper, totim
+            )
         if "FLOW LOWER FACE" in self.record_names:
-            self._accumulate_flow_flf("FLOW LOWER FACE", ich, kstpkper, totim)
+            self._accumulate_face_flow(
+                "FLOW LOWER FACE", 0, ich, kstpkper, totim
+            )
         if "SWIADDTOCH" in self.record_names:
             swichd = self.cbc.get_data(
                 text="SWIADDTOCH", full3D=True, kstpkper=kstpkper, totim=totim
             )[0]
             swiich[swichd != 0] = 1
         if "SWIADDTOFRF" in self.record_names:
-            self._accumulate_flow_frf("SWIADDTOFRF", swiich, kstpkper, totim)
+            self._accumulate_face_flow(
+                "SWIADDTOFRF", 2, swiich, kstpkper, totim
+            )
         if "SWIADDTOFFF" in self.record_names:
-            self._accumulate_flow_fff("SWIADDTOFFF", swiich, kstpkper, totim)
+            self._accumulate_face_flow(
+                "SWIADDTOFFF", 1, swiich, kstpkper, totim
+            )
         if "SWIADDTOFLF" in self.record_names:
-            self._accumulate_flow_flf("SWIADDTOFLF", swiich, kstpkper, totim)
+            self._accumulate_face_flow(
+                "SWIADDTOFLF", 0, swiich, kstpkper, totim
+            )
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
         # ACCUMULATE THE FLOW BY ZONE
@@ -300,17 +407,13 @@ class ZoneBudget:
 
         return
 
-    def _add_empty_record(
-        self, recordarray, recname, kstpkper=None, totim=None
-    ):
+    def _get_budget_time(self, kstpkper=None, totim=None):
         """
-        Build an empty records based on the specified flow direction and
-        record name for the given list of zones.
+        Get the simulation time and the time step and stress period of a
+        budget from one or the other.
 
         Parameters
         ----------
-        recordarray :
-        recname :
         kstpkper : tuple
             Tuple of kstp and kper to compute budget for (default is None).
         totim : float
@@ -318,20 +421,44 @@ class ZoneBudget:
 
         Returns
         -------
-        recordarray : np.recarray
+        totim : float
+        kstpkper : tuple
 
         """
         if kstpkper is not None:
             if len(self.cbc_times) > 0:
-                totim = self.cbc_times[self.cbc_kstpkper.index(kstpkper)]
+                totim = self._cbc_totim[tuple(kstpkper)]
             else:
                 totim = 0.0
         elif totim is not None:
             if len(self.cbc_times) > 0:
-                kstpkper = self.cbc_kstpkper[self.cbc_times.index(totim)]
+                kstpkper = self._cbc_kstpkper[totim]
             else:
                 kstpkper = (0, 0)
+        return totim, kstpkper
 
+    def _add_empty_record(
+        self, recordarray, recname, kstpkper=None, totim=None
+    ):
+        """
+        Build an empty records based on the specified flow direction and
+        record name for the given list of zones.
+
+        Parameters
+        ----------
+        recordarray :
+        recname :
+        kstpkper : tuple
+            Tuple of kstp and kper to compute budget for (default is None).
+        totim : float
+            Totim to compute budget for (default is None).
+
+        Returns
+        -------
+        recordarray : np.recarray
+
+        """
+        totim, kstpkper = self._get_budget_time(kstpkper, totim)
         row = [totim, kstpkper[0], kstpkper[1], recname]
         row += [0.0 for _ in self._zonenamedict.values()]
         recs = np.array(tuple(row), dtype=recordarray.dtype)
@@ -541,458 +668,153 @@ class ZoneBudget:
         None
 
         """
-        try:
-
-            if kstpkper is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.where(
-                        (self._budget["time_step"] == kstpkper[0])
-                        & (self._budget["stress_period"] == kstpkper[1])
-                        & (self._budget["name"] == rn)
-                    )
-                    self._budget[cn][rowidx] += flux
-            elif totim is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.where(
-                        (self._budget["totim"] == totim)
-                        & (self._budget["name"] == rn)
-                    )
-                    self._budget[cn][rowidx] += flux
-
-        except Exception as e:
-            print(e)
-            raise
+        offset = self._get_budget_offset(kstpkper, totim)
+        for rn, cn, flux in zip(rownames, colnames, fluxes):
+            irow = self._record_index.get(rn)
+            if irow is not None:
+                self._budget[cn][offset + irow] += flux
         return
 
-    def _accumulate_flow_frf(self, recname, ich, kstpkper, totim):
+    def _get_budget_offset(self, kstpkper=None, totim=None):
         """
+        Get the position of the first budget record of a time step.
 
         Parameters
         ----------
-        recname
-        ich
-        kstpkper
-        totim
+        kstpkper : tuple
+            Tuple of kstp and kper to compute budget for (default is None).
+        totim : float
+            Totim to compute budget for (default is None).
 
         Returns
         -------
+        offset : int
 
         """
-        try:
-            if self.ncol >= 2:
-                data = self.cbc.get_data(
-                    text=recname, kstpkper=kstpkper, totim=totim
-                )[0]
-
-                # "FLOW RIGHT FACE"  COMPUTE FLOW BETWEEN ZONES ACROSS COLUMNS.
-                # COMPUTE FLOW ONLY BETWEEN A ZONE AND A HIGHER ZONE -- FLOW FROM
-                # ZONE 4 TO 3 IS THE NEGATIVE OF FLOW FROM 3 TO 4.
-                # 1ST, CALCULATE FLOW BETWEEN NODE J,I,K AND J-1,I,K
-
-                k, i, j = np.where(
-                    self.izone[:, :, 1:] > self.izone[:, :, :-1]
-                )
-
-                # Adjust column values to account for the starting position of "nz"
-                j += 1
-
-                # Define the zone to which flow is going
-                nz = self.izone[k, i, j]
-
-                # Define the zone from which flow is coming
-                jl = j - 1
-                nzl = self.izone[k, i, jl]
-
-                # Get the face flow
-                q = data[k, i, jl]
-
-                # Get indices where flow face values are positive (flow out of higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # Get indices where flow face values are negative (flow into higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzl[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # FLOW BETWEEN NODE J,I,K AND J+1,I,K
-                k, i, j = np.where(
-                    self.izone[:, :, :-1] > self.izone[:, :, 1:]
-                )
-
-                # Define the zone from which flow is coming
-                nz = self.izone[k, i, j]
-
-                # Define the zone to which flow is going
-                jr = j + 1
-                nzr = self.izone[k, i, jr]
-
-                # Get the face flow
-                q = data[k, i, j]
-
-                # Get indices where flow face values are positive (flow out of higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzr[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # Get indices where flow face values are negative (flow into higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
-                k, i, j = k[j > 0], i[j > 0], j[j > 0]
-                jl = j - 1
-                nzl = self.izone[k, i, jl]
-                nz = self.izone[k, i, j]
-                q = data[k, i, jl]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi[tzi != 0]]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                k, i, j = np.where(ich == 1)
-                k, i, j = (
-                    k[j < self.ncol - 1],
-                    i[j < self.ncol - 1],
-                    j[j < self.ncol - 1],
-                )
-                nz = self.izone[k, i, j]
-                jr = j + 1
-                nzr = self.izone[k, i, jr]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-        except Exception as e:
-            print(e)
-            raise
-        return
+        if kstpkper is not None:
+            return self._budget_offsets[tuple(kstpkper)]
+        return self._budget_offsets[totim]
 
-    def _accumulate_flow_fff(self, recname, ich, kstpkper, totim):
+    def _build_face_connectivity(self):
         """
-
-        Parameters
-        ----------
-        recname
-        ich
-        kstpkper
-        totim
+        Build the cells on either side of every face in the row, column and
+        layer directions, and the zones of those cells.  The zone array does
+        not change between time steps, so this is only done once.
 
         Returns
         -------
-
-        """
-        try:
-            if self.nrow >= 2:
-                data = self.cbc.get_data(
-                    text=recname, kstpkper=kstpkper, totim=totim
-                )[0]
-
-                # "FLOW FRONT FACE"
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I-1,K
-                k, i, j = np.where(
-                    self.izone[:, 1:, :] < self.izone[:, :-1, :]
-                )
-                i += 1
-                ia = i - 1
-                nza = self.izone[k, ia, j]
-                nz = self.izone[k, i, j]
-                q = data[k, ia, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nza[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I+1,K.
-                k, i, j = np.where(
-                    self.izone[:, :-1, :] < self.izone[:, 1:, :]
-                )
-                nz = self.izone[k, i, j]
-                ib = i + 1
-                nzb = self.izone[k, ib, j]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzb[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
-                k, i, j = k[i > 0], i[i > 0], j[i > 0]
-                ia = i - 1
-                nza = self.izone[k, ia, j]
-                nz = self.izone[k, i, j]
-                q = data[k, ia, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                k, i, j = np.where(ich == 1)
-                k, i, j = (
-                    k[i < self.nrow - 1],
-                    i[i < self.nrow - 1],
-                    j[i < self.nrow - 1],
-                )
-                nz = self.izone[k, i, j]
-                ib = i + 1
-                nzb = self.izone[k, ib, j]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-        except Exception as e:
-            print(e)
-            raise
-        return
-
-    def _accumulate_flow_flf(self, recname, ich, kstpkper, totim):
-        """
+        faces : dict
+            Dictionary with the axis of each direction as the key.  Each
+            value is a dictionary with the flat node numbers of the cells
+            before (node_a) and after (node_b) each face, the zone index of
+            those cells (zone_a, zone_b) and a boolean array that is True
+            where the zones differ (zonal).
+
+        """
+        nodes = np.arange(self.izone.size).reshape(self.cbc_shape)
+        faces = {}
+        for axis in range(3):
+            before = [slice(None)] * 3
+            after = [slice(None)] * 3
+            before[axis] = slice(None, -1)
+            after[axis] = slice(1, None)
+            node_a = nodes[tuple(before)].ravel()
+            node_b = nodes[tuple(after)].ravel()
+            zone_a = self._izone_index[node_a]
+            zone_b = self._izone_index[node_b]
+            faces[axis] = {
+                "node_a": node_a,
+                "node_b": node_b,
+                "zone_a": zone_a,
+                "zone_b": zone_b,
+                "zonal": zone_a != zone_b,
+            }
+        return faces
+
+    def _accumulate_face_flow(self, recname, axis, ich, kstpkper, totim):
+        """
+        Accumulate the flow across the faces of one direction between zones
+        and to and from constant-head cells.
 
         Parameters
         ----------
-        recname
-        ich
-        kstpkper
-        totim
+        recname : str
+            Name of the face flow record, for example "FLOW RIGHT FACE".
+        axis : int
+            Axis of the model grid the faces are perpendicular to (0 for
+            FLOW LOWER FACE, 1 for FLOW FRONT FACE and 2 for FLOW RIGHT
+            FACE).
+        ich : ndarray
+            Array that is 1 for constant-head cells.
+        kstpkper : tuple
+            Tuple of kstp and kper to compute budget for (default is None).
+        totim : float
+            Totim to compute budget for (default is None).
 
         Returns
         -------
+        None
 
         """
-        try:
-            if self.nlay >= 2:
-                data = self.cbc.get_data(
-                    text=recname, kstpkper=kstpkper, totim=totim
-                )[0]
-
-                # "FLOW LOWER FACE"
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K-1
-                k, i, j = np.where(
-                    self.izone[1:, :, :] < self.izone[:-1, :, :]
-                )
-                k += 1
-                ka = k - 1
-                nza = self.izone[ka, i, j]
-                nz = self.izone[k, i, j]
-                q = data[ka, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nza[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K+1
-                k, i, j = np.where(
-                    self.izone[:-1, :, :] < self.izone[1:, :, :]
-                )
-                nz = self.izone[k, i, j]
-                kb = k + 1
-                nzb = self.izone[kb, i, j]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzb[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
-                k, i, j = k[k > 0], i[k > 0], j[k > 0]
-                ka = k - 1
-                nza = self.izone[ka, i, j]
-                nz = self.izone[k, i, j]
-                q = data[ka, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
+        faces = self._faces[axis]
+        if len(faces["node_a"]) == 0:
+            return
 
-                k, i, j = np.where(ich == 1)
-                k, i, j = (
-                    k[k < self.nlay - 1],
-                    i[k < self.nlay - 1],
-                    j[k < self.nlay - 1],
-                )
-                nz = self.izone[k, i, j]
-                kb = k + 1
-                nzb = self.izone[kb, i, j]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
+        data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)[
+            0
+        ]
 
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
+        # face flows are positive from the cell before the face (node_a)
+        # to the cell after the face (node_b)
+        q = np.ma.filled(data, 0.0).ravel()[faces["node_a"]]
+        ich = ich.ravel()
+        ich_a = ich[faces["node_a"]]
+        ich_b = ich[faces["node_b"]]
+        nzones = len(self.allzones)
+
+        # FLOW BETWEEN ZONES.  DON'T INCLUDE CH TO CH FLOW (CAN OCCUR IF
+        # CHTOCH OPTION IS USED).  SUM THE FLOW FOR EACH (FROM ZONE, TO
+        # ZONE) PAIR.
+        idx = faces["zonal"] & ((ich_a != 1) | (ich_b != 1)) & (q != 0)
+        qz = q[idx]
+        zone_a = faces["zone_a"][idx]
+        zone_b = faces["zone_b"][idx]
+        fz = np.where(qz > 0, zone_a, zone_b)
+        tz = np.where(qz > 0, zone_b, zone_a)
+        code = fz * nzones + tz
+        count = np.bincount(code, minlength=nzones * nzones)
+        flux = np.bincount(code, weights=np.abs(qz), minlength=nzones * nzones)
+        code = np.nonzero(count)[0]
+        self._update_budget_fromfaceflow(
+            self.allzones[code // nzones],
+            self.allzones[code % nzones],
+            flux[code],
+            kstpkper,
+            totim,
+        )
 
-        except Exception as e:
-            print(e)
-            raise
+        # CALCULATE FLOW TO AND FROM CONSTANT-HEAD CELLS ACROSS FACES WITH
+        # A CONSTANT-HEAD CELL ON ONE SIDE.  THE FLOW IS ASSIGNED TO THE
+        # ZONE OF THE CONSTANT-HEAD CELL.
+        idx = (ich_a != ich_b) & (q != 0)
+        if not idx.any():
+            return
+        qc = q[idx]
+        ch_a = ich_a[idx] == 1
+        zc = np.where(ch_a, faces["zone_a"][idx], faces["zone_b"][idx])
+        into_ch = np.where(ch_a, qc < 0, qc > 0)
+        for rowname, sel in (
+            ("TO_CONSTANT_HEAD", into_ch),
+            ("FROM_CONSTANT_HEAD", ~into_ch),
+        ):
+            count = np.bincount(zc[sel], minlength=nzones)
+            flux = np.bincount(
+                zc[sel], weights=np.abs(qc[sel]), minlength=nzones
+            )
+            iz = np.nonzero(count)[0]
+            fz = [rowname] * len(iz)
+            tz = [self._zonenamedict[z] for z in self.allzones[iz]]
+            self._update_budget_fromssst(fz, tz, flux[iz], kstpkper, totim)
         return
 
     def _accumulate_flow_ssst(self, recname, kstpkper, totim):
@@ -1011,109 +833,67 @@ class ZoneBudget:
         else:
             data = data[0]
 
+        nzones = len(self.allzones)
         if imeth == 2 or imeth == 5:
             # LIST
-            qin = np.ma.zeros(
-                (self.nlay * self.nrow * self.ncol), self.float_type
-            )
-            qout = np.ma.zeros(
-                (self.nlay * self.nrow * self.ncol), self.float_type
-            )
-            for [node, q] in zip(data["node"], data["q"]):
-                idx = node - 1
-                if q > 0:
-                    qin.data[idx] += q
-                elif q < 0:
-                    qout.data[idx] += q
-            qin = np.ma.reshape(qin, (self.nlay, self.nrow, self.ncol))
-            qout = np.ma.reshape(qout, (self.nlay, self.nrow, self.ncol))
-        elif imeth == 0 or imeth == 1:
-            # FULL 3-D ARRAY
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            qin[data > 0] = data[data > 0]
-            qout[data < 0] = data[data < 0]
-        elif imeth == 3:
-            # 1-LAYER ARRAY WITH LAYER INDICATOR ARRAY
-            rlay, rdata = data[0], data[1]
-            data = np.ma.zeros(self.cbc_shape, self.float_type)
-            for (r, c), l in np.ndenumerate(rlay):
-                data[l - 1, r, c] = rdata[r, c]
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            qin[data > 0] = data[data > 0]
-            qout[data < 0] = data[data < 0]
-        elif imeth == 4:
-            # 1-LAYER ARRAY THAT DEFINES LAYER 1
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            r, c = np.where(data > 0)
-            qin[0, r, c] = data[r, c]
-            r, c = np.where(data < 0)
-            qout[0, r, c] = data[r, c]
+            izone = self._izone_index[data["node"] - 1]
+            q = np.asarray(data["q"])
         else:
-            # Should not happen
-            raise Exception(
-                f'Unrecognized "imeth" for {recname} record: {imeth}'
-            )
+            if imeth == 0 or imeth == 1:
+                # FULL 3-D ARRAY
+                q = np.ma.filled(data, 0.0)
+            elif imeth == 3:
+                # 1-LAYER ARRAY WITH LAYER INDICATOR ARRAY
+                rlay, rdata = data[0], data[1]
+                r, c = np.indices(rlay.shape)
+                q = np.zeros(self.cbc_shape, self.float_type)
+                q[np.asarray(rlay) - 1, r, c] = np.ma.filled(rdata, 0.0)
+            elif imeth == 4:
+                # 1-LAYER ARRAY THAT DEFINES LAYER 1
+                q = np.zeros(self.cbc_shape, self.float_type)
+                q[0] = np.ma.filled(data, 0.0)
+            else:
+                # Should not happen
+                raise Exception(
+                    f'Unrecognized "imeth" for {recname} record: {imeth}'
+                )
+            izone = self._izone_index
+            q = q.ravel()
+
+        # Sum the inflows and outflows by zone
+        qin = np.bincount(
+            izone, weights=np.where(q > 0, q, 0.0), minlength=nzones
+        )
+        qout = np.bincount(
+            izone, weights=np.where(q < 0, q, 0.0), minlength=nzones
+        )
+        iz = np.nonzero(self.allzones != 0)[0]
+        tz = np.array([self._zonenamedict[z] for z in self.allzones[iz]])
 
         # Inflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qin[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.0
-                fz.append("FROM_" + "_".join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+        fz = np.array(["FROM_" + "_".join(recname.split())] * len(tz))
+        self._update_budget_fromssst(fz, tz, np.abs(qin[iz]), kstpkper, totim)
 
         # Outflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qout[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.0
-                fz.append("TO_" + "_".join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+        fz = np.array(["TO_" + "_".join(recname.split())] * len(tz))
+        self._update_budget_fromssst(fz, tz, np.abs(qout[iz]), kstpkper, totim)
 
     def _compute_mass_balance(self, kstpkper, totim):
         # Returns a record array with total inflow, total outflow,
         # and percent error summed by column.
         skipcols = ["time_step", "stress_period", "totim", "name"]
 
+        # Records of the time step
+        offset = self._get_budget_offset(kstpkper, totim)
+        budget = self._budget[offset : offset + len(self._record_index)]
+        zonenames = list(self._zonenamedict.values())
+
         # Compute inflows
-        recnames = self.get_record_names()
+        recnames = list(self._record_index.keys())
         innames = [n for n in recnames if n.startswith("FROM_")]
         outnames = [n for n in recnames if n.startswith("TO_")]
-        if kstpkper is not None:
-            rowidx = np.where(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.in1d(self._budget["name"], innames)
-            )
-        elif totim is not None:
-            rowidx = np.where(
-                (self._budget["totim"] == totim)
-                & np.in1d(self._budget["name"], innames)
-            )
-        a = _numpyvoid2numeric(
-            self._budget[list(self._zonenamedict.values())][rowidx]
-        )
+        rowidx = np.in1d(budget["name"], innames)
+        a = _numpyvoid2numeric(budget[zonenames][rowidx])
         intot = np.array(a.sum(axis=0))
         tz = np.array(
             list([n for n in self._budget.dtype.names if n not in skipcols])
@@ -1122,20 +902,8 @@ class ZoneBudget:
         self._update_budget_fromssst(fz, tz, intot, kstpkper, totim)
 
         # Compute outflows
-        if kstpkper is not None:
-            rowidx = np.where(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.in1d(self._budget["name"], outnames)
-            )
-        elif totim is not None:
-            rowidx = np.where(
-                (self._budget["totim"] == totim)
-                & np.in1d(self._budget["name"], outnames)
-            )
-        a = _numpyvoid2numeric(
-            self._budget[list(self._zonenamedict.values())][rowidx]
-        )
+        rowidx = np.in1d(budget["name"], outnames)
+        a = _numpyvoid2numeric(budget[zonenames][rowidx])
         outot = np.array(a.sum(axis=0))
         tz = np.array(
             list([n for n in self._budget.dtype.names if n not in skipcols])
@@ -1834,6 +1602,47 @@ class ZoneBudget6:
             exe_name, nam_file, model_ws=self._model_ws, silent=silent
         )
 
+    def compute_budget(self):
+        """
+        Method to compute the zone budget in python instead of running
+        the zonebudget executable.  Flows between zones are computed from
+        the FLOW-JA-FACE records of the budget file and the connectivity
+        (ia and ja) of the binary grid file, and the other budget terms are
+        summed by zone.  The result is returned by get_budget and
+        get_dataframes in the same form as zonebudget output.
+
+        Budget terms are named by their budget text.  If more than one
+        package writes the same budget text, the package name is added in
+        front of the text.
+
+        Returns
+        -------
+            np.recarray
+
+        Examples
+        --------
+        >>> from flopy.utils.zonbud import ZoneBudget6, ZoneFile6
+        >>> zb6 = ZoneBudget6()
+        >>> zon = ZoneFile6(zb6, izone)
+        >>> zb6.bud = "model.cbc"
+        >>> zb6.grb = "model.dis.grb"
+        >>> zb6.compute_budget()
+        >>> df = zb6.get_dataframes()
+
+        """
+        for pkg in ("zon", "bud", "grb"):
+            if getattr(self, f"_{pkg}") is None:
+                raise AssertionError(
+                    f"a {pkg} package is required to compute the budget"
+                )
+
+        aliases = self._zon.aliases
+        self._recarray = _zb_dict_to_recarray(
+            _compute_zb6(self._zon.izone, self._bud, self._grb),
+            aliases=aliases,
+        )
+        return self.get_budget()
+
     def __setattr__(self, key, value):
         if key in ("zon", "bud", "grb", "cbc"):
             self.add_package(key, value)
@@ -2298,6 +2107,165 @@ class ZoneFile6:
         return zon
 
 
+def _sum_by_zone(zone, q, nzones):
+    """
+    Sum the positive and negative values of q by zone index, skipping
+    zone 0.
+
+    """
+    qin = np.bincount(zone, weights=np.where(q > 0, q, 0.0), minlength=nzones)
+    qout = np.bincount(
+        zone, weights=np.where(q < 0, -q, 0.0), minlength=nzones
+    )
+    return qin[1:], qout[1:]
+
+
+def _compute_zb6(izone, cbc, grb):
+    """
+    Compute a MODFLOW 6 zone budget from a budget file and a binary grid
+    file.
+
+    Parameters
+    ----------
+    izone : np.ndarray
+        zone number of each cell of the model grid
+    cbc : CellBudgetFile
+        MODFLOW 6 budget file
+    grb : MfGrdFile
+        MODFLOW 6 binary grid file
+
+    Returns
+    -------
+    data : dict
+        dictionary of lists in the same form as the data read from
+        zonebudget 6 csv output by _read_zb_csv2
+
+    """
+    izone = np.asarray(izone).ravel()
+    zones = [int(z) for z in np.unique(izone) if z != 0]
+    # columns of the flow between zones include zone 0
+    allzones = np.array([0] + zones)
+    nzones = len(allzones)
+    zone_index = np.searchsorted(allzones, izone)
+
+    # zone index of the cells on both sides of each connection, reduced
+    # to connections between different zones with a budget zone on the
+    # first side
+    ia = grb.ia
+    ja = grb.ja
+    nodes = len(ia) - 1
+    if nodes == izone.size:
+        node_zone = zone_index
+    elif grb.idomain is not None:
+        node_zone = zone_index[np.nonzero(grb.idomain.ravel() > 0)[0]]
+    else:
+        raise AssertionError(
+            f"zone array size ({izone.size}) does not match the number "
+            f"of cells in the binary grid file ({nodes})"
+        )
+    zn = np.repeat(node_zone, np.diff(ia))
+    zm = node_zone[ja]
+    iconn = np.nonzero((zn != zm) & (zn != 0))[0]
+    pair = zn[iconn] * nzones + zm[iconn]
+
+    recordarray = cbc.recordarray
+    timesteps = []
+    terms = []
+    budgets = []
+    for kstp, kper in cbc.get_kstpkper():
+        idx = np.nonzero(
+            (recordarray["kstp"] == kstp + 1)
+            & (recordarray["kper"] == kper + 1)
+        )[0]
+        texts = [recordarray["text"][i].decode().strip() for i in idx]
+        budget = {}
+        flowja = None
+        for i, text in zip(idx, texts):
+            if text.startswith("DATA-"):
+                continue
+            data = cbc.get_record(i)
+            if text == "FLOW-JA-FACE":
+                flowja = np.asarray(data).ravel()
+                continue
+            if texts.count(text) > 1:
+                pname = recordarray["paknam2"][i].decode().strip()
+                text = f"{pname}-{text}"
+            if data.dtype.names is not None:
+                # list of node numbers and flows
+                q = np.asarray(data["q"], dtype=float)
+                zone = zone_index[np.asarray(data["node"]) - 1]
+            else:
+                q = np.asarray(data, dtype=float).ravel()
+                if q.size == izone.size:
+                    zone = zone_index
+                else:
+                    zone = node_zone
+            qin, qout = _sum_by_zone(zone, q, nzones)
+            if text in budget:
+                qin += budget[text][0]
+                qout += budget[text][1]
+            budget[text] = (qin, qout)
+            if text not in terms:
+                terms.append(text)
+
+        # FLOW-JA-FACE is positive for flow into the first cell of a
+        # connection
+        qfrom = np.zeros((nzones, nzones))
+        qto = np.zeros((nzones, nzones))
+        if flowja is not None:
+            q = flowja[iconn]
+            qfrom.flat[:] = np.bincount(
+                pair, weights=np.where(q > 0, q, 0.0), minlength=nzones**2
+            )
+            qto.flat[:] = np.bincount(
+                pair, weights=np.where(q < 0, -q, 0.0), minlength=nzones**2
+            )
+        budgets.append((budget, qfrom[1:], qto[1:]))
+        timesteps.append((recordarray["totim"][idx[0]], kstp, kper))
+
+    # assemble the rows of each zone for every time step
+    data = {"TOTIM": [], "KSTP": [], "KPER": [], "ZONE": []}
+    for suffix in ("IN", "OUT"):
+        for text in terms:
+            data["_".join(f"{text}-{suffix}".replace("-", "_").split())] = []
+    for prefix in ("FROM", "TO"):
+        for z in allzones:
+            data[f"{prefix}_ZONE_{z}"] = []
+    nbud = len(zones)
+    for (totim, kstp, kper), (budget, qfrom, qto) in zip(timesteps, budgets):
+        data["TOTIM"] += [float(totim)] * nbud
+        data["KSTP"] += [kstp] * nbud
+        data["KPER"] += [kper] * nbud
+        data["ZONE"] += zones
+        for isuffix, suffix in enumerate(("IN", "OUT")):
+            for text in terms:
+                name = "_".join(f"{text}-{suffix}".replace("-", "_").split())
+                if text in budget:
+                    data[name] += list(budget[text][isuffix])
+                else:
+                    data[name] += [0.0] * nbud
+        for iz, z in enumerate(allzones):
+            data[f"FROM_ZONE_{z}"] += list(qfrom[:, iz])
+            data[f"TO_ZONE_{z}"] += list(qto[:, iz])
+    return data
+
+
+def _compute_budget_chunk(
+    filename, precision, index, z, kstpkper, totim, aliases
+):
+    """
+    Compute the budget of some of the time steps of a cell budget file.
+    This is a module level function so that it can be used with a process
+    pool.
+
+    """
+    from .binaryfile import CellBudgetFile
+
+    with CellBudgetFile(filename, precision=precision, index_from=index) as f:
+        zb = ZoneBudget(f, z, kstpkper=kstpkper, totim=totim, aliases=aliases)
+    return zb._budget
+
+
 def _numpyvoid2numeric(a):
     # The budget record array has multiple dtypes and a slice returns
     # the flexible-type numpy.void which must be converted to a numeric
@@ -2307,21 +2275,37 @@ def _numpyvoid2numeric(a):
 
 
 def sum_flux_tuples(fromzones, tozones, fluxes):
-    tup = zip(fromzones, tozones, fluxes)
-    sorted_tups = sort_tuple(tup)
-
-    # Group the sorted tuples by (from zone, to zone)
-    # itertools.groupby() returns the index (from zone, to zone) and
-    # a list of the tuples with that index
-    from_zones = []
-    to_zones = []
-    fluxes = []
-    for (fz, tz), ftup in groupby(sorted_tups, lambda tup: tup[:2]):
-        f = np.sum([tup[-1] for tup in list(ftup)])
-        from_zones.append(fz)
-        to_zones.append(tz)
-        fluxes.append(f)
-    return np.array(from_zones), np.array(to_zones), np.array(fluxes)
+    """Sum fluxes by (from zone, to zone) pair
+
+    fromzones : array_like
+        zone each flux is from
+    tozones : array_like
+        zone each flux is to
+    fluxes : array_like
+        fluxes to sum
+
+    Returns
+    -------
+    from_zones, to_zones, fluxes : tuple of np.ndarray
+        the zone pairs sorted by from zone and to zone, and the sum of the
+        fluxes for each pair
+
+    """
+    fromzones = np.asarray(fromzones)
+    tozones = np.asarray(tozones)
+    n = len(fromzones)
+    if n == 0:
+        return np.array([]), np.array([]), np.array([])
+
+    # code each (from zone, to zone) pair as a single integer
+    zones, izone = np.unique(
+        np.concatenate((fromzones, tozones)), return_inverse=True
+    )
+    nzones = len(zones)
+    code = izone[:n] * nzones + izone[n:]
+    code, icode = np.unique(code, return_inverse=True)
+    fluxes = np.bincount(icode, weights=fluxes, minlength=len(code))
+    return zones[code // nzones], zones[code % nzones], fluxes
 
 
 def sort_tuple(tup, n=2):